@@ -0,0 +1,61 @@
+"""
+Session archive benchmark: build time, open time and zoom latency.
+
+Writes a synthetic session of the given length (raw int16 PCM, about 318 MB
+per hour at 44.1 kHz), builds its pyramid, then times opening it and zooming
+to random ranges from the whole session down to a few milliseconds.
+
+    python -m benchmarks.bench_archive --hours 1
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from taipy_audio.archive import ArchiveWriter, SessionArchive
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--hours", type=float, default=1.0)
+    parser.add_argument("--rate", type=int, default=44100)
+    parser.add_argument("--points", type=int, default=2000)
+    parser.add_argument("--zooms", type=int, default=200)
+    parser.add_argument("--dir", help="where to write the session (default: a temporary directory)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(dir=args.dir) as tmp:
+        path = Path(tmp) / "bench.pcm"
+        rng = np.random.default_rng(0)
+        block = (rng.standard_normal(args.rate * 60) * 3000).astype(np.int16)
+        total = int(args.hours * 3600 * args.rate)
+        writer = ArchiveWriter(path, args.rate)
+        for start in range(0, total, len(block)):
+            writer.write(block[:total - start])
+        started = time.perf_counter()
+        writer.close()
+        print(f"🏗️  Pyramid for {args.hours:g} h built in {time.perf_counter() - started:.2f}s")
+
+        started = time.perf_counter()
+        session = SessionArchive(path)
+        print(f"📂 Opened in {(time.perf_counter() - started) * 1000:.2f} ms "
+              f"({len(session.sizes)} levels)")
+
+        spans = np.geomspace(0.005, session.duration, args.zooms)
+        starts = rng.uniform(0, 1, args.zooms) * (session.duration - spans)
+        times = []
+        for start, span in zip(starts, spans):
+            started = time.perf_counter()
+            session.zoom(start, start + span, args.points)
+            times.append(time.perf_counter() - started)
+        times = np.array(times) * 1000
+        print(f"🔍 {args.zooms} zooms from 5 ms to {session.duration:.0f}s: "
+              f"median {np.median(times):.2f} ms, max {times.max():.2f} ms")
+        del session
+
+
+if __name__ == "__main__":
+    main()
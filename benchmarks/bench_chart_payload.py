@@ -0,0 +1,60 @@
+"""
+Before/after microbenchmark for building the chart payloads of one refresh.
+
+"before" is what update_charts() used to do: two new pandas DataFrames with
+fresh range() x-axes. "after" writes into preallocated ChartData buffers with
+out= operations and publishes new payload dicts. The FFT itself is computed
+once up front so only the payload path is timed.
+
+    python -m benchmarks.bench_chart_payload
+"""
+
+import argparse
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from taipy_audio.chart_data import chart_pair
+
+RATE = 44100
+
+
+def before(samples, fft_data, chunk):
+    latest_data = samples / 32768.0
+    wave_df = pd.DataFrame({'x': range(chunk), 'y': latest_data})
+    spec_df = pd.DataFrame({'x': range(len(fft_data)), 'y': fft_data})
+    return wave_df, spec_df
+
+
+def after(samples, fft_data, wave_chart, spec_chart):
+    np.multiply(samples, 1 / 32768.0, out=wave_chart.back())
+    np.copyto(spec_chart.back(), fft_data)
+    return wave_chart.publish(), spec_chart.publish()
+
+
+def bench(chunk, number):
+    rng = np.random.default_rng(0)
+    samples = rng.integers(-32768, 32767, chunk).astype(np.int16)
+    fft_data = np.abs(np.fft.rfft(samples / 32768.0))
+    wave_chart, spec_chart = chart_pair(chunk, RATE)
+
+    t_before = min(timeit.repeat(lambda: before(samples, fft_data, chunk), number=number, repeat=5))
+    t_after = min(timeit.repeat(lambda: after(samples, fft_data, wave_chart, spec_chart), number=number, repeat=5))
+    us_before = t_before / number * 1e6
+    us_after = t_after / number * 1e6
+    print(f"CHUNK={chunk:5d}  before: {us_before:8.1f} µs/frame  after: {us_after:6.1f} µs/frame  "
+          f"({us_before / us_after:.0f}x faster)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--chunks", type=int, nargs="+", default=[512, 4096])
+    parser.add_argument("--number", type=int, default=2000, help="frames per timing run")
+    args = parser.parse_args()
+    for chunk in args.chunks:
+        bench(chunk, args.number)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,362 @@
+"""
+Load test: the real dashboard pushing to N simulated browsers.
+
+Starts the dashboard (``taipy_audio.gui``) in a child process on a paced
+synthetic sine - silence gating off, frames stamped with their capture time -
+and connects N Socket.IO clients to it over localhost. Each client does what
+a browser does after loading the page: gets a client id and module context,
+loads the page, clicks Start Recording, and fetches a chart's data whenever
+the server says it changed. No browser is involved.
+
+For each client count it reports, per client, the delivered FPS (frames
+whose ``frame_time`` stamp arrived), the update latency from capture to the
+waveform and spectrum data arriving, and the bytes/s received; and for the
+server process its CPU use and resident memory (psutil if installed, else
+/proc). Every client count gets a fresh server.
+
+    python -m benchmarks.bench_load                                 # 1, 10 and 50 clients
+    python -m benchmarks.bench_load --clients 1 50 200 --seconds 20
+    python -m benchmarks.bench_load --save load.json                # record a baseline
+    python -m benchmarks.bench_load --compare load.json             # exit 1 on a regression
+
+Clients are spread over ``--client-procs`` processes so decoding the
+messages does not throttle the measurement; a harness process at 100% CPU
+means the numbers are the harness's limit, not the server's. Latency
+compares ``time.monotonic()`` across processes, which is only valid on the
+same host. ``--compare`` fails when a client count's mean FPS dropped or its
+p95 latency rose by more than ``--threshold`` (default 10%).
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+import numpy as np
+
+# Charts whose data arrival counts as an update (the heatmap is sent on its own schedule)
+LIVE_CHARTS = ("wave_df", "spec_df")
+
+
+class SimClient:
+    """One simulated browser session on the dashboard"""
+
+    def __init__(self, url, timeout=30.0):
+        import socketio
+
+        self.url = url
+        self.timeout = timeout
+        self.sio = socketio.Client(reconnection=False)
+        self.sio.on("message", self._on_message)
+        self.client_id = None
+        self.context = None
+        self.measuring = False
+        self.frames = 0
+        self.bytes = 0
+        self.latencies = []
+        self._frame_time = None
+        self._fetching = {}
+        self._replies = {}
+        self._replied = threading.Condition()
+
+    def _send(self, message):
+        self.sio.emit("message", message)
+
+    def _wait(self, kind):
+        with self._replied:
+            if not self._replied.wait_for(lambda: kind in self._replies, self.timeout):
+                raise TimeoutError(f"No {kind} reply from {self.url}")
+            return self._replies[kind]
+
+    def connect(self):
+        import requests
+
+        self.sio.connect(self.url, transports=["websocket"], wait_timeout=self.timeout)
+        self._send({"type": "ID", "payload": ""})
+        self.client_id = self._wait("ID")["id"]
+        self._send({"type": "GMC", "payload": {"path": "/"}, "client_id": self.client_id})
+        self.context = self._wait("GMC")["payload"]["context"]
+        # Loading the page binds its variables to this session
+        page = requests.get(f"{self.url}/taipy-jsx/TaiPy_root_page",
+                            params={"client_id": self.client_id}, timeout=self.timeout)
+        page.raise_for_status()
+        self._send({"type": "A", "name": "Button.0", "payload": {"action": "start_recording"},
+                    "client_id": self.client_id, "module_context": self.context})
+
+    def close(self):
+        self.sio.disconnect()
+
+    def _on_message(self, message):
+        kind = message.get("type")
+        if kind in ("ID", "GMC"):
+            with self._replied:
+                self._replies[kind] = message
+                self._replied.notify_all()
+            return
+        now = time.monotonic()
+        if self.measuring:
+            self.bytes += len(json.dumps(message))
+        parts = message["payload"] if kind == "MS" else [message]
+        updates = [u for part in parts if part.get("type") == "MU" for u in part.get("payload", ())]
+        # The frame stamp first: the charts it refreshes come earlier in the same message
+        for update in updates:
+            value = update["payload"].get("value")
+            if "frame_time" in update["name"] and value is not None:
+                self._frame_time = value
+                if self.measuring:
+                    self.frames += 1
+        for update in updates:
+            name = update["name"]
+            if not name.startswith("_TpD_"):
+                continue
+            value = update["payload"].get("value")
+            if isinstance(value, dict) and value.get("__taipy_refresh"):
+                # Like the browser: fetch the chart's data, one request at a time per chart
+                if name not in self._fetching:
+                    self._fetching[name] = self._frame_time
+                    self._send({"type": "DU", "name": name, "payload": {"alldata": True},
+                                "client_id": self.client_id, "module_context": self.context})
+            elif name in self._fetching:
+                stamp = self._fetching.pop(name)
+                if self.measuring and stamp is not None and any(c in name for c in LIVE_CHARTS):
+                    self.latencies.append(now - stamp)
+
+    def result(self, seconds):
+        return {"fps": self.frames / seconds, "bytes_per_s": self.bytes / seconds,
+                "latencies_ms": [round(x * 1000, 2) for x in self.latencies]}
+
+
+def run_clients(url, count, connected, measure, stop, results):
+    """Client process - connect `count` clients, measure between the two events, report"""
+    clients, failed = [], 0
+    for _ in range(count):
+        client = SimClient(url)
+        try:
+            client.connect()
+            clients.append(client)
+        except Exception as e:
+            print(f"⚠️  Client failed to connect: {type(e).__name__}: {e}", file=sys.stderr)
+            failed += 1
+    connected.put(failed)
+    measure.wait()
+    started = time.monotonic()
+    for client in clients:
+        client.measuring = True
+    stop.wait()
+    seconds = time.monotonic() - started
+    for client in clients:
+        client.measuring = False
+    results.put({"clients": [client.result(seconds) for client in clients], "failed": failed})
+    for client in clients:
+        client.close()
+
+
+class ProcessStats:
+    """CPU seconds and resident memory of a process - psutil if installed, else /proc"""
+
+    def __init__(self, pid):
+        self.pid = pid
+        try:
+            import psutil
+            self._process = psutil.Process(pid)
+        except ImportError:
+            self._process = None
+
+    def cpu_seconds(self):
+        if self._process is not None:
+            times = self._process.cpu_times()
+            return times.user + times.system
+        try:
+            with open(f"/proc/{self.pid}/stat") as f:
+                # Fields after the parenthesised command name; utime and stime are the 12th and 13th
+                fields = f.read().rsplit(")", 1)[1].split()
+            return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+        except OSError:
+            return None
+
+    def rss_mib(self):
+        if self._process is not None:
+            return self._process.memory_info().rss / 2**20
+        try:
+            with open(f"/proc/{self.pid}/status") as f:
+                for line in f:
+                    if line.startswith("VmRSS:"):
+                        return int(line.split()[1]) / 1024
+        except OSError:
+            pass
+        return None
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def wait_for_port(port, process, timeout):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Dashboard exited with status {process.returncode}")
+        with socket.socket() as s:
+            if s.connect_ex(("127.0.0.1", port)) == 0:
+                return
+        time.sleep(0.2)
+    raise RuntimeError(f"Dashboard did not listen on port {port} within {timeout:.0f} s")
+
+
+def serve(port, fps, chunk):
+    """Child process: the dashboard on a synthetic source, set up for measuring"""
+    from taipy_audio import gui
+    from taipy_audio.audio_sources import SyntheticSource
+
+    gui.GATE_SILENCE = False  # a steady sine never counts as voice
+    gui.STAMP_FRAMES = True
+    # A child without a terminal - Werkzeug has to be allowed explicitly for this local measurement
+    gui.main(SyntheticSource("sine", chunk=chunk), port=port, fps=fps, allow_unsafe_werkzeug=True)
+
+
+def load(count, args):
+    port = free_port()
+    command = [sys.executable, "-m", "benchmarks.bench_load", "--serve", str(port),
+               "--fps", str(args.fps), "--chunk", str(args.chunk)]
+    server = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    context = multiprocessing.get_context("spawn")
+    workers = []
+    try:
+        wait_for_port(port, server, args.startup_timeout)
+        url = f"http://127.0.0.1:{port}"
+        procs = min(count, args.client_procs or max(1, min(os.cpu_count() or 1, count // 20)))
+        connected, results = context.Queue(), context.Queue()
+        measure, stop = context.Event(), context.Event()
+        for i in range(procs):
+            share = count // procs + (i < count % procs)
+            worker = context.Process(target=run_clients, args=(url, share, connected, measure, stop, results),
+                                     daemon=True)
+            worker.start()
+            workers.append(worker)
+        for _ in workers:
+            connected.get(timeout=args.startup_timeout + 2 * count)
+        time.sleep(args.warmup)
+
+        stats = ProcessStats(server.pid)
+        cpu_before, started = stats.cpu_seconds(), time.monotonic()
+        rss = []
+        measure.set()
+        while time.monotonic() - started < args.seconds:
+            time.sleep(min(1.0, args.seconds))
+            rss.append(stats.rss_mib())
+        cpu_after, elapsed = stats.cpu_seconds(), time.monotonic() - started
+        stop.set()
+        replies = [results.get(timeout=60) for _ in workers]
+    finally:
+        for worker in workers:
+            worker.join(10)
+            if worker.is_alive():
+                worker.terminate()
+        server.terminate()
+        try:
+            server.wait(10)
+        except subprocess.TimeoutExpired:
+            server.kill()
+
+    per_client = [c for reply in replies for c in reply["clients"]]
+    fps = [c["fps"] for c in per_client] or [0.0]
+    latencies = [x for c in per_client for x in c["latencies_ms"]]
+    rss = [x for x in rss if x is not None]
+    return {
+        "connected": len(per_client),
+        "failed": sum(reply["failed"] for reply in replies),
+        "fps_mean": float(np.mean(fps)),
+        "fps_min": float(np.min(fps)),
+        "latency_p50_ms": float(np.percentile(latencies, 50)) if latencies else None,
+        "latency_p95_ms": float(np.percentile(latencies, 95)) if latencies else None,
+        "kib_per_s": float(np.mean([c["bytes_per_s"] for c in per_client] or [0.0])) / 1024,
+        "server_cpu_percent": (cpu_after - cpu_before) / elapsed * 100 if cpu_before is not None else None,
+        "server_rss_mib": max(rss) if rss else None,
+        "per_client": [{"fps": round(c["fps"], 2), "kib_per_s": round(c["bytes_per_s"] / 1024, 1),
+                        "latency_p95_ms": float(np.percentile(c["latencies_ms"], 95)) if c["latencies_ms"] else None}
+                       for c in per_client],
+    }
+
+
+def compare(results, baseline, threshold):
+    """Client counts whose mean FPS fell or p95 latency rose more than `threshold`"""
+    failures = []
+    for key, result in results.items():
+        if key not in baseline:
+            continue
+        before = baseline[key]
+        if result["fps_mean"] < before["fps_mean"] * (1 - threshold):
+            failures.append(f"{key} clients: {result['fps_mean']:.1f} FPS, baseline {before['fps_mean']:.1f}")
+        if result["latency_p95_ms"] is not None and before["latency_p95_ms"] is not None \
+                and result["latency_p95_ms"] > before["latency_p95_ms"] * (1 + threshold):
+            failures.append(f"{key} clients: p95 {result['latency_p95_ms']:.0f} ms, "
+                            f"baseline {before['latency_p95_ms']:.0f} ms")
+    return failures
+
+
+def _number(value, spec):
+    return "-" if value is None else format(value, spec)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--clients", type=int, nargs="+", default=[1, 10, 50], help="client counts (1-200)")
+    parser.add_argument("--seconds", type=float, default=10.0, help="measured seconds per client count")
+    parser.add_argument("--warmup", type=float, default=3.0, help="seconds after connecting before measuring")
+    parser.add_argument("--fps", type=int, default=30, help="dashboard push rate")
+    parser.add_argument("--chunk", type=int, default=512, help="synthetic source frames per buffer")
+    parser.add_argument("--client-procs", type=int, default=0, help="client processes (default: 1 per 20 clients)")
+    parser.add_argument("--startup-timeout", type=float, default=60.0)
+    parser.add_argument("--save", metavar="PATH", help="write the results as a baseline")
+    parser.add_argument("--compare", metavar="PATH", help="fail if FPS or latency regressed against this baseline")
+    parser.add_argument("--threshold", type=float, default=0.10, help="allowed change (default: 0.10)")
+    parser.add_argument("--serve", type=int, metavar="PORT", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(args.serve, args.fps, args.chunk)
+        return
+    if any(not 1 <= count <= 200 for count in args.clients):
+        parser.error("client counts must be between 1 and 200")
+
+    print(f"🧪 Dashboard at {args.fps} FPS, {args.warmup:.0f} s warmup + {args.seconds:.0f} s per client count")
+    print(f"{'clients':>7} {'FPS mean':>9} {'FPS min':>8} {'p50 ms':>7} {'p95 ms':>7} "
+          f"{'KiB/s':>8} {'server CPU':>11} {'RSS MiB':>8}")
+    results = {}
+    for count in args.clients:
+        result = load(count, args)
+        results[str(count)] = result
+        failed = f"  ⚠️ {result['failed']} failed to connect" if result["failed"] else ""
+        print(f"{count:>7} {result['fps_mean']:>9.1f} {result['fps_min']:>8.1f} "
+              f"{_number(result['latency_p50_ms'], '7.0f')} {_number(result['latency_p95_ms'], '7.0f')} "
+              f"{result['kib_per_s']:>8.0f} {_number(result['server_cpu_percent'], '10.0f')}% "
+              f"{_number(result['server_rss_mib'], '8.0f')}{failed}")
+    print("   (FPS, latency and KiB/s per client; latency is capture to chart data received)")
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump({"fps": args.fps, "results": results}, f, indent=1)
+        print(f"💾 Baseline saved to {args.save}")
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if baseline.get("fps") != args.fps:
+            print(f"⚠️  Baseline was recorded at {baseline.get('fps')} FPS, not {args.fps}")
+        failures = compare(results, baseline["results"], args.threshold)
+        if failures:
+            print(f"❌ Regressed by more than {args.threshold:.0%}:")
+            for line in failures:
+                print(f"   {line}")
+            sys.exit(1)
+        print(f"✅ No client count regressed by more than {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
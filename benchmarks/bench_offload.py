@@ -0,0 +1,83 @@
+"""
+Offload benchmark: heavy analysis in the push thread vs in worker processes.
+
+Runs a paced synthetic capture into a shared-memory ring buffer and a 30 FPS
+tick loop that either computes a long Welch spectrum inline or hands it to an
+AnalyzerPool. Reports how long each tick holds the push thread, how many
+analysis results arrived, and the worst gap between two capture callbacks
+(a real-time capture would overflow once that exceeds the device buffer).
+
+    python -m benchmarks.bench_offload --fft-size 32768 --seconds 8 --workers 2
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from taipy_audio.audio_capture import AudioCapture
+from taipy_audio.audio_sources import SyntheticSource
+from taipy_audio.offload import Analyzer, AnalyzerPool, welch_spectrum
+
+
+def run(args, offload):
+    source = SyntheticSource("pink", chunk=512, seed=0)
+    capture = AudioCapture(source=source, seconds=args.seconds + 2, shared=True)
+    gaps = []
+    last = [None]
+
+    def on_chunk(samples, timestamp=None):
+        now = time.perf_counter()
+        if last[0] is not None:
+            gaps.append(now - last[0])
+        last[0] = now
+        capture.buffer.write(samples, timestamp)
+
+    analyzer = Analyzer("welch", welch_spectrum, window=int(args.seconds * source.rate),
+                        hop=source.rate // args.per_second, size=args.fft_size // 2 + 1,
+                        fft_size=args.fft_size)
+    pool = AnalyzerPool(capture.buffer, source.rate, [analyzer], args.workers) if offload else None
+    out = np.empty(analyzer.size)
+    source.start(on_chunk)
+    time.sleep(args.seconds)  # fill the analysis window first
+    ticks, results, next_run = [], 0, 0
+    deadline = time.monotonic() + args.duration
+    while time.monotonic() < deadline:
+        started = time.perf_counter()
+        count = capture.buffer.count
+        if pool is not None:
+            pool.submit()
+            results += pool.result("welch", out)
+        elif count >= next_run:
+            next_run = count + analyzer.hop
+            out[:] = welch_spectrum(capture.buffer.read(count - analyzer.window, count), source.rate,
+                                    fft_size=args.fft_size)
+            results += 1
+        ticks.append(time.perf_counter() - started)
+        time.sleep(max(0.0, 1 / 30 - ticks[-1]))
+    source.stop()
+    if pool is not None:
+        pool.close()
+
+    ticks = np.array(ticks) * 1000
+    label = f"offloaded ({args.workers} workers)" if offload else "inline"
+    print(f"{label:>22}: tick median {np.median(ticks):6.2f} ms, max {ticks.max():7.2f} ms, "
+          f"{results / args.duration:4.1f} results/s, worst capture gap {max(gaps) * 1000:6.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--fft-size", type=int, default=32768)
+    parser.add_argument("--seconds", type=float, default=8.0, help="analysis window")
+    parser.add_argument("--per-second", type=int, default=4, help="analysis results wanted per second")
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--duration", type=float, default=10.0)
+    args = parser.parse_args()
+    print(f"🧮 Welch spectrum: {args.fft_size}-point FFT over {args.seconds:g} s, "
+          f"{args.per_second}x per second, for {args.duration:g} s")
+    run(args, offload=False)
+    run(args, offload=True)
+
+
+if __name__ == "__main__":
+    main()
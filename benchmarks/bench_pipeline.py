@@ -0,0 +1,198 @@
+"""
+Pipeline benchmark with a saved baseline: capture -> convert -> FFT -> payload -> state.
+
+Drives the real SharedPipeline from an unpaced synthetic source, one chunk per
+frame, for every CHUNK size and channel count asked for: the ring-buffer
+write, ``render()`` and ``_apply()`` into a stand-in State that JSON-encodes
+what was assigned, as Taipy does before sending it. No microphone, browser or
+Taipy server is involved. The spectrogram heatmap is sent on a wall-clock
+schedule rather than per frame, so it is left out.
+
+For each configuration it reports frames/s, µs/frame per stage (from the
+pipeline's own latency histograms) and the memory allocated per frame
+(tracemalloc peak above the frame's starting point, in a second, untimed
+pass - NumPy reports its buffers to tracemalloc).
+
+    python -m benchmarks.bench_pipeline                              # 256..8192 x 1, 2, 4, 8
+    python -m benchmarks.bench_pipeline --chunks 512 --channels 1 2
+    python -m benchmarks.bench_pipeline --save baseline.json         # record a baseline
+    python -m benchmarks.bench_pipeline --compare baseline.json      # exit 1 on a regression
+
+A baseline is only meaningful on the machine that recorded it. ``--compare``
+fails when any configuration's frames/s is more than ``--threshold`` (default
+10%) below the baseline.
+"""
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from taipy_audio.audio_capture import AudioCapture
+from taipy_audio.audio_sources import SyntheticSource
+from taipy_audio.pipeline import DEFAULT_VIEW, SharedPipeline
+
+STAGES = ("write", "convert", "fft", "payload", "assign", "encode")
+
+VIEWS = {
+    # One session on the default view
+    "basic": [{}],
+    # Decimated history, dB scale and exponential averaging as well
+    "full": [{}, {"history": 5, "scale": "db", "average": "exponential"}],
+}
+
+
+def _plain(value):
+    return value.tolist() if isinstance(value, np.ndarray) else str(value)
+
+
+class BenchState:
+    """Stands in for a Taipy State - collects one block's assignments and encodes them on exit"""
+
+    _gui = None
+
+    def __init__(self):
+        self._values = {}
+        self._encode_seconds = 0.0
+        self._encoded_bytes = 0
+
+    def __setattr__(self, name, value):
+        if name.startswith("_"):
+            object.__setattr__(self, name, value)
+        else:
+            self._values[name] = value
+
+    def __enter__(self):
+        self._values = {}
+        return self
+
+    def __exit__(self, *exc):
+        started = time.perf_counter()
+        message = json.dumps(self._values, default=_plain)
+        self._encode_seconds += time.perf_counter() - started
+        self._encoded_bytes += len(message)
+
+    def assign(self, name, value):
+        setattr(self, name, value)
+
+
+def make_pipeline(chunk, channels, views):
+    source = SyntheticSource("white", chunk=chunk, paced=False, seed=0, channels=channels)
+    capture = AudioCapture(source=source, seconds=10.0)
+    pipeline = SharedPipeline(capture, chunk, capture.rate, wave_points=2000)
+    pipeline.gate = False  # white noise would be gated as silence
+    pipeline.spectrogram_fps = 1e-9
+    for i, settings in enumerate(VIEWS[views]):
+        pipeline.views[i] = dict(DEFAULT_VIEW, **settings)
+        pipeline.listeners.add(i)
+    return source, capture, pipeline
+
+
+def prefill(source, capture, pipeline):
+    """Fill the ring buffer so decimators and averages start from steady state"""
+    while capture.buffer.count < capture.buffer.capacity:
+        capture.buffer.write(source.read_chunk(), time.monotonic())
+    pipeline.render()
+
+
+def bench(chunk, channels, frames, views):
+    source, capture, pipeline = make_pipeline(chunk, channels, views)
+    blocks = [source.read_chunk() for _ in range(frames)]
+    prefill(source, capture, pipeline)
+    pipeline.latency.reset()
+    state = BenchState()
+    write = 0.0
+    started = time.perf_counter()
+    for block in blocks:
+        before = time.perf_counter()
+        capture.buffer.write(block, time.monotonic())
+        write += time.perf_counter() - before
+        frame = pipeline.render()
+        pipeline._apply(state, frame)
+    elapsed = time.perf_counter() - started
+
+    histograms = pipeline.latency.histograms
+    per_frame = {stage: histograms[stage].mean * 1e6 for stage in ("convert", "fft", "payload")}
+    per_frame["write"] = write / frames * 1e6
+    # assign includes the encoding done when the State block exits - report them apart
+    per_frame["encode"] = state._encode_seconds / frames * 1e6
+    per_frame["assign"] = histograms["assign"].mean * 1e6 - per_frame["encode"]
+
+    # Second pass under tracemalloc: bytes allocated per frame, at the frame's peak
+    tracemalloc.start()
+    peaks = []
+    for block in blocks[:min(frames, 50)]:
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        capture.buffer.write(block, time.monotonic())
+        pipeline._apply(state, pipeline.render())
+        peaks.append(tracemalloc.get_traced_memory()[1] - base)
+    tracemalloc.stop()
+
+    return {
+        "fps": frames / elapsed,
+        "stages_us": {stage: round(per_frame[stage], 1) for stage in STAGES},
+        "alloc_kib": float(np.median(peaks)) / 1024,
+        "message_kib": state._encoded_bytes / (frames + len(peaks)) / 1024,
+    }
+
+
+def compare(results, baseline, threshold):
+    """Configurations whose frames/s fell more than `threshold` below the baseline"""
+    failures = []
+    for key, result in results.items():
+        if key not in baseline:
+            continue
+        floor = baseline[key]["fps"] * (1 - threshold)
+        if result["fps"] < floor:
+            failures.append(f"{key}: {result['fps']:,.0f} frames/s, baseline {baseline[key]['fps']:,.0f}")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--chunks", type=int, nargs="+", default=[256, 512, 1024, 2048, 4096, 8192])
+    parser.add_argument("--channels", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--frames", type=int, default=300, help="timed frames per configuration")
+    parser.add_argument("--views", default="basic", choices=sorted(VIEWS))
+    parser.add_argument("--save", metavar="PATH", help="write the results as a baseline")
+    parser.add_argument("--compare", metavar="PATH", help="fail if frames/s regressed against this baseline")
+    parser.add_argument("--threshold", type=float, default=0.10, help="allowed frames/s drop (default: 0.10)")
+    args = parser.parse_args()
+
+    print(f"🧪 {args.frames} frames per configuration, {args.views} views")
+    print(f"{'chunk':>6} {'ch':>3} {'frames/s':>10} " + " ".join(f"{s:>8}" for s in STAGES)
+          + f" {'alloc':>9} {'message':>9}")
+    results = {}
+    for chunk in args.chunks:
+        for channels in args.channels:
+            result = bench(chunk, channels, args.frames, args.views)
+            results[f"{chunk}x{channels}"] = result
+            stages = " ".join(f"{result['stages_us'][s]:8.1f}" for s in STAGES)
+            print(f"{chunk:>6} {channels:>3} {result['fps']:>10,.0f} {stages} "
+                  f"{result['alloc_kib']:>6.0f}KiB {result['message_kib']:>6.0f}KiB")
+    print("   (stage columns in µs/frame; alloc = peak bytes allocated per frame)")
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump({"views": args.views, "results": results}, f, indent=1)
+        print(f"💾 Baseline saved to {args.save}")
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if baseline.get("views") != args.views:
+            print(f"⚠️  Baseline was recorded with {baseline.get('views')} views, not {args.views}")
+        failures = compare(results, baseline["results"], args.threshold)
+        if failures:
+            print(f"❌ Throughput regressed by more than {args.threshold:.0%}:")
+            for line in failures:
+                print(f"   {line}")
+            sys.exit(1)
+        print(f"✅ No configuration regressed by more than {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
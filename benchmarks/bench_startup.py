@@ -0,0 +1,62 @@
+"""
+Cold-start benchmark for the CLI modes.
+
+Starts a fresh interpreter per run, so nothing is cached in sys.modules, and
+reports the wall time until the mode has done its (minimal) work plus which
+heavy dependencies it pulled in. ``meter`` should stay well under a second
+and must not import Taipy, pandas or SciPy.
+
+    python -m benchmarks.bench_startup --runs 5
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+HEAVY = ("taipy", "pandas", "scipy", "pyaudio", "numpy")
+
+# Each command runs one mode as briefly as possible, then lists the heavy modules it loaded
+SCRIPT = """
+import sys
+from taipy_audio import cli
+{body}
+print(",".join(m for m in {heavy!r} if m in sys.modules))
+"""
+
+MODES = {
+    "cli --help": ("import contextlib, io\n"
+                   "with contextlib.suppress(SystemExit), contextlib.redirect_stdout(io.StringIO()):\n"
+                   "    cli.main(['--help'])"),
+    "meter": "cli.main(['meter', '--synth', 'silence', '--seconds', '0'])",
+    "gui (import only)": "from taipy_audio import gui",
+}
+
+
+def time_mode(body, runs):
+    script = SCRIPT.format(body=body, heavy=HEAVY)
+    times = []
+    loaded = ""
+    for _ in range(runs):
+        started = time.perf_counter()
+        result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+        times.append(time.perf_counter() - started)
+        loaded = result.stdout.strip().splitlines()[-1] if result.stdout.strip() else ""
+    return statistics.median(times), loaded
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    baseline, _ = time_mode("pass", args.runs)
+    print(f"🐍 Bare interpreter + import taipy_audio.cli: {baseline * 1000:.0f} ms")
+    for name, body in MODES.items():
+        median, loaded = time_mode(body, args.runs)
+        print(f"⏱️  {name:<18} {median * 1000:6.0f} ms  loads: {loaded or '-'}")
+
+
+if __name__ == "__main__":
+    main()
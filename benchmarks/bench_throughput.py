@@ -0,0 +1,71 @@
+"""
+Headless throughput benchmark for the capture -> update_charts path.
+
+Drives AudioCapture from an unpaced synthetic (or WAV) source on one core and
+runs the same per-chunk work the GUI scripts do in update_charts(): int16 to
+float conversion into the waveform chart buffer and a windowed real FFT into
+the spectrum chart buffer.
+
+    python -m benchmarks.bench_throughput --chunk 512 --seconds 60 --signal pink
+    python -m benchmarks.bench_throughput --wav recording.wav
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from taipy_audio.audio_capture import AudioCapture
+from taipy_audio.audio_sources import SyntheticSource, WavFileSource
+from taipy_audio.chart_data import chart_pair
+from taipy_audio.spectrum import SpectrumEngine
+
+
+def process_chunk(samples, wave_chart, spec_chart, spectrum):
+    """The per-refresh work done by update_charts()"""
+    latest_data = wave_chart.back()
+    np.multiply(samples, 1 / 32768.0, out=latest_data)
+    spectrum.compute(latest_data, out=spec_chart.back())
+    return wave_chart.publish(), spec_chart.publish()
+
+
+def run(source):
+    capture = AudioCapture(source=source, seconds=max(1.0, 4 * source.chunk / source.rate))
+    chunk = capture.chunk
+    wave_chart, spec_chart = chart_pair(chunk, capture.rate)
+    spectrum = SpectrumEngine(chunk, capture.rate)
+    chunks = 0
+    elapsed = 0.0
+    # Only the capture write and the processing are timed, not signal generation
+    for samples in source.chunks():
+        started = time.perf_counter()
+        capture.buffer.write(samples)
+        latest, _ = capture.latest(chunk)
+        process_chunk(latest, wave_chart, spec_chart, spectrum)
+        elapsed += time.perf_counter() - started
+        chunks += 1
+    audio_seconds = capture.buffer.count / capture.rate
+    print(f"📊 {chunks} chunks of {chunk} samples processed in {elapsed:.2f}s")
+    print(f"⚡ {chunks / elapsed:,.0f} chunks/s - {audio_seconds / elapsed:,.1f}x real time")
+    return chunks / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--chunk", type=int, default=512)
+    parser.add_argument("--rate", type=int, default=44100)
+    parser.add_argument("--seconds", type=float, default=30.0, help="seconds of audio to generate")
+    parser.add_argument("--signal", default="pink", choices=SyntheticSource.KINDS)
+    parser.add_argument("--wav", help="replay this WAV file instead of a synthetic signal")
+    args = parser.parse_args()
+
+    if args.wav:
+        source = WavFileSource(args.wav, chunk=args.chunk, paced=False)
+    else:
+        source = SyntheticSource(args.signal, rate=args.rate, chunk=args.chunk,
+                                 paced=False, duration=args.seconds, seed=0)
+    run(source)
+
+
+if __name__ == "__main__":
+    main()
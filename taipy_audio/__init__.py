@@ -0,0 +1,8 @@
+"""
+Real-time audio capture, analysis and visualisation with Taipy GUI.
+
+Importing the package is cheap: NumPy, SciPy, Taipy and PyAudio are only
+imported by the modules (and CLI modes) that need them.
+"""
+
+__version__ = "0.2.0"
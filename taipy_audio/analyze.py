@@ -0,0 +1,44 @@
+"""
+Offline analysis of a WAV file: levels and the strongest frequencies.
+"""
+
+import numpy as np
+
+from .audio_sources import WavFileSource
+from .meter import level_db
+from .spectrum import SpectrumEngine
+
+
+def main(path, fft_size=4096, window="hann", peaks=5):
+    """Print duration, peak/RMS level and the dominant frequencies of a WAV file"""
+    source = WavFileSource(path, chunk=fft_size, paced=False)
+    spectrum = SpectrumEngine(fft_size, source.rate, window=window)
+    average = np.zeros(spectrum.bins)
+    frame = np.zeros(fft_size)
+    frames = 0
+    samples = 0
+    peak = 0
+    energy = 0.0
+    for chunk in source.chunks():
+        samples += len(chunk)
+        peak = max(peak, int(np.abs(chunk.astype(np.int32)).max()))
+        energy += float(np.dot(chunk.astype(np.float64), chunk))
+        frame[:len(chunk)] = chunk
+        frame[len(chunk):] = 0
+        frame *= 1 / 32768.0
+        average += spectrum.compute(frame)
+        frames += 1
+    if not samples:
+        print(f"❌ {path} contains no audio")
+        return
+
+    average /= frames
+    print(f"📁 {path}")
+    print(f"⏱️  {samples / source.rate:.2f}s at {source.rate} Hz")
+    print(f"📈 Peak {level_db(peak / 32768.0):.1f} dBFS, RMS {level_db(np.sqrt(energy / samples) / 32768.0):.1f} dBFS")
+    print(f"🎵 Strongest frequencies ({fft_size}-point {window} FFT, {frames} frames averaged):")
+    # Local maxima only, so one tone is not listed once per bin of its main lobe
+    inner = average[1:-1]
+    maxima = np.flatnonzero((inner > average[:-2]) & (inner >= average[2:])) + 1
+    for i in maxima[np.argsort(average[maxima])[::-1][:peaks]]:
+        print(f"   {spectrum.freqs[i]:8.1f} Hz  {level_db(average[i]):6.1f} dBFS")
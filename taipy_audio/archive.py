@@ -0,0 +1,207 @@
+"""
+Memory-mapped session archive with a min/max/RMS pyramid for instant zoom.
+
+A session is stored as three files next to each other:
+
+- ``<name>.pcm``          raw mono int16 samples, opened with ``np.memmap``
+- ``<name>.json``         sidecar: sample rate, length and pyramid layout
+- ``<name>.pyramid.npy``  float32 rows of (min, max, rms), one block per level
+
+Level 0 summarises every ``base`` samples, and each level above halves the
+number of rows, so level k covers ``base * 2**k`` samples per row. A zoom
+request picks the level that yields at most the requested number of points
+for its time range and slices it. Nothing is read from disk beyond those rows,
+so a 10-hour session opens and zooms as fast as a 10-second one.
+"""
+
+import json
+import math
+from pathlib import Path
+
+import numpy as np
+
+from .decimate import minmax_decimate
+
+BASE = 256
+
+
+def _paths(path):
+    path = Path(path)
+    stem = path.with_suffix("")
+    return stem.with_suffix(".pcm"), stem.with_suffix(".json"), stem.with_name(stem.name + ".pyramid.npy")
+
+
+def _summarise(frames):
+    """(min, max, rms) rows for a 2D array of int16 frames"""
+    rows = np.empty((len(frames), 3), dtype=np.float32)
+    rows[:, 0] = frames.min(axis=1)
+    rows[:, 1] = frames.max(axis=1)
+    rows[:, 2] = np.sqrt(np.mean(np.square(frames, dtype=np.float64), axis=1))
+    return rows
+
+
+def build_pyramid(path, base=BASE, block_rows=1 << 16):
+    """Write the sidecar and pyramid for an existing ``.pcm`` file
+
+    Works through the memory-mapped samples ``block_rows`` rows at a time, so
+    memory use does not depend on the length of the session.
+    """
+    pcm_path, json_path, pyramid_path = _paths(path)
+    with open(json_path) as f:
+        meta = json.load(f)
+    samples = np.memmap(pcm_path, dtype=np.int16, mode="r") if pcm_path.stat().st_size else np.zeros(0, np.int16)
+
+    sizes = [max(1, math.ceil(len(samples) / base))]
+    while sizes[-1] > 1:
+        sizes.append((sizes[-1] + 1) // 2)
+    offsets = np.concatenate(([0], np.cumsum(sizes)))
+    pyramid = np.lib.format.open_memmap(pyramid_path, mode="w+", dtype=np.float32, shape=(int(offsets[-1]), 3))
+
+    # Level 0 straight from the samples; a partial last bucket is summarised on its own
+    step = block_rows * base
+    for start in range(0, len(samples), step):
+        chunk = samples[start:start + step]
+        full = len(chunk) // base
+        row = start // base
+        if full:
+            pyramid[row:row + full] = _summarise(chunk[:full * base].reshape(full, base))
+        if len(chunk) % base:
+            pyramid[row + full] = _summarise(chunk[full * base:].reshape(1, -1))[0]
+    if not len(samples):
+        pyramid[0] = 0
+
+    # Every higher level merges pairs of rows from the one below
+    for level in range(1, len(sizes)):
+        below = pyramid[offsets[level - 1]:offsets[level]]
+        out = pyramid[offsets[level]:offsets[level + 1]]
+        for row in range(0, len(out), block_rows):
+            pairs = below[2 * row:2 * (row + block_rows)]
+            if len(pairs) % 2:
+                pairs = np.concatenate((pairs, pairs[-1:]))
+            a, b = pairs[0::2], pairs[1::2]
+            merged = out[row:row + len(a)]
+            np.minimum(a[:, 0], b[:, 0], out=merged[:, 0])
+            np.maximum(a[:, 1], b[:, 1], out=merged[:, 1])
+            merged[:, 2] = np.sqrt((np.square(a[:, 2]) + np.square(b[:, 2])) / 2)
+    pyramid.flush()
+
+    meta.update({"samples": len(samples), "base": base, "levels": sizes})
+    with open(json_path, "w") as f:
+        json.dump(meta, f, indent=2)
+    return meta
+
+
+class ArchiveWriter:
+    """Appends int16 samples to a new session and builds its pyramid on close"""
+
+    def __init__(self, path, rate, buffering=1 << 20):
+        self.pcm_path, self.json_path, _ = _paths(path)
+        self.pcm_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.json_path, "w") as f:
+            json.dump({"rate": rate, "channels": 1, "dtype": "int16"}, f)
+        self._file = open(self.pcm_path, "wb", buffering=buffering)
+
+    def write(self, samples):
+        self._file.write(np.ascontiguousarray(samples, dtype=np.int16).tobytes())
+
+    def close(self):
+        self._file.close()
+        build_pyramid(self.pcm_path)
+
+
+def import_wav(wav_path, path=None):
+    """Convert a 16-bit WAV file into a session archive (mono mix-down)"""
+    from .audio_sources import WavFileSource
+
+    source = WavFileSource(wav_path, chunk=1 << 16, paced=False)
+    writer = ArchiveWriter(path or Path(wav_path).with_suffix(".pcm"), source.rate)
+    for samples in source.chunks():
+        writer.write(samples)
+    writer.close()
+    return SessionArchive(writer.pcm_path)
+
+
+def list_sessions(directory):
+    """Session archives (``.pcm`` files with a pyramid) in a directory, newest first"""
+    directory = Path(directory)
+    if not directory.is_dir():
+        return []
+    found = [p for p in directory.glob("*.pcm") if _paths(p)[2].exists()]
+    return sorted(found, key=lambda p: p.stat().st_mtime, reverse=True)
+
+
+class SessionArchive:
+    """Read-only view of an archived session - opening it reads only the sidecar"""
+
+    def __init__(self, path):
+        self.pcm_path, self.json_path, pyramid_path = _paths(path)
+        with open(self.json_path) as f:
+            meta = json.load(f)
+        if "levels" not in meta:
+            raise ValueError(f"{self.pcm_path}: no pyramid yet, run build_pyramid() first")
+        self.name = self.pcm_path.stem
+        self.rate = meta["rate"]
+        self.length = meta["samples"]
+        self.base = meta["base"]
+        self.sizes = meta["levels"]
+        self.offsets = np.concatenate(([0], np.cumsum(self.sizes)))
+        self.samples = (np.memmap(self.pcm_path, dtype=np.int16, mode="r")
+                        if self.length else np.zeros(0, np.int16))
+        self.pyramid = np.load(pyramid_path, mmap_mode="r")
+
+    @property
+    def duration(self):
+        return self.length / self.rate
+
+    def level(self, k):
+        """(min, max, rms) rows of level k, each covering ``base * 2**k`` samples"""
+        return self.pyramid[self.offsets[k]:self.offsets[k + 1]]
+
+    def pick_level(self, start, stop, points):
+        """Lowest level that covers [start, stop) in at most points // 2 rows"""
+        rows = max(1, points // 2)
+        needed = (stop - start) / (self.base * rows)
+        k = max(0, math.ceil(math.log2(needed))) if needed > 1 else 0
+        return min(k, len(self.sizes) - 1)
+
+    def zoom(self, start_s=0.0, end_s=None, points=2000, x_name="x", y_name="y"):
+        """Waveform payload for a time range, at most about `points` points
+
+        Short ranges return the raw samples and ranges below the pyramid's
+        resolution are decimated directly; everything longer is a min/max
+        envelope read from the pyramid. x is in seconds from the start of the
+        session and y is scaled to [-1, 1], like the live waveform chart.
+        """
+        end_s = self.duration if end_s is None else end_s
+        start = int(np.clip(start_s * self.rate, 0, self.length))
+        stop = int(np.clip(end_s * self.rate, start, self.length))
+        if stop - start <= self.base * max(1, points // 2):
+            # Finer than level 0 - decimate the (bounded) run of raw samples instead
+            index, values = minmax_decimate(self.samples[start:stop], points)
+            return {x_name: (start + index) / self.rate, y_name: values / 32768.0}
+
+        k = self.pick_level(start, stop, points)
+        size = self.base << k
+        first, last = start // size, -(-stop // size)
+        rows = self.level(k)[first:last]
+        starts = np.arange(first, first + len(rows)) * size
+        x = np.empty(2 * len(rows))
+        x[0::2] = starts + 0.25 * size
+        x[1::2] = starts + 0.75 * size
+        np.minimum(x, self.length, out=x)
+        y = np.empty(2 * len(rows))
+        y[0::2] = rows[:, 0]
+        y[1::2] = rows[:, 1]
+        return {x_name: x / self.rate, y_name: y / 32768.0}
+
+    def rms(self, start_s=0.0, end_s=None, points=1000):
+        """RMS envelope (x in seconds, rms in [0, 1]) for a time range"""
+        end_s = self.duration if end_s is None else end_s
+        start = int(np.clip(start_s * self.rate, 0, self.length))
+        stop = int(np.clip(end_s * self.rate, start, self.length))
+        k = self.pick_level(start, stop, 2 * points)
+        size = self.base << k
+        first, last = start // size, -(-stop // size)
+        rows = self.level(k)[first:last]
+        x = (np.arange(first, first + len(rows)) + 0.5) * size / self.rate
+        return {"x": x, "rms": rows[:, 2] / 32768.0}
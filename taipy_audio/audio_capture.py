@@ -0,0 +1,228 @@
+"""
+Callback-driven audio capture.
+
+The source (microphone, WAV replay or synthetic generator - see audio_sources.py)
+calls back from its own thread for every buffer; the callback only appends the
+samples to a RingBuffer. There is no blocking read, no sleep and no per-chunk
+queue item, so no audio is thrown away between GUI refreshes.
+
+With ``enable_filters()`` the callback also runs each chunk through a
+FilterChain (see filters.py) into a second ring buffer. Everything that
+analyses the audio - ``channel()``, ``latest()``, ``read_frames()`` - then
+reads the filtered samples, while ``buffer`` and ``raw_channel()`` keep the
+input as captured, for recording.
+
+Multi-channel sources fill one interleaved ring buffer; CaptureGroup puts
+several devices (each with its own callback thread and ring buffer) behind the
+same interface, so one pipeline and one push scheduler serve all of them.
+"""
+
+import numpy as np
+
+from .audio_sources import PyAudioSource
+from .filters import FilterChain
+from .ring_buffer import RingBuffer, SharedRingBuffer
+
+
+class AudioCapture:
+    """Audio source writing into a preallocated ring buffer
+
+    Defaults to the microphone; pass ``source=`` to capture from any other
+    AudioSource instead. ``shared=True`` puts the ring buffer in shared memory
+    so worker processes can read it (see offload.py).
+    """
+
+    def __init__(self, rate=44100, chunk=512, seconds=10.0, device_index=None, source=None, channels=1,
+                 shared=False):
+        self.source = source or PyAudioSource(rate, chunk, device_index, channels)
+        self.rate = self.source.rate
+        self.chunk = self.source.chunk
+        self.channels = self.source.channels
+        ring = SharedRingBuffer if shared else RingBuffer
+        self.buffer = ring(int(self.rate * seconds), channels=self.channels)
+        self.analysis = self.buffer
+        self.filters = None
+        self.on_data = None
+
+    @property
+    def running(self):
+        return self.source.running
+
+    @property
+    def labels(self):
+        """Chart column name of every channel"""
+        return [f"ch{i + 1}" for i in range(self.channels)]
+
+    def start(self):
+        self.source.start(self._on_chunk)
+
+    def stop(self):
+        self.source.stop()
+
+    def _on_chunk(self, samples, timestamp=None):
+        self.buffer.write(samples, timestamp)
+        if self.filters is not None:
+            filtered = self.filters.process(samples)
+            if filtered is not samples:
+                filtered = np.clip(filtered, -32768, 32767, out=filtered)
+            self.analysis.write(filtered, timestamp)
+        if self.on_data is not None:
+            self.on_data()
+
+    def enable_filters(self):
+        """Analyse the audio through a FilterChain (all filters off at first) - True if supported
+
+        Call before anything reads ``channel()``: readers keep the ring buffer they were given.
+        """
+        if self.filters is None:
+            self.filters = FilterChain(self.rate, self.channels)
+            self.analysis = RingBuffer(self.buffer.capacity, channels=self.channels)
+        return True
+
+    def set_filter(self, slot, spec):
+        """Enable a filter slot with a spec from filters.py, or disable it with None"""
+        self.filters.set(slot, spec)
+
+    def set_data_callback(self, callback):
+        """Call ``callback()`` from the capture thread after every chunk - True if supported"""
+        self.on_data = callback
+        return True
+
+    def set_chunk(self, chunk):
+        """Change the source's frames per buffer - the ring buffer is unaffected"""
+        self.source.set_chunk(chunk)
+        self.chunk = self.source.chunk
+
+    def health(self):
+        """Capture state for status displays"""
+        return {"running": self.running, "count": self.buffer.count, "overflows": self.source.overflows,
+                "gaps": self.source.gaps, "lost_samples": self.source.lost_samples}
+
+    def newest_sample_time(self):
+        """time.monotonic() at which the newest buffered sample was captured, or None"""
+        stamp = self.buffer.stamp()
+        if stamp is None:
+            return None
+        first, captured = stamp
+        return captured + (self.buffer.count - first) / self.rate
+
+    def channel(self, index):
+        """Mono ring buffer (or strided view) of one channel, filtered if filters are enabled"""
+        return self.analysis.channel(index)
+
+    def raw_channel(self, index):
+        """Like ``channel()``, always as captured"""
+        return self.buffer.channel(index)
+
+    def latest(self, n=None):
+        """Latest n samples (default: one chunk) as an int16 view, plus the sample count"""
+        return self.analysis.latest(n or self.chunk)
+
+    def read_frames(self, n, out):
+        """Latest n frames as floats in [-1, 1], one row per channel, written into out
+
+        ``out`` is ``(n,)`` for mono and ``(channels, n)`` otherwise - the
+        transpose of the interleaved view, deinterleaved by the multiply
+        itself. Returns the sample count the frames end at.
+        """
+        block, count = self.analysis.latest(n)
+        np.multiply(block.T, 1 / 32768.0, out=out)
+        return count
+
+
+class CaptureGroup:
+    """Several AudioCaptures (one per input device) read as one multi-channel capture
+
+    Channels are numbered device by device. All devices must run at the same
+    sample rate; each keeps its own callback thread and ring buffer.
+    """
+
+    def __init__(self, captures):
+        self.captures = list(captures)
+        if not self.captures:
+            raise ValueError("CaptureGroup needs at least one capture")
+        rates = {capture.rate for capture in self.captures}
+        if len(rates) > 1:
+            raise ValueError(f"All devices must use the same sample rate, got {sorted(rates)}")
+        self.rate = self.captures[0].rate
+        self.chunk = self.captures[0].chunk
+        self.channels = sum(capture.channels for capture in self.captures)
+        self._index = [(capture, c) for capture in self.captures for c in range(capture.channels)]
+
+    @property
+    def running(self):
+        return any(capture.running for capture in self.captures)
+
+    @property
+    def labels(self):
+        return [f"dev{d + 1}-ch{c + 1}" for d, capture in enumerate(self.captures)
+                for c in range(capture.channels)]
+
+    @property
+    def buffer(self):
+        """Ring buffer of the first channel of the first device"""
+        return self.channel(0)
+
+    def start(self):
+        for capture in self.captures:
+            capture.start()
+
+    def stop(self):
+        for capture in self.captures:
+            capture.stop()
+
+    def set_data_callback(self, callback):
+        return all([capture.set_data_callback(callback) for capture in self.captures])
+
+    def enable_filters(self):
+        """One FilterChain per device, each with its own state - True if every device supports it"""
+        return all([capture.enable_filters() for capture in self.captures])
+
+    def set_filter(self, slot, spec):
+        for capture in self.captures:
+            capture.set_filter(slot, spec)
+
+    def set_chunk(self, chunk):
+        for capture in self.captures:
+            capture.set_chunk(chunk)
+        self.chunk = self.captures[0].chunk
+
+    def health(self):
+        devices = [capture.health() for capture in self.captures]
+        health = {"running": self.running, "count": sum(h["count"] for h in devices), "devices": devices}
+        for key in ("overflows", "gaps", "lost_samples"):
+            values = [h.get(key) for h in devices]
+            health[key] = None if None in values else sum(values)
+        return health
+
+    def newest_sample_time(self):
+        """Capture time of the newest sample every device has delivered"""
+        times = [capture.newest_sample_time() for capture in self.captures]
+        return None if None in times else min(times)
+
+    def channel(self, index):
+        capture, c = self._index[index]
+        return capture.channel(c)
+
+    def raw_channel(self, index):
+        capture, c = self._index[index]
+        return capture.raw_channel(c)
+
+    def latest(self, n=None):
+        return self.captures[0].latest(n)
+
+    def read_frames(self, n, out):
+        """Like AudioCapture.read_frames, rows ordered device by device
+
+        Returns the total number of frames captured by all devices, so a new
+        chunk from any device counts as new data.
+        """
+        if self.channels == 1:
+            return self.captures[0].read_frames(n, out)
+        total = 0
+        row = 0
+        for capture in self.captures:
+            rows = out[row] if capture.channels == 1 else out[row:row + capture.channels]
+            total += capture.read_frames(n, rows)
+            row += capture.channels
+        return total
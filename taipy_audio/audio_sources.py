@@ -0,0 +1,309 @@
+"""
+Audio sources that feed int16 chunks into the capture pipeline.
+
+Every source delivers int16 chunks to an ``on_chunk(samples, timestamp)``
+callback - 1D for mono, ``(frames, channels)`` for multi-channel sources - with
+the ``time.monotonic()`` capture time of the chunk's first sample:
+
+- PyAudioSource   - live microphone input (PortAudio callback thread)
+- WavFileSource   - replay of a 16-bit WAV file
+- SyntheticSource - generated sines, chirps, white/pink noise or silence
+
+The file and synthetic sources run on their own thread, either paced to real
+time or as fast as possible (``paced=False``), so the whole pipeline can run
+and be measured on machines without a sound card.
+"""
+
+import threading
+import time
+import wave
+
+import numpy as np
+
+
+class AudioSource:
+    """Base class for anything that produces int16 audio chunks"""
+
+    # Buffers the driver reported as overflowed (input lost before we got it)
+    overflows = 0
+    # Jumps in the driver's timestamps between two buffers, and the samples they skipped
+    gaps = 0
+    lost_samples = 0
+
+    def __init__(self, rate=44100, chunk=512, channels=1):
+        self.rate = rate
+        self.chunk = chunk
+        self.channels = channels
+        self._on_chunk = None
+
+    @property
+    def running(self):
+        raise NotImplementedError
+
+    def start(self, on_chunk):
+        """Begin delivering chunks to on_chunk(samples, timestamp)"""
+        raise NotImplementedError
+
+    def set_chunk(self, chunk):
+        """Deliver `chunk` frames per buffer from now on"""
+        self.chunk = int(chunk)
+
+    def _deliver(self, samples, timestamp=None):
+        """Hand a chunk on; without a driver timestamp it is taken to end now"""
+        if timestamp is None:
+            timestamp = time.monotonic() - len(samples) / self.rate
+        self._on_chunk(samples, timestamp)
+
+    def stop(self):
+        raise NotImplementedError
+
+
+class PyAudioSource(AudioSource):
+    """Microphone input via a PyAudio stream in callback mode
+
+    With ``channels > 1`` the interleaved input buffer is handed on as a
+    ``(frames, channels)`` view of the same bytes - nothing is copied here.
+    """
+
+    def __init__(self, rate=44100, chunk=512, device_index=None, channels=1):
+        super().__init__(rate, chunk, channels)
+        self.device_index = device_index
+        self._audio = None
+        self._stream = None
+        self._continue = None
+        self._overflow_flag = 0
+        self._next_adc = None
+        self.overflows = 0
+
+    def _callback(self, in_data, frame_count, time_info, status):
+        """PyAudio stream callback - runs on the PortAudio thread, keep it short"""
+        if status & self._overflow_flag:
+            self.overflows += 1
+        samples = np.frombuffer(in_data, dtype=np.int16)
+        # PortAudio stamps the buffer in stream time; map it onto the monotonic clock
+        timestamp = None
+        adc = time_info.get("input_buffer_adc_time") if time_info else 0
+        if adc:
+            timestamp = time.monotonic() - (time_info["current_time"] - adc)
+            # Consecutive buffers are frame_count / rate apart in stream time - more is a gap
+            if self._next_adc is not None and adc - self._next_adc > 0.5 * frame_count / self.rate:
+                self.gaps += 1
+                self.lost_samples += int(round((adc - self._next_adc) * self.rate))
+            self._next_adc = adc + frame_count / self.rate
+        self._deliver(samples if self.channels == 1 else samples.reshape(-1, self.channels), timestamp)
+        return (None, self._continue)
+
+    @property
+    def running(self):
+        return self._stream is not None and self._stream.is_active()
+
+    def start(self, on_chunk):
+        import pyaudio
+        if self._stream is not None:
+            return
+        self._on_chunk = on_chunk
+        self._next_adc = None
+        self._continue = pyaudio.paContinue
+        self._overflow_flag = pyaudio.paInputOverflow
+        self._audio = pyaudio.PyAudio()
+        self._stream = self._audio.open(
+            format=pyaudio.paInt16,
+            channels=self.channels,
+            rate=self.rate,
+            input=True,
+            input_device_index=self.device_index,
+            frames_per_buffer=self.chunk,
+            stream_callback=self._callback,
+        )
+        self._stream.start_stream()
+
+    def set_chunk(self, chunk):
+        """Reopen a running stream with `chunk` frames per buffer"""
+        if self._stream is None:
+            return super().set_chunk(chunk)
+        on_chunk = self._on_chunk
+        self.stop()
+        super().set_chunk(chunk)
+        self.start(on_chunk)
+
+    def stop(self):
+        if self._stream is not None:
+            self._stream.stop_stream()
+            self._stream.close()
+            self._stream = None
+        if self._audio is not None:
+            self._audio.terminate()
+            self._audio = None
+
+
+class ReplaySource(AudioSource):
+    """Base for sources that generate chunks on a worker thread
+
+    Subclasses implement ``read_chunk()``, returning an int16 array of up to
+    ``chunk`` samples, or None when the source is exhausted. With ``paced=True``
+    chunks are released on a real-time schedule (deadline based, so timing
+    errors do not accumulate); with ``paced=False`` they are produced as fast
+    as the consumer can take them.
+    """
+
+    def __init__(self, rate=44100, chunk=512, paced=True, channels=1):
+        super().__init__(rate, chunk, channels)
+        self.paced = paced
+        self._thread = None
+        self._stop = threading.Event()
+
+    def read_chunk(self):
+        raise NotImplementedError
+
+    def chunks(self):
+        """Iterate over the remaining chunks on the calling thread, unpaced"""
+        while True:
+            samples = self.read_chunk()
+            if samples is None or len(samples) == 0:
+                return
+            yield samples
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self):
+        delivered = 0
+        started = time.monotonic()
+        for samples in self.chunks():
+            if self._stop.is_set():
+                break
+            self._deliver(samples)
+            delivered += len(samples)
+            if self.paced:
+                delay = started + delivered / self.rate - time.monotonic()
+                if delay > 0 and self._stop.wait(delay):
+                    break
+
+    def start(self, on_chunk):
+        if self.running:
+            return
+        self._on_chunk = on_chunk
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+
+class WavFileSource(ReplaySource):
+    """Replay a 16-bit PCM WAV file
+
+    Multi-channel files are mixed down to mono unless ``mixdown=False``, which
+    keeps every channel.
+    """
+
+    def __init__(self, path, chunk=512, paced=True, loop=False, mixdown=True):
+        self.path = path
+        self.loop = loop
+        self._wav = wave.open(str(path), "rb")
+        if self._wav.getsampwidth() != 2:
+            raise ValueError(f"{path}: only 16-bit PCM WAV files are supported")
+        self._channels = self._wav.getnchannels()
+        self.mixdown = mixdown
+        super().__init__(self._wav.getframerate(), chunk, paced, 1 if mixdown else self._channels)
+
+    def read_chunk(self):
+        data = self._wav.readframes(self.chunk)
+        if not data and self.loop:
+            self._wav.rewind()
+            data = self._wav.readframes(self.chunk)
+        if not data:
+            return None
+        samples = np.frombuffer(data, dtype=np.int16)
+        if self._channels > 1:
+            samples = samples.reshape(-1, self._channels)
+            if self.mixdown:
+                samples = samples.mean(axis=1).astype(np.int16)
+        return samples
+
+    def start(self, on_chunk):
+        if not self.running:
+            # Capture stops and starts with its viewers - every start replays from the beginning
+            self._wav.rewind()
+        super().start(on_chunk)
+
+    def close(self):
+        """Stop and release the file - the source cannot be started again"""
+        self.stop()
+        self._wav.close()
+
+
+# Pink noise: white noise through a -3 dB/octave IIR approximation (Paul Kellet)
+_PINK_B = [0.049922035, -0.095993537, 0.050612699, -0.004408786]
+_PINK_A = [1.0, -2.494956002, 2.017265875, -0.522189400]
+
+
+class SyntheticSource(ReplaySource):
+    """Generated test signal
+
+    kind is one of "sine", "chirp", "white", "pink" or "silence". Sines use
+    ``freq``; chirps sweep logarithmically from ``freq`` to ``freq_end`` and
+    repeat every ``sweep_seconds``. ``duration`` (seconds) limits the length,
+    None runs until stopped. With ``channels > 1`` each channel is an octave
+    above the previous one (noise is independent per channel), so channels
+    are easy to tell apart on a chart.
+    """
+
+    KINDS = ("sine", "chirp", "white", "pink", "silence")
+
+    def __init__(self, kind="sine", rate=44100, chunk=512, paced=True,
+                 freq=440.0, freq_end=8000.0, sweep_seconds=2.0,
+                 amplitude=0.5, duration=None, seed=None, channels=1):
+        if kind not in self.KINDS:
+            raise ValueError(f"Unknown signal kind {kind!r}, expected one of {self.KINDS}")
+        if kind == "chirp" and freq_end == freq:
+            raise ValueError(f"A chirp needs freq_end different from freq ({freq} Hz)")
+        super().__init__(rate, chunk, paced, channels)
+        self.kind = kind
+        self.freq = freq
+        self.freq_end = freq_end
+        self.sweep_seconds = sweep_seconds
+        self.amplitude = amplitude
+        self.duration = duration
+        self._rng = np.random.default_rng(seed)
+        self._position = 0
+        self._pink_state = None
+        self._scale = np.float32(amplitude * 32767)
+
+    def _generate(self, n):
+        """(n, channels) samples in [-1, 1]"""
+        shape = (n, self.channels)
+        t = ((self._position + np.arange(n)) / self.rate)[:, None]
+        freq = self.freq * 2.0 ** np.arange(self.channels)
+        if self.kind == "sine":
+            return np.sin(2 * np.pi * freq * t)
+        if self.kind == "chirp":
+            ratio = self.freq_end / self.freq
+            t = t % self.sweep_seconds
+            k = np.log(ratio) / self.sweep_seconds
+            return np.sin(2 * np.pi * freq * (np.exp(k * t) - 1) / k)
+        if self.kind == "white":
+            return self._rng.uniform(-1.0, 1.0, shape)
+        if self.kind == "pink":
+            from scipy.signal import lfilter
+            if self._pink_state is None:
+                self._pink_state = np.zeros((len(_PINK_A) - 1, self.channels))
+            white = self._rng.standard_normal(shape)
+            pink, self._pink_state = lfilter(_PINK_B, _PINK_A, white, axis=0, zi=self._pink_state)
+            return np.clip(pink * 0.25, -1.0, 1.0)
+        return np.zeros(shape)
+
+    def read_chunk(self):
+        n = self.chunk
+        if self.duration is not None:
+            n = min(n, int(self.duration * self.rate) - self._position)
+            if n <= 0:
+                return None
+        samples = (self._generate(n) * self._scale).astype(np.int16)
+        self._position += n
+        return samples[:, 0] if self.channels == 1 else samples
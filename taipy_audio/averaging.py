@@ -0,0 +1,171 @@
+"""
+Spectrum averaging over every captured chunk, not just the newest one.
+
+Plotting the spectrum of the latest chunk alone ignores the two or three other
+chunks that arrived since the previous tick, which is why the live spectrum
+is so noisy. SpectrumAverager follows the ring buffer's sample counter like
+the spectrogram and VAD: each ``update()`` stacks all chunks completed since
+the last call into one ``(channels, frames, size)`` array, transforms them in
+a single batched FFT and folds them into accumulators that are updated in
+place:
+
+- linear       equal-weight average of every frame since the last reset
+- exponential  running average with a time constant of ``tau`` seconds
+- peak-hold    highest magnitude per bin, decaying by ``peak_decay_db`` per second
+- max-hold     highest magnitude per bin since the last reset
+
+The averages are taken over power (magnitude squared), as spectrum analysers
+do, and returned as magnitudes so they rescale like the live spectrum.
+"""
+
+import math
+
+import numpy as np
+
+from .spectrum import SpectrumEngine
+
+AVERAGES = ("off", "linear", "exponential", "peak-hold", "max-hold")
+
+
+class ExponentialMean:
+    """Exponentially weighted mean of a stream of arrays, folded in a block at a time
+
+    Each value scales the weight of everything before it by ``decay``. The
+    band filter banks (see bands.py) use one per band as well.
+    """
+
+    def __init__(self, shape):
+        self.total = np.zeros(shape)
+        self.weight = 0.0
+
+    def reset(self):
+        self.total[:] = 0.0
+        self.weight = 0.0
+
+    def add(self, values, decay, axis=-1):
+        """Fold in the values along `axis`, oldest first - all at once, older ones get smaller weights"""
+        n = values.shape[axis]
+        weights = (1 - decay) * decay ** np.arange(n - 1, -1, -1)
+        self.total *= decay ** n
+        self.total += (np.moveaxis(values, axis, -1) @ weights).reshape(self.total.shape)
+        self.weight = self.weight * decay ** n + weights.sum()
+
+    def mean(self, out=None):
+        # Dividing by the total weight removes the start-up bias towards zero
+        return np.divide(self.total, max(self.weight, 1e-12), out=out)
+
+
+class SpectrumAverager:
+    """Averaged, peak-hold and max-hold spectra of one or more mono ring buffers
+
+    ``buffers`` holds one buffer (or ChannelView) per channel. Results have
+    shape ``(bins,)`` for a single buffer and ``(channels, bins)`` otherwise.
+    After a stall at most ``max_frames`` of the newest chunks are caught up on.
+    """
+
+    def __init__(self, buffers, rate, size, window="hann", tau=1.0, peak_decay_db=20.0, max_frames=64):
+        self.buffers = list(buffers)
+        self.rate = rate
+        self.size = size
+        self.max_frames = max_frames
+        self.engine = SpectrumEngine(size, rate, window=window)
+        self.tau = tau
+        self.peak_decay_db = peak_decay_db
+        channels = len(self.buffers)
+        self._shape = (self.engine.bins,) if channels == 1 else (channels, self.engine.bins)
+        self._samples = np.empty((channels, max_frames, size))
+        self._linear = np.zeros(self._shape)
+        self._exponential = ExponentialMean(self._shape)
+        self._peak = np.zeros(self._shape)
+        self._max = np.zeros(self._shape)
+        self.frames = 0
+        self.overruns = 0
+        self._next = None
+
+    @property
+    def tau(self):
+        return self._tau
+
+    @tau.setter
+    def tau(self, seconds):
+        self._tau = seconds
+        # Per-frame smoothing factor for a time constant of `seconds`
+        self._alpha = 1 - math.exp(-self.size / (seconds * self.rate))
+
+    @property
+    def peak_decay_db(self):
+        return self._peak_decay_db
+
+    @peak_decay_db.setter
+    def peak_decay_db(self, db_per_second):
+        self._peak_decay_db = db_per_second
+        self._peak_step = 10 ** (-db_per_second * self.size / self.rate / 20)
+
+    def set_window(self, name):
+        self.engine.set_window(name)
+        self.reset()
+
+    def reset(self):
+        """Restart every accumulator from the next chunk"""
+        for acc in (self._linear, self._peak, self._max):
+            acc[:] = 0.0
+        self._exponential.reset()
+        self.frames = 0
+
+    def _complete(self):
+        # Devices in a CaptureGroup advance separately - only chunks every channel has count
+        return min(buffer.count for buffer in self.buffers) // self.size
+
+    def update(self):
+        """Fold the chunks completed since the last call into the accumulators - returns how many"""
+        complete = self._complete()
+        if self._next is None or complete - self._next > self.max_frames:
+            self._next = max(0, complete - self.max_frames)
+        if complete <= self._next:
+            return 0
+        n = complete - self._next
+        samples = self._samples[:, :n]
+        for row, buffer in zip(samples, self.buffers):
+            block = buffer.read(self._next * self.size, complete * self.size)
+            if block is None:
+                # The writer lapped us - start again from the newest chunks
+                self.overruns += 1
+                self._next = None
+                return 0
+            np.multiply(block.reshape(n, self.size), 1 / 32768.0, out=row)
+        self._next = complete
+
+        # One FFT for every channel and chunk, then per-bin reductions over the chunk axis
+        magnitude = self.engine.compute(samples)
+        loudest = magnitude.max(axis=1).reshape(self._shape)
+        self._peak *= self._peak_step ** n
+        np.maximum(self._peak, loudest, out=self._peak)
+        np.maximum(self._max, loudest, out=self._max)
+
+        power = np.square(magnitude, out=magnitude)
+        self._linear += power.sum(axis=1).reshape(self._shape)
+        self._exponential.add(power, 1 - self._alpha, axis=1)
+        self.frames += n
+        return n
+
+    def skip(self):
+        """Move past the chunks completed since the last call without averaging them"""
+        self._next = self._complete()
+
+    def result(self, mode, out=None):
+        """Magnitude spectrum for one of the AVERAGES modes (except "off"), written into out"""
+        if out is None:
+            out = np.empty(self._shape)
+        if mode == "linear":
+            np.divide(self._linear, max(1, self.frames), out=out)
+            np.sqrt(out, out=out)
+        elif mode == "exponential":
+            self._exponential.mean(out=out)
+            np.sqrt(out, out=out)
+        elif mode == "peak-hold":
+            out[:] = self._peak
+        elif mode == "max-hold":
+            out[:] = self._max
+        else:
+            raise ValueError(f"Unknown averaging mode {mode!r}, expected one of {AVERAGES[1:]}")
+        return out
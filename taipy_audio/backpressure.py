@@ -0,0 +1,253 @@
+"""
+Per-session backpressure between the push thread and each browser.
+
+Assigning a State variable does not wait for the browser: Taipy queues a
+websocket packet for that client and a writer drains the queue as fast as
+the connection allows. A remote laptop on a slow link or a throttled
+background tab drains slower than 30 frames a second arrive, so its queue -
+and the server's memory - grows without bound, and every chart it finally
+draws is older than the one before.
+
+SessionSender sits between the frames the pipeline renders and the State
+assignment, and keeps one mailbox per session instead of a queue:
+
+- a new frame for a session that has not been sent the previous one yet is
+  merged into it (newest values win, products only the older frame carried
+  are kept), so a session that falls behind skips straight to the newest data
+  and never holds more than one frame. A frame that waits is copied first:
+  its chart payloads point into the pipeline's double buffers (see
+  chart_data.py), which are written again two frames later
+- a session is only sent to when its own interval has passed and its
+  websocket backlog (packets still queued on the server for it) is at most
+  ``max_backlog``; otherwise the frame waits in the mailbox
+- finding a backlog halves that session's FPS and its payload resolution
+  (every 2nd, then 4th point of each chart column, as strided views); every
+  ``recover`` seconds of sends that found the queue empty restore one step,
+  resolution first, then FPS
+
+Sessions that keep up are unaffected, and what a slow one costs is bounded
+by one frame and ``max_backlog`` packets.
+
+A browser that closes or loses its connection never clicks Stop. Before
+sending, the sender checks that the session still has an open websocket;
+one that has had none for ``grace`` seconds (long enough to reconnect) is
+forgotten and returned from ``post()``, so its owner can drop the listener
+too. Nothing is sent to it in the meantime.
+
+The backlog and the connections are read from Taipy's and
+python-engineio's internals; if those ever change they read as unknown,
+sessions get the newest frame at the full rate, with no adaptation, and
+only Stop ends a session.
+"""
+
+import threading
+import time
+
+import numpy as np
+
+
+def websocket_backlog(gui, state_id):
+    """Packets queued on the server for a session's websocket(s), or None if unknown"""
+    try:
+        sids = gui._Gui__client_id_2_sid.get(state_id) or ()
+        server = gui._server._ws.server
+        backlog = 0
+        for sid in list(sids):
+            socket = server.eio.sockets.get(server.manager.eio_sid_from_sid(sid, "/"))
+            if socket is not None:
+                backlog += socket.queue.qsize()
+        return backlog
+    except (AttributeError, KeyError, TypeError):
+        return None
+
+
+def websocket_connected(gui, state_id):
+    """Whether any of a session's websockets is still open, or None if unknown"""
+    try:
+        sids = gui._Gui__client_id_2_sid.get(state_id) or ()
+        server = gui._server._ws.server
+        # Taipy keeps a closed tab's sid around; engineio drops its socket
+        for sid in list(sids):
+            if server.eio.sockets.get(server.manager.eio_sid_from_sid(sid, "/")) is not None:
+                return True
+        return False
+    except (AttributeError, KeyError, TypeError):
+        return None
+
+
+def coalesce(older, newer):
+    """One frame holding the newest value of everything either frame carries"""
+    merged = dict(older)
+    for key, value in newer.items():
+        if isinstance(value, dict) and isinstance(older.get(key), dict):
+            merged[key] = {**older[key], **value}
+        else:
+            merged[key] = value
+    return merged
+
+
+def detach(value):
+    """Copy of a frame (or part of one) that shares no array with the chart buffers"""
+    if isinstance(value, dict):
+        return {key: detach(item) for key, item in value.items()}
+    if isinstance(value, np.ndarray):
+        return value.copy()
+    # Lists (the heatmap payloads) are built for each frame and never written again
+    return value
+
+
+def thin(payload, step):
+    """Chart payload with every step-th point of each column - views, nothing is copied"""
+    if payload is None or step == 1:
+        return payload
+    return {key: values[::step] for key, values in payload.items()}
+
+
+class Session:
+    """Mailbox and adaptive rate of one browser session"""
+
+    def __init__(self, state_id, fps):
+        self.state_id = state_id
+        self.fps = fps
+        self.step = 1
+        self.pending = None
+        self.next_due = 0.0
+        self.sent = 0
+        self.skipped = 0
+        self.held = 0
+        self.backlog = None
+        self.reported = None
+        self._clear_since = None
+
+    def text(self):
+        """Delivery summary for the session's status line"""
+        resolution = "full" if self.step == 1 else f"1/{self.step}"
+        text = f"{self.fps:.0f} FPS, {resolution} resolution"
+        if self.skipped:
+            text += f", {self.skipped} frame(s) skipped"
+        return text
+
+
+class SessionSender:
+    """Delivers rendered frames to each session at the rate that session can drain
+
+    ``post(state_ids, frame, fps)`` is called from the push publish stage after every
+    render, with the push rate, and returns the state ids found disconnected;
+    ``apply(state, frame, session)`` is invoked through ``gui.invoke_callback()``
+    for each session that is due.
+    """
+
+    def __init__(self, gui, apply, fps=30, max_backlog=8, min_fps=2, max_step=4, recover=2.0, grace=3.0):
+        self.gui = gui
+        self.apply = apply
+        self.fps = fps
+        self.max_backlog = max_backlog
+        self.min_fps = min_fps
+        self.max_step = max_step
+        self.recover = recover
+        self.grace = grace
+        self.sessions = {}
+        self._gone_since = {}
+        self._lock = threading.Lock()
+
+    def set_fps(self, fps):
+        """New push rate - sessions that keep up follow it, slowed ones stay at most at it"""
+        with self._lock:
+            for session in self.sessions.values():
+                session.fps = fps if session.fps >= self.fps else min(session.fps, fps)
+            self.fps = fps
+
+    def forget(self, state_id):
+        with self._lock:
+            self.sessions.pop(state_id, None)
+            self._gone_since.pop(state_id, None)
+
+    def _gone(self, state_id, now):
+        """Check one session's websockets - True once it has had none for `grace` seconds"""
+        if websocket_connected(self.gui, state_id) is not False:
+            self._gone_since.pop(state_id, None)
+            return False
+        since = self._gone_since.setdefault(state_id, now)
+        return now - since >= self.grace
+
+    def disconnected(self, state_ids, now=None):
+        """The sessions among `state_ids` whose browser has gone away - forgotten here"""
+        now = time.monotonic() if now is None else now
+        gone = [state_id for state_id in state_ids if self._gone(state_id, now)]
+        for state_id in gone:
+            self.forget(state_id)
+        return gone
+
+    def post(self, state_ids, frame, fps=None):
+        """Deliver `frame` to every session that is due - returns the ones found disconnected"""
+        if fps is not None and fps != self.fps:
+            self.set_fps(fps)
+        now = time.monotonic()
+        gone = []
+        # One copy of this frame for all the sessions that have to hold it
+        detached = None
+        # Half a push period of slack, so a session at the full rate is due on every tick
+        slack = 0.5 / self.fps
+        for state_id in state_ids:
+            with self._lock:
+                session = self.sessions.get(state_id)
+                if session is None:
+                    session = self.sessions[state_id] = Session(state_id, self.fps)
+            pending = session.pending
+            if pending is not None:
+                session.skipped += 1
+            outcome = self._send(session, frame if pending is None else coalesce(pending, frame), now, slack)
+            if outcome == "gone":
+                self.forget(state_id)
+                gone.append(state_id)
+            elif outcome == "held":
+                if detached is None:
+                    detached = detach(frame)
+                session.pending = detached if pending is None else coalesce(pending, detached)
+        return gone
+
+    def _send(self, session, frame, now, slack):
+        """Send `frame` if the session is due and drained - returns 'sent', 'held' or 'gone'"""
+        state_id = session.state_id
+        if now < session.next_due:
+            return "held"
+        if self._gone(state_id, now):
+            return "gone"
+        if state_id in self._gone_since:
+            # Disconnected, but it may still reconnect - keep the frame in the mailbox
+            return "held"
+        backlog = websocket_backlog(self.gui, state_id)
+        session.backlog = backlog
+        if backlog is not None and backlog > self.max_backlog:
+            session.held += 1
+            self._slow_down(session)
+            session.next_due = now + 1.0 / session.fps - slack
+            return "held"
+        self._adapt(session, backlog, now)
+        session.pending = None
+        session.next_due = now + 1.0 / session.fps - slack
+        session.sent += 1
+        self.gui.invoke_callback(state_id, self.apply, [frame, session])
+        return "sent"
+
+    def _slow_down(self, session):
+        session._clear_since = None
+        session.fps = max(self.min_fps, session.fps / 2)
+        session.step = min(self.max_step, session.step * 2)
+
+    def _adapt(self, session, backlog, now):
+        if backlog is None:
+            return
+        if backlog:
+            # Not drained yet, but within bounds - hold steady
+            session._clear_since = None
+            return
+        if session._clear_since is None:
+            session._clear_since = now
+        if now - session._clear_since < self.recover:
+            return
+        session._clear_since = now
+        if session.step > 1:
+            session.step //= 2
+        elif session.fps < self.fps:
+            session.fps = min(self.fps, session.fps * 1.5)
@@ -0,0 +1,238 @@
+"""
+Octave and third-octave band levels (IEC 61260 base-10 bands).
+
+A 512-point spectrum is 257 linearly spaced bins, 86 Hz apart: more points
+than a browser needs, yet fewer than one bin per band below 200 Hz. Acoustics
+work reads levels in fractional-octave bands instead - 10 octaves or about
+30 third-octaves between 20 Hz and 20 kHz.
+
+BandAnalyzer turns a magnitude spectrum into band levels with one
+matrix-vector product. The ``(bands, bins)`` aggregation matrix is built once
+per (FFT size, rate, fraction) and cached: each bin contributes to a band
+with the share of its width that lies inside the band edges, so bins that
+straddle an edge are split rather than counted twice. It is sparse (a bin
+touches at most two bands) when SciPy is installed.
+
+Below a few hundred Hz a short FFT cannot resolve the bands, and the lowest
+ones read whatever leaks out of the first bins. BandFilterBank measures them
+properly: a band-pass filter per band, run at a sample rate that halves,
+through anti-aliasing low-pass filters, from one octave to the next. Each
+band is filtered at the lowest rate that still holds it, so the 20 Hz band
+runs at under 100 Hz. The squared outputs are averaged with the sound level
+meter's "fast" 125 ms time weighting. Like the spectrogram and VAD it
+follows the ring buffer's sample counter, so every sample goes through the
+filters exactly once.
+
+Both report the amplitude a sine would need to give the band's power, so a
+full-scale sine reads 1.0 (0 dBFS) in its band, as it does in the spectrum.
+"""
+
+import math
+from functools import lru_cache
+
+import numpy as np
+
+from .averaging import ExponentialMean
+from .spectrum import frequency_axis, get_window
+
+BANDS = ("off", "octave", "third-octave")
+FRACTIONS = {"octave": 1, "third-octave": 3}
+
+# Base-10 octave ratio and the preferred numbers nominal band frequencies are rounded to
+_G = 10 ** 0.3
+_R10 = (1.0, 1.25, 1.6, 2.0, 2.5, 3.15, 4.0, 5.0, 6.3, 8.0, 10.0)
+
+# A band is filtered at the lowest rate whose Nyquist it stays below by this much
+_MAX_EDGE = 0.35
+
+
+def _nominal(frequency):
+    decade = 10 ** math.floor(math.log10(frequency))
+    value = decade * min(_R10, key=lambda r: abs(r - frequency / decade))
+    return f"{value / 1000:g}k" if value >= 1000 else f"{value:g}"
+
+
+@lru_cache(maxsize=None)
+def band_layout(rate, fraction=3, low=20.0, high=20000.0):
+    """Midband frequencies, (lower, upper) edges and nominal labels of the bands below Nyquist"""
+    centres, edges, labels = [], [], []
+    x = math.floor(fraction * math.log(low / 1000, _G)) - 1
+    while True:
+        centre = 1000 * _G ** (x / fraction)
+        x += 1
+        if centre >= min(high * 1.1, rate / 2):
+            break
+        if centre < low / 1.1:
+            continue
+        half = _G ** (1 / (2 * fraction))
+        centres.append(centre)
+        edges.append((centre / half, centre * half))
+        labels.append(_nominal(centre))
+    return np.array(centres), np.array(edges), tuple(labels)
+
+
+@lru_cache(maxsize=None)
+def aggregation_matrix(size, rate, fraction=3):
+    """(bands, bins) weights that sum rfft power into band power - sparse with SciPy, read-only"""
+    _, edges, _ = band_layout(rate, fraction)
+    freqs = frequency_axis(size, rate)
+    width = rate / size
+    lower = np.maximum(freqs - width / 2, edges[:, :1])
+    upper = np.minimum(freqs + width / 2, edges[:, 1:])
+    weights = np.clip(upper - lower, 0.0, None) / width
+    # DC is an offset, not energy in the lowest band
+    weights[:, 0] = 0.0
+    try:
+        from scipy.sparse import csr_matrix
+    except ImportError:  # pragma: no cover - SciPy is optional
+        weights.setflags(write=False)
+        return weights
+    matrix = csr_matrix(weights)
+    matrix.data.setflags(write=False)
+    return matrix
+
+
+class BandAnalyzer:
+    """Band levels from the magnitude spectra of a SpectrumEngine with the same size and window
+
+    ``compute()`` takes ``(..., bins)`` magnitudes and returns ``(..., bands)``.
+    """
+
+    def __init__(self, size, rate, fraction=3, window="hann"):
+        self.size = size
+        self.rate = rate
+        self.fraction = fraction
+        self.centres, self.edges, self.labels = band_layout(rate, fraction)
+        self.matrix = aggregation_matrix(size, rate, fraction)
+        self.set_window(window)
+
+    @property
+    def bands(self):
+        return len(self.centres)
+
+    def set_window(self, name):
+        window = get_window(name, self.size)
+        self.window = name
+        # A windowed sine spreads its power over this many bins (equivalent noise bandwidth)
+        self._enbw = self.size * float(np.square(window).sum()) / float(window.sum()) ** 2
+
+    def compute(self, magnitude, out=None):
+        """Band levels of one spectrum or a batch of them, written into out"""
+        bins = magnitude.shape[-1]
+        power = np.square(magnitude).reshape(-1, bins)
+        levels = (self.matrix @ power.T).T
+        if out is None:
+            out = np.empty(magnitude.shape[:-1] + (self.bands,))
+        np.divide(levels.reshape(out.shape), self._enbw, out=out)
+        return np.sqrt(out, out=out)
+
+
+class _Stage:
+    """Bands filtered at one sample rate, and the low-pass that feeds the next (half) rate"""
+
+    def __init__(self, rate):
+        self.rate = rate
+        self.bands = []  # [band index, sections, filter state]
+        self.lowpass = None
+        self.state = None
+        self.phase = 0
+
+
+class BandFilterBank:
+    """Fractional-octave band levels of one or more mono ring buffers through multi-rate filters
+
+    ``buffers`` holds one buffer (or ChannelView) per channel. Results have
+    shape ``(bands,)`` for a single buffer and ``(channels, bands)``
+    otherwise. After a stall at most ``max_seconds`` of the newest audio are
+    caught up on.
+    """
+
+    def __init__(self, buffers, rate, fraction=3, order=3, tau=0.125, max_seconds=1.0):
+        from scipy.signal import butter, ellip, sosfilt
+
+        self._sosfilt = sosfilt
+        self.buffers = list(buffers)
+        self.rate = rate
+        self.fraction = fraction
+        self.tau = tau
+        self.max_samples = int(max_seconds * rate)
+        self.centres, self.edges, self.labels = band_layout(rate, fraction)
+        channels = len(self.buffers)
+        self._shape = (len(self.centres),) if channels == 1 else (channels, len(self.centres))
+        self._power = [ExponentialMean(channels) for _ in self.centres]
+        self.overruns = 0
+        self._next = None
+
+        self._stages = [_Stage(rate)]
+        for index, (low, high) in enumerate(self.edges):
+            depth = 0
+            while high <= _MAX_EDGE * rate / 2 ** (depth + 1):
+                depth += 1
+            while len(self._stages) <= depth:
+                previous = self._stages[-1]
+                # Passes everything the next stage's bands need, stops what would alias onto them
+                previous.lowpass = ellip(6, 0.01, 60, previous.rate / 5, fs=previous.rate, output="sos")
+                previous.state = np.zeros((len(previous.lowpass), channels, 2))
+                self._stages.append(_Stage(previous.rate / 2))
+            stage = self._stages[depth]
+            if high < 0.95 * stage.rate / 2:
+                sos = butter(order, [low, high], btype="bandpass", fs=stage.rate, output="sos")
+            else:
+                # The top band reaches Nyquist - there is nothing above it to reject
+                sos = butter(2 * order, low, btype="highpass", fs=stage.rate, output="sos")
+            stage.bands.append([index, sos, np.zeros((len(sos), channels, 2))])
+
+    @property
+    def bands(self):
+        return len(self.centres)
+
+    def _complete(self):
+        # Devices in a CaptureGroup advance separately - only samples every channel has count
+        return min(buffer.count for buffer in self.buffers)
+
+    def update(self):
+        """Filter the samples captured since the last call - returns how many"""
+        complete = self._complete()
+        if self._next is None or complete - self._next > self.max_samples:
+            self._next = max(0, complete - self.max_samples)
+        if complete <= self._next:
+            return 0
+        n = complete - self._next
+        x = np.empty((len(self.buffers), n))
+        for row, buffer in zip(x, self.buffers):
+            block = buffer.read(self._next, complete)
+            if block is None:
+                # The writer lapped us - start again from the newest samples
+                self.overruns += 1
+                self._next = None
+                return 0
+            np.multiply(block, 1 / 32768.0, out=row)
+        self._next = complete
+
+        for stage in self._stages:
+            m = x.shape[-1]
+            if m == 0:
+                break
+            # "Fast" exponential time weighting of the squared samples
+            decay = math.exp(-1 / (self.tau * stage.rate))
+            for band in stage.bands:
+                y, band[2] = self._sosfilt(band[1], x, axis=-1, zi=band[2])
+                self._power[band[0]].add(np.square(y, out=y), decay)
+            if stage.lowpass is not None:
+                y, stage.state = self._sosfilt(stage.lowpass, x, axis=-1, zi=stage.state)
+                # Keep every other sample, continuing the previous block's pattern
+                x = y[:, stage.phase::2]
+                stage.phase = (stage.phase - m) % 2
+        return n
+
+    def skip(self):
+        """Move past the samples captured since the last call without filtering them"""
+        self._next = self._complete()
+
+    def result(self, out=None):
+        """Band levels (sine amplitude of equal power), written into out"""
+        if out is None:
+            out = np.empty(self._shape)
+        power = np.array([mean.mean() for mean in self._power])
+        np.sqrt(2 * power.T.reshape(self._shape), out=out)
+        return out
@@ -0,0 +1,189 @@
+"""
+Capture in a child process, isolated from the web server's GIL.
+
+In-process capture shares the interpreter with Taipy's server threads and the
+DSP. With many browsers connected, their work can delay the capture callback
+long enough for PortAudio to overflow. ProcessCapture moves the audio source
+into a dedicated child process that does nothing else:
+
+- the child owns the source and a SharedRingBuffer and is the only writer;
+  the GUI process attaches to the same memory and only reads it, following
+  the ring's sample counter like any other consumer
+- start, stop, device and buffer-size changes and health checks are small messages over a
+  ``multiprocessing.Pipe``; no audio ever goes through it
+- the child exits when asked to, or when the pipe breaks because the parent
+  is gone
+
+The source is built inside the child from a class and its keyword arguments
+(a PyAudio stream cannot be pickled), so ``ProcessCapture(PyAudioSource,
+device_index=2, channels=2)`` takes the same arguments as the source itself.
+"""
+
+import atexit
+import multiprocessing
+import os
+import threading
+import time
+
+from .audio_capture import AudioCapture
+from .audio_sources import PyAudioSource
+from .ring_buffer import SharedRingBuffer
+
+
+def _serve(conn, factory, kwargs, seconds):
+    """Child process main loop - build the source, then answer commands until closed"""
+    try:
+        source = factory(**kwargs)
+        ring = SharedRingBuffer(int(source.rate * seconds), channels=source.channels)
+    except Exception as e:
+        conn.send(("error", f"{type(e).__name__}: {e}"))
+        return
+    last_chunk = [0.0]
+
+    def on_chunk(samples, timestamp=None):
+        ring.write(samples, timestamp)
+        last_chunk[0] = time.monotonic()
+
+    conn.send(("ok", {"name": ring.name, "capacity": ring.capacity, "channels": ring.channels,
+                      "rate": source.rate, "chunk": source.chunk, "pid": os.getpid()}))
+    while True:
+        try:
+            command, arg = conn.recv()
+        except (EOFError, OSError):
+            break  # the parent is gone
+        try:
+            if command == "start":
+                source.start(on_chunk)
+                reply = source.running
+            elif command == "stop":
+                source.stop()
+                reply = False
+            elif command == "device":
+                # Same rate, chunk and channel count, so the ring buffer stays valid
+                replacement = factory(**dict(kwargs, device_index=arg))
+                was_running = source.running
+                source.stop()
+                try:
+                    if was_running:
+                        replacement.start(on_chunk)
+                except Exception:
+                    # Keep capturing from the old device rather than not at all
+                    source.start(on_chunk)
+                    raise
+                source = replacement
+                kwargs["device_index"] = arg
+                reply = arg
+            elif command == "chunk":
+                source.set_chunk(arg)
+                kwargs["chunk"] = source.chunk
+                reply = source.chunk
+            elif command == "health":
+                reply = {"running": source.running, "count": ring.count, "overflows": source.overflows,
+                         "gaps": source.gaps, "lost_samples": source.lost_samples, "pid": os.getpid(),
+                         "idle_seconds": time.monotonic() - last_chunk[0] if last_chunk[0] else None}
+            elif command == "close":
+                source.stop()
+                conn.send(("ok", None))
+                break
+            else:
+                raise ValueError(f"Unknown command {command!r}")
+            conn.send(("ok", reply))
+        except Exception as e:
+            conn.send(("error", f"{type(e).__name__}: {e}"))
+    ring.unlink()
+
+
+class ProcessCapture(AudioCapture):
+    """AudioCapture whose source runs in a child process, writing into shared memory
+
+    ``factory(**kwargs)`` is called in the child to build the AudioSource
+    (default: PyAudioSource). Everything that reads audio - ``buffer``,
+    ``latest()``, ``read_frames()``, ``channel()`` - works as for AudioCapture;
+    ``start()``, ``stop()``, ``set_device()`` and ``health()`` are sent to
+    the child over a pipe.
+    """
+
+    def __init__(self, factory=PyAudioSource, seconds=10.0, timeout=10.0, **kwargs):
+        context = multiprocessing.get_context("spawn")
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._conn, child = context.Pipe()
+        self._process = context.Process(target=_serve, args=(child, factory, kwargs, seconds),
+                                        name="capture", daemon=True)
+        self._process.start()
+        child.close()
+        info = self._reply("starting the capture process")
+        self.source = None
+        self.pid = info["pid"]
+        self.rate = info["rate"]
+        self.chunk = info["chunk"]
+        self.channels = info["channels"]
+        self.buffer = SharedRingBuffer.attach(info["name"], info["capacity"], channels=self.channels)
+        self.analysis = self.buffer
+        self.filters = None
+        self._running = False
+        atexit.register(self.close)
+
+    def _reply(self, what):
+        if not self._conn.poll(self.timeout):
+            raise RuntimeError(f"Capture process did not answer while {what}")
+        status, value = self._conn.recv()
+        if status == "error":
+            raise RuntimeError(f"Capture process failed while {what}: {value}")
+        return value
+
+    def _call(self, command, arg=None):
+        if not self._process.is_alive():
+            raise RuntimeError(f"Capture process {self.pid} has exited")
+        with self._lock:
+            self._conn.send((command, arg))
+            return self._reply(command)
+
+    @property
+    def alive(self):
+        return self._process.is_alive()
+
+    @property
+    def running(self):
+        return self._running and self._process.is_alive()
+
+    def start(self):
+        self._running = self._call("start")
+
+    def stop(self):
+        if self._process.is_alive():
+            self._call("stop")
+        self._running = False
+
+    def set_device(self, device_index):
+        """Switch the child's PyAudio source to another input device"""
+        return self._call("device", device_index)
+
+    def set_data_callback(self, callback):
+        """Not supported - chunks arrive in the child, readers follow the shared sample counter"""
+        return False
+
+    def enable_filters(self):
+        """Not supported - the chunks never pass through this process"""
+        return False
+
+    def set_chunk(self, chunk):
+        """Change the child source's frames per buffer"""
+        self.chunk = self._call("chunk", chunk)
+
+    def health(self):
+        """Child state: running, sample count, driver overflows and gaps, pid and seconds since the last chunk"""
+        if not self._process.is_alive():
+            return {"running": False, "count": self.buffer.count, "overflows": None, "gaps": None,
+                    "lost_samples": None, "pid": self.pid, "exitcode": self._process.exitcode}
+        return self._call("health")
+
+    def close(self):
+        """Stop the source and end the child process"""
+        if self._process.is_alive():
+            try:
+                self._call("close")
+            except (RuntimeError, OSError):
+                self._process.terminate()
+            self._process.join(self.timeout)
+        self._running = False
@@ -0,0 +1,95 @@
+"""
+Preallocated chart payloads for Taipy.
+
+Building two pandas DataFrames (and fresh ``range(CHUNK)`` x-axes) on every
+refresh costs more than the FFT itself. ChartData keeps the x-axis and two y
+buffers alive for the lifetime of the app; each refresh writes into the spare
+y buffer with ``out=`` NumPy operations and hands Taipy a new two-key dict that
+points at the existing arrays. Taipy sees a new object to bind, but no frame
+data is copied to build it.
+
+Multi-channel charts share the x-axis and keep one y row per channel, so a
+whole batch of spectra is written with one ``out=`` operation and published
+as one column per channel.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+
+@lru_cache(maxsize=None)
+def sample_axis(n):
+    """Read-only 0..n-1 axis, shared by every chart of that length"""
+    axis = np.arange(n, dtype=np.float64)
+    axis.setflags(write=False)
+    return axis
+
+
+class ChartData:
+    """x-axis plus double-buffered y values for one chart
+
+    Write the next frame into ``back()`` and bind the result of ``publish()``.
+    The buffer just published is not written again until the following frame
+    has been published, so a payload Taipy is still serialising never changes
+    underneath it. With ``dynamic_x=True`` the x values are double-buffered
+    too and the next frame's x goes into ``back_x()``.
+
+    With ``y_names`` the chart has one y column per name and ``back()`` is a
+    ``(len(y_names), len(x))`` array.
+    """
+
+    def __init__(self, x, x_name='x', y_name='y', dynamic_x=False, y_names=None):
+        self.x = x
+        self.x_name = x_name
+        self.y_name = y_name
+        self.y_names = tuple(y_names) if y_names else None
+        self._x = np.tile(np.asarray(x, dtype=np.float64), (2, 1)) if dynamic_x else None
+        rows = (len(self.y_names),) if self.y_names else ()
+        self._y = np.zeros((2,) + rows + (len(x),), dtype=np.float64)
+        self._front = 0
+
+    @classmethod
+    def waveform(cls, chunk, rate, x_name='x', y_name='y', y_names=None):
+        return cls(sample_axis(chunk), x_name, y_name, y_names=y_names)
+
+    @classmethod
+    def spectrum(cls, chunk, rate, x_name='x', y_name='y', y_names=None):
+        """Spectrum chart with a frequency axis in Hz (chunk // 2 + 1 rfft bins)"""
+        # Imported here so waveform-only users (the archive, console modes) never load SciPy
+        from .spectrum import frequency_axis
+
+        return cls(frequency_axis(chunk, rate), x_name, y_name, y_names=y_names)
+
+    @property
+    def y(self):
+        """The y values currently published"""
+        return self._y[self._front]
+
+    def back(self):
+        """The buffer the next frame should be written into"""
+        return self._y[1 - self._front]
+
+    def back_x(self):
+        """The x buffer for the next frame (dynamic_x charts only)"""
+        return self._x[1 - self._front]
+
+    def publish(self):
+        """Swap buffers and return a new payload to assign to the Taipy variable"""
+        self._front = 1 - self._front
+        x = self.x if self._x is None else self._x[self._front]
+        y = self._y[self._front]
+        if self.y_names:
+            return {self.x_name: x, **dict(zip(self.y_names, y))}
+        return {self.x_name: x, self.y_name: y}
+
+    def reset(self):
+        """Zero both buffers and return the resulting payload"""
+        self._y[:] = 0.0
+        return self.publish()
+
+
+@lru_cache(maxsize=None)
+def chart_pair(chunk, rate, y_names=None):
+    """Waveform and spectrum ChartData for one (CHUNK, RATE[, channels]), created once per process"""
+    return ChartData.waveform(chunk, rate, y_names=y_names), ChartData.spectrum(chunk, rate, y_names=y_names)
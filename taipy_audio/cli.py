@@ -0,0 +1,161 @@
+"""
+Command-line entry point: ``python -m taipy_audio <mode>``.
+
+    gui      live dashboard in the browser (Taipy)
+    meter    console level meter
+    record   record the input to WAV or FLAC files
+    analyze  levels and dominant frequencies of a WAV file
+    archive  convert a WAV file into a zoomable session archive
+
+Only argparse is imported up front. Each mode imports its own module when it
+runs, so ``meter`` never loads Taipy or pandas and only ``gui`` pays for them.
+``meter``, ``record`` and ``archive`` do not load SciPy either; ``analyze``
+does, for its FFT, whenever SciPy is installed.
+"""
+
+import argparse
+
+
+def add_source_args(parser):
+    group = parser.add_argument_group("input")
+    group.add_argument("--device", type=int, action="append",
+                       help="PyAudio input device index (default: system default); gui accepts it more than once")
+    group.add_argument("--channels", type=int, default=1,
+                       help="input channels per device - also keeps WAV channels apart (default: 1)")
+    group.add_argument("--wav", help="replay this WAV file instead of the microphone")
+    group.add_argument("--synth", metavar="KIND", help="generate a test signal: sine, chirp, white, pink or silence")
+    group.add_argument("--rate", type=int, default=44100, help="sample rate in Hz (default: 44100)")
+    group.add_argument("--chunk", type=int, default=512, help="samples per buffer (default: 512)")
+    group.add_argument("--capture-process", action="store_true",
+                       help="run the input in its own process, isolated from the GUI and DSP")
+
+
+def source_specs(args):
+    """(AudioSource class, keyword arguments) selected by --wav / --synth / --device, one per device"""
+    from .audio_sources import PyAudioSource, SyntheticSource, WavFileSource
+
+    if args.wav:
+        return [(WavFileSource, dict(path=args.wav, chunk=args.chunk, loop=True, mixdown=args.channels == 1))]
+    if args.synth:
+        return [(SyntheticSource, dict(kind=args.synth, rate=args.rate, chunk=args.chunk, channels=args.channels))]
+    return [(PyAudioSource, dict(rate=args.rate, chunk=args.chunk, device_index=device, channels=args.channels))
+            for device in args.device or [None]]
+
+
+def make_sources(args):
+    """The AudioSources selected by --wav / --synth / --device (one per device)"""
+    return [factory(**kwargs) for factory, kwargs in source_specs(args)]
+
+
+def make_source(args):
+    """The single AudioSource selected by --wav / --synth / --device"""
+    sources = make_sources(args)
+    if len(sources) > 1:
+        raise RuntimeError("Only the gui mode can capture from several devices")
+    return sources[0]
+
+
+def make_captures(args, seconds=10.0, single=False):
+    """With --capture-process: one ProcessCapture per device, else None"""
+    if not args.capture_process:
+        return None
+    specs = source_specs(args)
+    if single and len(specs) > 1:
+        raise RuntimeError("Only the gui mode can capture from several devices")
+    from .capture_process import ProcessCapture
+    return [ProcessCapture(factory, seconds=seconds, **kwargs) for factory, kwargs in specs]
+
+
+def run_gui(args):
+    from . import gui
+    captures = make_captures(args)
+    sources = None if captures else make_sources(args)
+    gui.main(sources, port=args.port, fps=args.fps, workers=args.workers, captures=captures,
+             adaptive=args.adaptive, async_mode=args.server, allow_unsafe_werkzeug=args.allow_unsafe_werkzeug)
+
+
+def run_meter(args):
+    from . import meter
+    captures = make_captures(args, seconds=max(1.0, 2 * args.interval), single=True)
+    meter.main(None if captures else make_source(args), seconds=args.seconds, interval=args.interval,
+               capture=captures[0] if captures else None)
+
+
+def run_record(args):
+    from . import record
+    max_bytes = None if args.rotate_mb is None else int(args.rotate_mb * 1024 * 1024)
+    captures = make_captures(args, single=True)
+    record.main(args.output, None if captures else make_source(args), seconds=args.seconds,
+                format=args.format, max_seconds=args.rotate_seconds, max_bytes=max_bytes,
+                capture=captures[0] if captures else None)
+
+
+def run_analyze(args):
+    from . import analyze
+    analyze.main(args.path, fft_size=args.fft_size, window=args.window, peaks=args.peaks)
+
+
+def run_archive(args):
+    from . import archive
+    session = archive.import_wav(args.path, args.output)
+    print(f"🗄️  {session.pcm_path}: {session.duration:.1f}s, {len(session.sizes)} pyramid levels")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="taipy_audio", description="Real-time audio monitor")
+    modes = parser.add_subparsers(dest="mode", required=True)
+
+    gui = modes.add_parser("gui", help="live dashboard in the browser")
+    add_source_args(gui)
+    gui.add_argument("--port", type=int, default=5000)
+    gui.add_argument("--fps", type=int, default=30, help="live push rate (default: 30)")
+    gui.add_argument("--workers", type=int, default=0,
+                     help="worker processes for the high-resolution spectrum (default: 0, off)")
+    gui.add_argument("--adaptive", action="store_true",
+                     help="grow the capture buffer and lower the push rate while dropouts occur")
+    gui.add_argument("--server", default="threading", choices=("threading", "gevent"),
+                     help="threading: Werkzeug, smoothest frames, for local use (default); "
+                          "gevent: Taipy's production server")
+    gui.add_argument("--allow-unsafe-werkzeug", action="store_true",
+                     help="let the threading server start without a terminal, e.g. as a service")
+    gui.set_defaults(run=run_gui)
+
+    meter = modes.add_parser("meter", help="console level meter")
+    add_source_args(meter)
+    meter.add_argument("--seconds", type=float, help="stop after this many seconds")
+    meter.add_argument("--interval", type=float, default=0.1, help="refresh interval in seconds")
+    meter.set_defaults(run=run_meter)
+
+    record = modes.add_parser("record", help="record the input to WAV or FLAC files")
+    add_source_args(record)
+    record.add_argument("output", help="file name stem, e.g. take.wav writes take-001.wav, take-002.wav, ...")
+    record.add_argument("--seconds", type=float, help="stop after this many seconds")
+    record.add_argument("--format", default="wav", choices=("wav", "flac", "pcm"),
+                        help="FLAC needs soundfile, pcm writes a zoomable session archive")
+    record.add_argument("--rotate-seconds", type=float, help="start a new file after this many seconds")
+    record.add_argument("--rotate-mb", type=float, help="start a new file after this many MB")
+    record.set_defaults(run=run_record)
+
+    analyze = modes.add_parser("analyze", help="levels and dominant frequencies of a WAV file")
+    analyze.add_argument("path", help="16-bit WAV file")
+    analyze.add_argument("--fft-size", type=int, default=4096)
+    # Listed here rather than imported from spectrum, which would load SciPy for every mode
+    analyze.add_argument("--window", default="hann",
+                         choices=("rectangular", "hann", "blackman-harris", "flat-top"))
+    analyze.add_argument("--peaks", type=int, default=5, help="how many frequencies to list")
+    analyze.set_defaults(run=run_analyze)
+
+    archive = modes.add_parser("archive", help="convert a WAV file into a zoomable session archive")
+    archive.add_argument("path", help="16-bit WAV file")
+    archive.add_argument("--output", help="archive .pcm path (default: next to the WAV file)")
+    archive.set_defaults(run=run_archive)
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        args.run(args)
+    except RuntimeError as e:
+        parser.exit(1, f"❌ {e}\n")
@@ -0,0 +1,189 @@
+"""
+Pixel-budgeted waveform decimation.
+
+Showing seconds of audio means hundreds of thousands of samples per refresh,
+far more than the chart has pixels. These helpers reduce any window to a fixed
+number of points:
+
+- min/max envelope: the lowest and highest sample of each bucket, in the
+  order they occurred, so peaks and clipping are never lost
+- LTTB (Largest-Triangle-Three-Buckets): one sample per bucket, chosen to
+  preserve the visual shape of the line
+
+``minmax_decimate()`` and ``lttb()`` work on any array. WaveformDecimator
+keeps a live ring-buffer window decimated incrementally: buckets are aligned
+to absolute sample numbers, so each update only processes the buckets that
+completed since the last one.
+"""
+
+import numpy as np
+
+from .chart_data import ChartData
+
+MODES = ("minmax", "lttb")
+
+
+def minmax_decimate(y, points):
+    """Min/max envelope of y as at most `points` values (two per bucket)
+
+    Returns (index, values); index is the sample position of each value.
+    """
+    y = np.asarray(y)
+    size = -(-len(y) // max(1, points // 2))
+    if size <= 2:
+        return np.arange(len(y)), y
+    buckets = len(y) // size
+    frames = y[:buckets * size].reshape(buckets, size)
+    lo_at = frames.argmin(axis=1)
+    hi_at = frames.argmax(axis=1)
+    first_at = np.minimum(lo_at, hi_at)
+    second_at = np.maximum(lo_at, hi_at)
+    rows = np.arange(buckets)
+    index = np.empty(2 * buckets, dtype=np.int64)
+    index[0::2] = rows * size + first_at
+    index[1::2] = rows * size + second_at
+    return index, y[index]
+
+
+def lttb(y, points, x=None):
+    """Largest-Triangle-Three-Buckets downsampling of y to `points` values
+
+    Returns (x, values) for the selected samples; x defaults to sample index.
+    The first and last samples are always kept.
+    """
+    y = np.asarray(y, dtype=np.float64)
+    x = np.arange(len(y), dtype=np.float64) if x is None else np.asarray(x, dtype=np.float64)
+    n = len(y)
+    if points >= n or points < 3:
+        return x, y
+
+    # Bucket edges for the n - 2 interior samples
+    edges = np.linspace(1, n - 1, points - 1).astype(np.int64)
+    starts, stops = edges[:-1], edges[1:]
+    # Average point of every bucket, computed in one pass with cumulative sums
+    cx = np.concatenate(([0.0], np.cumsum(x)))
+    cy = np.concatenate(([0.0], np.cumsum(y)))
+    counts = stops - starts
+    avg_x = (cx[stops] - cx[starts]) / counts
+    avg_y = (cy[stops] - cy[starts]) / counts
+    avg_x = np.append(avg_x[1:], x[-1])
+    avg_y = np.append(avg_y[1:], y[-1])
+
+    selected = np.empty(points, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+    a = 0
+    for i, (start, stop) in enumerate(zip(starts, stops)):
+        bx = x[start:stop]
+        by = y[start:stop]
+        area = np.abs((x[a] - avg_x[i]) * (by - y[a]) - (x[a] - bx) * (avg_y[i] - y[a]))
+        a = start + int(area.argmax())
+        selected[i + 1] = a
+    return x[selected], y[selected]
+
+
+class WaveformDecimator:
+    """Decimated view of the last `seconds` of a RingBuffer, updated incrementally
+
+    Produces `points` chart points: ``points // 2`` min/max pairs, or
+    ``points`` LTTB samples. The x-axis is in seconds relative to the newest
+    sample. Call ``update()`` once per tick; it only reads the samples of
+    buckets completed since the previous call.
+    """
+
+    def __init__(self, buffer, rate, seconds, points=2000, mode="minmax"):
+        if mode not in MODES:
+            raise ValueError(f"Unknown decimation mode {mode!r}, expected one of {MODES}")
+        self.buffer = buffer
+        self.rate = rate
+        self.mode = mode
+        self.buckets = points // 2 if mode == "minmax" else points
+        window = min(int(seconds * rate), buffer.capacity)
+        self.bucket_size = max(1, window // self.buckets)
+        self.seconds = self.buckets * self.bucket_size / rate
+        self._next = None
+        self.overruns = 0
+
+        n = self.buckets
+        if mode == "minmax":
+            self._first = np.zeros(n, dtype=np.int16)
+            self._second = np.zeros(n, dtype=np.int16)
+            offsets = np.tile([0.25, 0.75], n) + np.repeat(np.arange(-n, 0), 2)
+            self.chart = ChartData(offsets * self.bucket_size / rate)
+        else:
+            self._pos = np.zeros(n, dtype=np.int64)
+            self._val = np.zeros(n, dtype=np.int16)
+            self._last = (0, 0)
+            self.chart = ChartData(np.linspace(-self.seconds, 0, n), dynamic_x=True)
+
+    def update(self):
+        """Process the buckets completed since the last call"""
+        complete = self.buffer.count // self.bucket_size
+        if self._next is None or complete - self._next > self.buckets:
+            self._next = max(0, complete - self.buckets)
+            if self.mode == "lttb":
+                self._last = (self._next * self.bucket_size, 0)
+        if complete <= self._next:
+            return
+        block = self.buffer.read(self._next * self.bucket_size, complete * self.bucket_size)
+        if block is None:
+            # The writer lapped us - start again from the newest full window
+            self.overruns += 1
+            self._next = None
+            return self.update()
+        frames = block.reshape(-1, self.bucket_size)
+        if self.mode == "minmax":
+            self._update_minmax(frames)
+        else:
+            self._update_lttb(frames)
+
+    def _update_minmax(self, frames):
+        lo_at = frames.argmin(axis=1)
+        hi_at = frames.argmax(axis=1)
+        rows = np.arange(len(frames))
+        slots = (self._next + rows) % self.buckets
+        self._first[slots] = frames[rows, np.minimum(lo_at, hi_at)]
+        self._second[slots] = frames[rows, np.maximum(lo_at, hi_at)]
+        self._next += len(frames)
+
+    def _update_lttb(self, frames):
+        # A bucket's pick depends on the next bucket's average, so the newest
+        # complete bucket stays pending until its successor arrives
+        size = self.bucket_size
+        avg_y = frames.mean(axis=1)
+        avg_x = (size - 1) / 2 + size
+        bx = np.arange(size, dtype=np.float64)
+        a_pos, a_val = self._last
+        for j in range(len(frames) - 1):
+            k = self._next + j
+            ax = a_pos - k * size
+            by = frames[j].astype(np.float64)
+            area = np.abs((ax - avg_x) * (by - a_val) - (ax - bx) * (avg_y[j + 1] - a_val))
+            pick = int(area.argmax())
+            a_pos, a_val = k * size + pick, by[pick]
+            self._pos[k % self.buckets] = a_pos
+            self._val[k % self.buckets] = a_val
+        self._last = (a_pos, a_val)
+        self._next += len(frames) - 1
+
+    def _ring_order(self, values, out):
+        """Copy per-bucket values into out, oldest bucket first"""
+        k = self._next % self.buckets
+        n = self.buckets - k
+        out[:n] = values[k:]
+        out[n:] = values[:k]
+
+    def publish(self):
+        """Write the current window into the chart buffers and return the payload"""
+        y = self.chart.back()
+        if self.mode == "minmax":
+            self._ring_order(self._first, y[0::2])
+            self._ring_order(self._second, y[1::2])
+        else:
+            x = self.chart.back_x()
+            self._ring_order(self._pos, x)
+            x -= self.buffer.count
+            x /= self.rate
+            self._ring_order(self._val, y)
+        y *= 1 / 32768.0
+        return self.chart.publish()
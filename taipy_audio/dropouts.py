@@ -0,0 +1,141 @@
+"""
+Dropout accounting and adaptive buffer sizing.
+
+Audio or frames can be lost in four places. Each one is counted where it
+happens and never silently discarded:
+
+- overflows      the driver's input buffer overflowed before our callback ran
+                 (PortAudio's paInputOverflow status, ``AudioSource.overflows``)
+- gaps           the driver's ADC timestamps jumped by more than half a buffer
+                 between two callbacks (``AudioSource.gaps``, with the skipped
+                 sample count in ``lost_samples``)
+- overruns       the capture lapped a ring-buffer reader - spectrogram,
+                 averager, waveform decimators or VAD - before it read its
+                 samples, so it had to restart from the newest ones
+- skipped ticks  push ticks dropped because the previous one ran late
+                 (``LivePush.skipped_ticks``)
+
+DropoutMonitor turns the running totals into per-second rates. A
+BufferController can act on them: while dropouts keep happening it doubles
+the source's frames per buffer (fewer, larger callbacks, more slack for the
+driver) and halves the push rate, which is the analysis hop of the live
+spectrum; after a quiet stretch it steps back down. A loaded host then shows
+slower, coarser updates instead of spectra of broken audio.
+"""
+
+import time
+
+DROPOUTS = ("overflows", "gaps", "lost_samples", "overruns", "skipped_ticks")
+
+# Counters that are events; lost_samples only measures how long the gaps were
+_EVENTS = ("overflows", "gaps", "overruns", "skipped_ticks")
+
+
+class DropoutMonitor:
+    """Totals and per-second rates of the DROPOUTS counters
+
+    Call ``update(totals)`` periodically with the current totals.
+    """
+
+    def __init__(self):
+        self.totals = dict.fromkeys(DROPOUTS, 0)
+        self.rates = dict.fromkeys(DROPOUTS, 0.0)
+        self._checked = None
+
+    def update(self, totals, now=None):
+        now = time.monotonic() if now is None else now
+        if self._checked is not None and now > self._checked:
+            elapsed = now - self._checked
+            for key in DROPOUTS:
+                # A restarted source starts its counters again - never report a negative rate
+                self.rates[key] = max(0, totals[key] - self.totals[key]) / elapsed
+        self.totals = {key: totals[key] for key in DROPOUTS}
+        self._checked = now
+
+    @property
+    def events_per_second(self):
+        return sum(self.rates[key] for key in _EVENTS)
+
+    def text(self, rate):
+        """Totals for a status line, e.g. "2 overflow(s), 1 gap(s) (0.05 s lost)" """
+        totals = self.totals
+        parts = []
+        if totals["overflows"]:
+            parts.append(f"{totals['overflows']} overflow(s)")
+        if totals["gaps"]:
+            parts.append(f"{totals['gaps']} gap(s) ({totals['lost_samples'] / rate:.2f} s lost)")
+        if totals["overruns"]:
+            parts.append(f"{totals['overruns']} overrun(s)")
+        if totals["skipped_ticks"]:
+            parts.append(f"{totals['skipped_ticks']} skipped tick(s)")
+        return ", ".join(parts) or "none"
+
+
+class BufferController:
+    """Steps the capture buffer size and push rate up under dropouts and back down when calm
+
+    Level ``n`` runs the source with ``chunk * 2**n`` frames per buffer and
+    pushes at ``pipeline.fps / 2**n`` (at least ``min_fps``). The level goes up
+    after ``patience`` consecutive checks with at least ``raise_rate``
+    dropout events per second, and down after ``calm_seconds`` without any.
+    """
+
+    def __init__(self, pipeline, max_level=3, raise_rate=0.5, patience=2, calm_seconds=30.0, min_fps=5):
+        self.pipeline = pipeline
+        self.base_chunk = pipeline.capture.chunk
+        self.max_level = max_level
+        self.raise_rate = raise_rate
+        self.patience = patience
+        self.calm_seconds = calm_seconds
+        self.min_fps = min_fps
+        self.level = 0
+        self.changes = 0
+        self._strikes = 0
+        self._calm_since = None
+
+    @property
+    def chunk(self):
+        return self.base_chunk << self.level
+
+    @property
+    def fps(self):
+        return max(self.min_fps, self.pipeline.fps >> self.level)
+
+    def update(self, monitor, now=None):
+        """Move one level up or down if the dropout rate calls for it - True when it did"""
+        now = time.monotonic() if now is None else now
+        events = monitor.events_per_second
+        if events >= self.raise_rate:
+            self._calm_since = None
+            self._strikes += 1
+            if self._strikes >= self.patience and self.level < self.max_level:
+                return self.set_level(self.level + 1)
+            return False
+        self._strikes = 0
+        if events > 0 or self.level == 0:
+            self._calm_since = None
+            return False
+        if self._calm_since is None:
+            self._calm_since = now
+        elif now - self._calm_since >= self.calm_seconds:
+            return self.set_level(self.level - 1)
+        return False
+
+    def set_level(self, level):
+        level = min(max(int(level), 0), self.max_level)
+        changed = level != self.level
+        self.level = level
+        self._strikes = 0
+        self._calm_since = None
+        if changed:
+            self.changes += 1
+            if self.pipeline.capture.chunk != self.chunk:
+                self.pipeline.capture.set_chunk(self.chunk)
+            print(f"🎚️  Dropouts: buffer {self.chunk} frames, pushing at {self.fps} FPS (level {level})")
+        self.apply()
+        return changed
+
+    def apply(self):
+        """Push at the rate for the current level - call again when the target FPS changes"""
+        if self.pipeline.push is not None:
+            self.pipeline.push.set_fps(self.fps)
@@ -0,0 +1,128 @@
+"""
+Streaming log-mel and MFCC features for downstream classifiers.
+
+Classifiers used to get their features from recordings, recomputing every
+spectrum this app had already computed. FeatureExtractor takes the magnitude
+spectra the spectrogram computes for every chunk (see spectrogram.py) and
+turns each into
+
+- log-mel  power in ``n_mels`` triangular bands on the HTK mel scale, in dB
+- MFCC     the first ``n_mfcc`` coefficients of the log-mel frame's
+           orthonormal DCT-II (what ``librosa.feature.mfcc`` computes)
+
+The mel filterbank is cached per (FFT size, rate, n_mels, band limits) and
+the DCT matrix per (n_mels, n_mfcc), so a block of frames costs one matrix
+product for the filterbank and one for the DCT. Results go into two
+RingBuffers with one row per chunk - ``mels`` and ``mfccs`` - that other
+code reads like the audio ring buffer: follow ``count`` and ``read()`` the
+rows since the last call. Chunks the spectrogram skips (gated silence) are
+stored as silence, so rows stay one chunk apart.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+from .ring_buffer import RingBuffer
+from .spectrum import frequency_axis
+
+FEATURES = ("off", "log-mel", "mfcc")
+
+
+def hz_to_mel(hz):
+    return 2595.0 * np.log10(1.0 + np.asarray(hz) / 700.0)
+
+
+def mel_to_hz(mel):
+    return 700.0 * (10 ** (np.asarray(mel) / 2595.0) - 1.0)
+
+
+@lru_cache(maxsize=None)
+def mel_filterbank(size, rate, n_mels=40, fmin=20.0, fmax=None):
+    """(n_mels, bins) triangular filters with unit peaks and the band centres in Hz, read-only"""
+    fmax = rate / 2 if fmax is None else fmax
+    edges = mel_to_hz(np.linspace(hz_to_mel(fmin), hz_to_mel(fmax), n_mels + 2))
+    freqs = frequency_axis(size, rate)
+    lower, centre, upper = edges[:-2, None], edges[1:-1, None], edges[2:, None]
+    rising = (freqs - lower) / (centre - lower)
+    falling = (upper - freqs) / (upper - centre)
+    weights = np.clip(np.minimum(rising, falling), 0.0, None)
+    centres = edges[1:-1].copy()
+    weights.setflags(write=False)
+    centres.setflags(write=False)
+    return weights, centres
+
+
+@lru_cache(maxsize=None)
+def dct_matrix(n_mels, n_mfcc=13):
+    """(n_mfcc, n_mels) orthonormal DCT-II rows, read-only"""
+    k = np.arange(n_mfcc)[:, None]
+    n = np.arange(n_mels)[None, :]
+    matrix = np.cos(np.pi * k * (2 * n + 1) / (2 * n_mels)) * np.sqrt(2.0 / n_mels)
+    matrix[0] /= np.sqrt(2.0)
+    matrix.setflags(write=False)
+    return matrix
+
+
+class FeatureExtractor:
+    """Log-mel and MFCC rows for the magnitude spectra of ``size``-sample chunks
+
+    ``push()`` takes one ``(bins,)`` spectrum or a ``(frames, bins)`` block from
+    a SpectrumEngine of the same size. The newest ``history`` rows are kept.
+    """
+
+    def __init__(self, size, rate, n_mels=40, n_mfcc=13, history=1024, fmin=20.0, fmax=None, floor_db=-120.0):
+        self.size = size
+        self.rate = rate
+        self.n_mels = n_mels
+        self.n_mfcc = n_mfcc
+        self.floor_db = floor_db
+        self.filterbank, self.centres = mel_filterbank(size, rate, n_mels, fmin, fmax)
+        self.dct = dct_matrix(n_mels, n_mfcc)
+        self.mels = RingBuffer(history, dtype=np.float32, channels=n_mels)
+        self.mfccs = RingBuffer(history, dtype=np.float32, channels=n_mfcc)
+        silence = np.full(n_mels, floor_db)
+        self._silence = (silence, self.dct @ silence)
+
+    @property
+    def frames(self):
+        """Rows written since creation"""
+        return self.mels.count
+
+    def push(self, magnitude):
+        """Add the features of one spectrum or a block of them, oldest first"""
+        power = np.square(magnitude).reshape(-1, magnitude.shape[-1])
+        log_mel = power @ self.filterbank.T
+        np.maximum(log_mel, 10 ** (self.floor_db / 10), out=log_mel)
+        np.log10(log_mel, out=log_mel)
+        log_mel *= 10
+        self.mels.write(log_mel)
+        self.mfccs.write(log_mel @ self.dct.T)
+
+    def skip(self, frames):
+        """Add `frames` rows of silence for chunks that were not transformed"""
+        # The ring only stores (and converts) the newest `history` rows, however long the gap
+        if frames > 0:
+            self.mels.write(np.broadcast_to(self._silence[0], (frames, self.n_mels)))
+            self.mfccs.write(np.broadcast_to(self._silence[1], (frames, self.n_mfcc)))
+
+    def publish(self, kind="log-mel", frames=200, db_range=(-100.0, 0.0)):
+        """Heatmap payload of the newest `frames` rows, newest on the right
+
+        Bind it like the spectrogram's: ``type=heatmap|x=1/x|y=0/y|z=0/z``.
+        Log-mel rows are clipped to ``db_range``; MFCCs are sent as they are.
+        """
+        rings = {"log-mel": (self.mels, self.centres), "mfcc": (self.mfccs, np.arange(self.n_mfcc))}
+        if kind not in rings:
+            raise ValueError(f"Unknown feature {kind!r}, expected one of {FEATURES[1:]}")
+        ring, y = rings[kind]
+        frames = min(frames, ring.capacity)
+        rows = np.full((frames, ring.channels), db_range[0] if kind == "log-mel" else 0.0)
+        n = min(frames, ring.count)
+        if n:
+            rows[frames - n:] = ring.latest(n)[0]
+        if kind == "log-mel":
+            np.clip(rows, *db_range, out=rows)
+        np.round(rows, 1, out=rows)
+        times = (np.arange(frames) - (frames - 1)) * (self.size / self.rate)
+        return [{"z": rows.T.tolist(), "y": y}, {"x": times}]
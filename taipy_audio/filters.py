@@ -0,0 +1,173 @@
+"""
+Stateful filter chain applied to every captured chunk: gain, high-pass, A/C weighting.
+
+Levels and spectra are computed from whatever is in the ring buffer, so
+rumble (handling noise, HVAC, desk knocks) and the ear's frequency response
+have to be dealt with before the samples get there. FilterChain runs in the
+capture callback, the one place every sample passes exactly once and in
+order, and keeps each filter's state across chunks - a chunk boundary never
+shows up as a click:
+
+- gain       a flat gain in dB
+- highpass   Butterworth high-pass (default 80 Hz, 4th order) against rumble
+- weighting  IEC 61672 A- or C-weighting, normalised to 0 dB at 1 kHz
+
+Every filter is a cascade of second-order sections. ``design()`` builds
+them once per (rate, spec) and caches them; switching filters on and off
+from the GUI only stacks the cached sections of the enabled slots into one
+array, so each chunk - all channels at once - is one ``sosfilt()`` call.
+Filters that stay enabled keep their state through a toggle; one that is
+switched on starts from rest.
+
+The weighting curves are mapped to digital filters with the bilinear
+transform. At 44.1 kHz that is within 0.1 dB of the standard curve up to
+4 kHz and runs increasingly low towards Nyquist (-0.7 dB at 8 kHz, -1.5 dB
+at 10 kHz), where speech has little energy.
+"""
+
+import threading
+from functools import lru_cache
+
+import numpy as np
+
+# Filters run in this order, whatever order they were enabled in
+SLOTS = ("gain", "highpass", "weighting")
+WEIGHTINGS = ("A", "C")
+
+# IEC 61672-1 pole frequencies (Hz) of the analog weighting curves
+_F1, _F2, _F3, _F4 = 20.598997, 107.65265, 737.86223, 12194.217
+
+
+def gain(db):
+    """Spec for a flat gain of `db` decibels"""
+    return ("gain", float(db))
+
+
+def highpass(cutoff=80.0, order=4):
+    """Spec for a Butterworth high-pass"""
+    return ("highpass", float(cutoff), int(order))
+
+
+def weighting(curve):
+    """Spec for A- or C-weighting"""
+    if curve not in WEIGHTINGS:
+        raise ValueError(f"Unknown weighting {curve!r}, expected one of {WEIGHTINGS}")
+    return ("weighting", curve)
+
+
+def _weighting_sos(rate, curve):
+    from scipy.signal import bilinear_zpk, sosfreqz, zpk2sos
+
+    poles = [_F1, _F1, _F4, _F4] if curve == "C" else [_F1, _F1, _F2, _F3, _F4, _F4]
+    zeros = [0.0] * (2 if curve == "C" else 4)
+    z, p, k = bilinear_zpk(zeros, [-2 * np.pi * f for f in poles], 1.0, rate)
+    sos = zpk2sos(z, p, k)
+    _, response = sosfreqz(sos, worN=[1000.0], fs=rate)
+    sos[0, :3] /= abs(response[0])
+    return sos
+
+
+@lru_cache(maxsize=None)
+def design(rate, spec):
+    """Second-order sections for one filter spec at one sample rate - designed once, read-only"""
+    kind = spec[0]
+    if kind == "gain":
+        sos = np.array([[10 ** (spec[1] / 20), 0.0, 0.0, 1.0, 0.0, 0.0]])
+    elif kind == "highpass":
+        from scipy.signal import butter
+
+        _, cutoff, order = spec
+        if not 0 < cutoff < rate / 2:
+            raise ValueError(f"High-pass cutoff {cutoff} Hz is outside 0..{rate / 2:.0f} Hz")
+        sos = butter(order, cutoff, btype="highpass", fs=rate, output="sos")
+    elif kind == "weighting":
+        sos = _weighting_sos(rate, spec[1])
+    else:
+        raise ValueError(f"Unknown filter {kind!r}")
+    sos.setflags(write=False)
+    return sos
+
+
+class FilterChain:
+    """Cascade of the enabled filters over (frames, channels) blocks, with state across blocks
+
+    ``set(slot, spec)`` enables a slot with a spec from ``gain()``,
+    ``highpass()`` or ``weighting()``; ``set(slot, None)`` disables it. It is
+    safe to call from any thread while ``process()`` runs on the capture thread.
+    """
+
+    def __init__(self, rate, channels=1):
+        from scipy.signal import sosfilt
+
+        self._sosfilt = sosfilt
+        self.rate = rate
+        self.channels = channels
+        self.specs = dict.fromkeys(SLOTS)
+        self._lock = threading.Lock()
+        # Bumped by set() and reset(); process() rebuilds when its copy is older
+        self._version = 0
+        self._built = 0
+        self._restart = False
+        # (slots with their section counts, stacked sections, state) - only process() touches it
+        self._active = ((), None, None)
+
+    @property
+    def enabled(self):
+        return any(spec is not None for spec in self.specs.values())
+
+    def set(self, slot, spec):
+        if slot not in SLOTS:
+            raise ValueError(f"Unknown filter slot {slot!r}, expected one of {SLOTS}")
+        if spec is not None:
+            design(self.rate, spec)  # fail here, not on the capture thread
+        with self._lock:
+            if spec == self.specs[slot]:
+                return
+            self.specs[slot] = spec
+            self._version += 1
+
+    def reset(self):
+        """Forget the filter state - the next block starts from rest"""
+        with self._lock:
+            self._restart = True
+            self._version += 1
+
+    def _rebuild(self):
+        # Runs on the processing thread, so the state it keeps is never being written meanwhile
+        with self._lock:
+            specs = dict(self.specs)
+            keep_state = not self._restart
+            self._restart = False
+            self._built = self._version
+        layout, sections, state = self._active
+        kept = {}
+        if keep_state and state is not None:
+            row = 0
+            for slot, spec, n in layout:
+                kept[(slot, spec)] = state[row:row + n]
+                row += n
+        new_layout, new_sections, new_state = [], [], []
+        for slot in SLOTS:
+            spec = specs[slot]
+            if spec is None:
+                continue
+            sos = design(self.rate, spec)
+            new_layout.append((slot, spec, len(sos)))
+            new_sections.append(sos)
+            new_state.append(kept.get((slot, spec), np.zeros((len(sos), 2, self.channels))))
+        if not new_layout:
+            self._active = ((), None, None)
+            return
+        self._active = (tuple(new_layout), np.vstack(new_sections), np.concatenate(new_state))
+
+    def process(self, block):
+        """Filtered float64 copy of a mono or (frames, channels) block - the block itself when all are off"""
+        if self._built != self._version:
+            self._rebuild()
+        layout, sections, state = self._active
+        if sections is None:
+            return block
+        x = np.asarray(block, dtype=np.float64).reshape(-1, self.channels)
+        y, state = self._sosfilt(sections, x, axis=0, zi=state)
+        self._active = (layout, sections, state)
+        return y.reshape(np.shape(block))
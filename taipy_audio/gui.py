@@ -0,0 +1,477 @@
+"""
+Live audio dashboard - waveform, spectrum and spectrogram pushed to every browser.
+
+Run with ``python -m taipy_audio gui``.
+"""
+
+import time
+from string import Template
+
+from taipy.gui import Gui
+
+from .archive import SessionArchive, list_sessions
+from .audio_capture import AudioCapture, CaptureGroup
+from .averaging import AVERAGES
+from .bands import BANDS
+from .decimate import MODES
+from .features import FEATURES
+from .filters import WEIGHTINGS, gain, highpass, weighting
+from .pipeline import DEFAULT_VIEW, SharedPipeline
+from .recorder import StreamRecorder
+from .spectrum import SCALES, WINDOWS
+
+# Audio configuration
+CHUNK = 512
+RATE = 44100
+
+# Voice activity detection - how far above the tracked noise floor counts as voice
+VAD_MARGIN_DB = 9.0
+# Skip FFT and chart pushes while nobody is speaking (steady test tones never count as voice)
+GATE_SILENCE = True
+
+# Rumble filter used by the High-Pass toggle (see filters.py)
+HIGHPASS_HZ = 80.0
+HIGHPASS_ORDER = 4
+NO_WEIGHTING = "Z (none)"
+
+# Live push configuration
+TARGET_FPS = 30
+# Send each frame's capture time (time.monotonic()) as frame_time - for load tests on the same host
+STAMP_FRAMES = False
+# Web server. "threading" (Werkzeug) delivers frames pushed from a plain thread as they come,
+# but it is a development server: without a terminal it only starts with ALLOW_UNSAFE_WERKZEUG.
+# "gevent" is Taipy's production server (installed with Taipy); frames may arrive in bursts.
+ASYNC_MODE = "threading"
+ALLOW_UNSAFE_WERKZEUG = False
+# Taipy binds page variables and callbacks from the frame the Gui is created
+# in, so it is created here rather than inside main(), which only adds the page
+gui = Gui()
+
+# Waveform history - longer windows are decimated to a fixed point budget
+WAVE_POINTS = 2000  # ~2x the chart width in pixels
+HISTORY_OPTIONS = {"1 chunk": 0, "2 s": 2, "5 s": 5, "10 s": 10}
+
+# Spectrogram - one column per chunk, the heatmap is re-sent at a lower rate
+SPECTROGRAM_HISTORY = {"200 frames": 200, "400 frames": 400, "800 frames": 800}
+SPECTROGRAM_FPS = 5
+
+# One capture + DSP pipeline for the whole process - every browser session
+# gets the same frames, computed once per tick
+capture = AudioCapture(rate=RATE, chunk=CHUNK)
+pipeline = SharedPipeline(capture, CHUNK, RATE, fps=TARGET_FPS, wave_points=WAVE_POINTS,
+                          spectrogram_fps=SPECTROGRAM_FPS, filters=True)
+
+# Per-session display variables - the push thread assigns them in each State
+wave_df = pipeline.wave_chart.publish()
+spec_df = pipeline.spec_chart.publish()
+spectrogram_data = pipeline.spectrogram.publish()
+running = False
+last_count = 0
+last_audio_level = 0.0
+updates_count = 0
+viewers = 0
+
+# Recording to disk - one shared recorder, written from its own thread
+RECORDINGS_DIR = "recordings"
+recorder = None
+save_status = "Not saving"
+capture_status = "Stopped"
+latency_table = pipeline.latency.table()
+dropout_status = "none"
+delivery_status = "full rate"
+
+# Archived sessions - browsed through their zoom pyramids, never loaded into RAM
+archives = {}
+archive_names = [path.stem for path in list_sessions(RECORDINGS_DIR)]
+archive_name = ""
+archive_duration = 1.0
+archive_range = [0, 1.0]
+
+def start_recording(state):
+    print("🎬 Starting recording...")
+    if pipeline.join(state):
+        print("🎤 Recording started - speak now!")
+        print(f"📊 Voice margin: {pipeline.vad.on_db:.0f} dB above the noise floor")
+        print(f"✅ Pushing live updates at {pipeline.fps} FPS")
+    state.running = True
+    state.viewers = len(pipeline.listeners)
+
+def stop_recording(state):
+    print("⏹️  Stopping recording...")
+    if pipeline.leave(state):
+        print("✅ Recording stopped")
+    else:
+        print(f"👥 Still streaming to {len(pipeline.listeners)} other session(s)")
+    state.running = False
+
+def recording_status():
+    """Status hook - what the recorder is doing, sent with every frame"""
+    if recorder is None or not recorder.running:
+        return {"save_status": save_status}
+    st = recorder.status()
+    text = f"{st['file']} - {st['seconds']:.0f}s saved"
+    if st["overruns"]:
+        text += f" - ⚠️ {st['dropped_seconds']:.1f}s dropped (disk too slow)"
+    return {"save_status": text}
+
+def capture_health():
+    """Status hook - where capture runs and, for a capture process, whether it is alive"""
+    health = pipeline.health
+    if not health:
+        return {"capture_status": capture_status}
+    if "error" in health:
+        return {"capture_status": f"❌ {health['error']}"}
+    if "exitcode" in health:
+        return {"capture_status": f"❌ capture process {health['pid']} exited ({health['exitcode']})"}
+    where = f"process {health['pid']}" if "pid" in health else "in-process"
+    if pipeline.controller is not None:
+        where += f", {capture.chunk}-frame buffers"
+    return {"capture_status": where}
+
+def start_saving(state):
+    """Start writing the shared capture to disk"""
+    global recorder
+    if recorder is not None and recorder.running:
+        return
+    stem = time.strftime("session-%Y%m%d-%H%M%S")
+    # Session archives are mono - the first channel is saved
+    recorder = StreamRecorder(capture.raw_channel(0), capture.rate, f"{RECORDINGS_DIR}/{stem}.pcm",
+                              format="pcm", max_seconds=3600)
+    pipeline.hold("recorder")
+    recorder.start()
+    state.save_status = f"Saving to {RECORDINGS_DIR}/"
+
+def stop_saving(state):
+    """Finalize the current recording"""
+    global save_status
+    if recorder is None or not recorder.running:
+        return
+    recorder.stop()
+    pipeline.release("recorder")
+    st = recorder.status()
+    save_status = f"Saved {st['seconds']:.0f}s in {st['files']} file(s)"
+    state.save_status = save_status
+    refresh_archives(state)
+
+def _archive(name):
+    """Open archived sessions once - they are read-only memory maps shared by all sessions"""
+    if name not in archives:
+        archives[name] = SessionArchive(f"{RECORDINGS_DIR}/{name}.pcm")
+    return archives[name]
+
+def refresh_archives(state):
+    state.archive_names = [path.stem for path in list_sessions(RECORDINGS_DIR)]
+
+def open_archive(state, var_name, value):
+    """Show an archived session in the waveform chart instead of the live input"""
+    if not value:
+        return
+    archive = _archive(value)
+    pipeline.set_view(state, source="archive")
+    with state:
+        state.archive_duration = round(archive.duration, 1)
+        state.archive_range = [0, state.archive_duration]
+        state.wave_df = archive.zoom(0, None, WAVE_POINTS)
+    print(f"🗄️  Opened {value} ({archive.duration:.0f}s)")
+
+def zoom_archive(state, var_name, value):
+    """Redraw the archived session for the selected time range"""
+    if not state.archive_name:
+        return
+    start, end = value
+    state.wave_df = _archive(state.archive_name).zoom(start, end, WAVE_POINTS)
+
+def back_to_live(state):
+    pipeline.set_view(state, source="live")
+
+def change_fps(state, var_name, value):
+    """Change the live push rate (shared by all sessions)"""
+    pipeline.set_fps(value)
+    print(f"⏱️  Target FPS: {pipeline.fps}")
+
+def adjust_vad_margin(state, var_name, value):
+    """Adjust voice detection sensitivity (shared by all sessions)"""
+    pipeline.vad.on_db = float(value)
+    print(f"🎚️  Voice margin: {value} dB above the noise floor")
+
+def toggle_gate(state, var_name, value):
+    """Skip FFT and chart updates while nobody is speaking (shared by all sessions)"""
+    pipeline.gate = bool(value)
+    print(f"🔇 Silence gating: {'on' if value else 'off'}")
+
+def toggle_highpass(state, var_name, value):
+    """Filter out rumble below HIGHPASS_HZ (shared by all sessions)"""
+    if pipeline.set_filter("highpass", highpass(HIGHPASS_HZ, HIGHPASS_ORDER) if value else None):
+        print(f"🧹 High-pass at {HIGHPASS_HZ:.0f} Hz: {'on' if value else 'off'}")
+
+def change_weighting(state, var_name, value):
+    """A-, C- or no frequency weighting before levels and spectra (shared by all sessions)"""
+    if pipeline.set_filter("weighting", weighting(value) if value in WEIGHTINGS else None):
+        print(f"👂 Weighting: {value}")
+
+def change_gain(state, var_name, value):
+    """Input gain in dB (shared by all sessions)"""
+    if pipeline.set_filter("gain", gain(value) if value else None):
+        print(f"🔊 Gain: {value:+.0f} dB")
+
+def change_window(state, var_name, value):
+    """Select the FFT window (shared by all sessions)"""
+    pipeline.set_window(value)
+    print(f"🪟 FFT window: {value}")
+
+def change_scale(state, var_name, value):
+    """Select magnitude, power or dB output for this session"""
+    pipeline.set_view(state, scale=value)
+    print(f"📐 Spectrum scale: {value}")
+
+def change_average(state, var_name, value):
+    """Show the live, averaged, peak-hold or max-hold spectrum in this session"""
+    pipeline.set_view(state, average=value)
+    print(f"📈 Spectrum averaging: {value}")
+
+def change_bands(state, var_name, value):
+    """Show octave or third-octave band levels in this session"""
+    pipeline.set_view(state, bands=value)
+    print(f"🎼 Bands: {value}")
+
+def toggle_band_filters(state, var_name, value):
+    """Measure bands with filter banks instead of the FFT (shared by all sessions)"""
+    pipeline.set_band_filters(value)
+    print(f"🎚️  Band filter bank: {'on' if value else 'off'}")
+
+def reset_averages(state):
+    """Restart the averages and held peaks (shared by all sessions)"""
+    pipeline.averager.reset()
+    print("🔁 Spectrum averages reset")
+
+def change_history(state, var_name, value):
+    """Select how much waveform history this session shows"""
+    pipeline.set_view(state, history=HISTORY_OPTIONS[value])
+    print(f"🕰️  Waveform history: {value}")
+
+def change_decimation(state, var_name, value):
+    """Switch between min/max envelope and LTTB decimation for this session"""
+    pipeline.set_view(state, decimation=value)
+    print(f"📉 Decimation: {value}")
+
+def change_channels(state, var_name, value):
+    """Select which channels this session plots"""
+    pipeline.set_view(state, channels=set(value))
+    print(f"🎛️  Channels: {', '.join(value) or 'none'}")
+
+def change_features(state, var_name, value):
+    """Show the log-mel or MFCC features in this session"""
+    pipeline.set_view(state, features=value)
+    print(f"🧬 Features: {value}")
+
+def change_spectrogram_history(state, var_name, value):
+    """Select how many frames the spectrogram keeps (shared by all sessions)"""
+    pipeline.set_spectrogram_history(SPECTROGRAM_HISTORY[value])
+    print(f"🌊 Spectrogram history: {value} ({pipeline.spectrogram.seconds:.1f} s)")
+
+def change_db_range(state, var_name, value):
+    """Set the dB range shown by the spectrogram"""
+    pipeline.spectrogram.set_range(*value)
+    low, high = pipeline.spectrogram.db_range
+    print(f"🌈 Spectrogram range: {low:.0f} to {high:.0f} dB")
+
+# Global variables for display
+vad_margin = VAD_MARGIN_DB
+gate_enabled = GATE_SILENCE
+highpass_enabled = False
+weighting_name = NO_WEIGHTING
+weighting_names = [NO_WEIGHTING, *WEIGHTINGS]
+gain_db = 0
+frame_time = 0.0
+voice_active = False
+noise_floor_db = -120.0
+fps_value = TARGET_FPS
+window_name = pipeline.spectrum.window
+window_names = list(WINDOWS)
+scale_name = pipeline.spectrum.scale
+scale_names = list(SCALES)
+average_mode = "off"
+average_modes = list(AVERAGES)
+bands_name = DEFAULT_VIEW["bands"]
+bands_names = list(BANDS)
+band_filters = False
+bands_df = pipeline.band_chart(bands_name).reset()
+history_name = "1 chunk"
+history_names = list(HISTORY_OPTIONS)
+decimation_mode = "minmax"
+decimation_modes = list(MODES)
+spectrogram_history = "200 frames"
+spectrogram_histories = list(SPECTROGRAM_HISTORY)
+db_range = list(pipeline.spectrogram.db_range)
+features_name = DEFAULT_VIEW["features"]
+features_names = list(FEATURES)
+features_data = pipeline.features.publish("log-mel", pipeline.spectrogram.history)
+channel_labels = list(pipeline.labels or ())
+channel_selection = list(channel_labels)
+
+# High-resolution spectrum, filled in by worker processes when offloading is on
+hires_df = {"x": [], "y": []}
+
+# Chart traces and the channel selector depend on how many channels are captured
+CHANNEL_CONTROLS = """
+**Channels:** <|{channel_selection}|selector|lov={channel_labels}|multiple|on_change=change_channels|>
+"""
+
+HIRES_SECTION = """
+## High-Resolution Spectrum (worker processes)
+8192-point Welch average of the last 2 s, first channel
+
+<|{hires_df}|chart|x=x|y=y|height=300px|>
+"""
+
+# Only on the page with STAMP_FRAMES - Taipy sends variables the page shows
+STAMP_SECTION = """
+<|{frame_time}|text|render=False|>
+"""
+
+def build_page(labels, hires=False):
+    """Dashboard markdown with one chart trace per channel (a single y column for mono)"""
+    hires_section = HIRES_SECTION if hires else ""
+    if not labels:
+        return PAGE.substitute(traces="y=y", channel_controls="", hires_section=hires_section)
+    traces = "|".join(f"y[{i}]={name}" for i, name in enumerate(labels, 1))
+    return PAGE.substitute(traces=traces, channel_controls=CHANNEL_CONTROLS, hires_section=hires_section)
+
+PAGE = Template("""
+# 🎙️ Real-Time Audio Monitor
+
+<|Start Recording|button|on_action=start_recording|>
+<|Stop Recording|button|on_action=stop_recording|>
+<|Save to Disk|button|on_action=start_saving|>
+<|Stop Saving|button|on_action=stop_saving|>
+
+**Voice Margin (dB):** <|{vad_margin}|slider|min=3|max=30|step=1|on_change=adjust_vad_margin|>
+**Pause During Silence:** <|{gate_enabled}|toggle|on_change=toggle_gate|>
+**Target FPS:** <|{fps_value}|slider|min=5|max=60|step=5|on_change=change_fps|>
+
+**High-Pass (rumble):** <|{highpass_enabled}|toggle|on_change=toggle_highpass|>
+**Weighting:** <|{weighting_name}|selector|lov={weighting_names}|dropdown|on_change=change_weighting|>
+**Gain (dB):** <|{gain_db}|slider|min=-20|max=40|step=1|on_change=change_gain|>
+$channel_controls
+## Waveform (Time Domain)
+**History:** <|{history_name}|selector|lov={history_names}|dropdown|on_change=change_history|>
+**Decimation:** <|{decimation_mode}|selector|lov={decimation_modes}|dropdown|on_change=change_decimation|>
+
+<|{wave_df}|chart|x=x|$traces|height=300px|>
+
+**Archive:** <|{archive_name}|selector|lov={archive_names}|dropdown|on_change=open_archive|>
+<|Refresh|button|on_action=refresh_archives|>
+<|Back to Live|button|on_action=back_to_live|>
+**Zoom (s):** <|{archive_range}|slider|min=0|max={archive_duration}|step=0.1|on_change=zoom_archive|>
+
+## Spectrum (Frequency Domain)
+**Window:** <|{window_name}|selector|lov={window_names}|dropdown|on_change=change_window|>
+**Scale:** <|{scale_name}|selector|lov={scale_names}|dropdown|on_change=change_scale|>
+**Averaging:** <|{average_mode}|selector|lov={average_modes}|dropdown|on_change=change_average|>
+<|Reset Averages|button|on_action=reset_averages|>
+
+<|{spec_df}|chart|x=x|$traces|height=300px|>
+$hires_section
+## Octave Bands
+**Bands:** <|{bands_name}|selector|lov={bands_names}|dropdown|on_change=change_bands|>
+**Filter Bank (accurate low bands):** <|{band_filters}|toggle|on_change=toggle_band_filters|>
+
+<|{bands_df}|chart|type=bar|x=x|$traces|height=300px|>
+
+## Spectrogram
+**History:** <|{spectrogram_history}|selector|lov={spectrogram_histories}|dropdown|on_change=change_spectrogram_history|>
+**dB Range:** <|{db_range}|slider|min=-140|max=0|step=5|on_change=change_db_range|>
+
+<|{spectrogram_data}|chart|type=heatmap|x=1/x|y=0/y|z=0/z|height=300px|>
+
+## Mel Features
+**Features:** <|{features_name}|selector|lov={features_names}|dropdown|on_change=change_features|>
+
+<|{features_data}|chart|type=heatmap|x=1/x|y=0/y|z=0/z|height=300px|>
+
+**Live Status:**
+- 🎤 Current Audio Level: <|{last_audio_level:.4f}|text|>
+- 🗣️ Voice Active: <|{voice_active}|text|>
+- 🌫️ Noise Floor: <|{noise_floor_db:.1f}|text|> dBFS
+- 📊 Samples Captured: <|{last_count}|text|>
+- 🔄 Updates Count: <|{updates_count}|text|>
+- ▶️ Recording: <|{running}|text|>
+- 👥 Viewers: <|{viewers}|text|>
+- 🩺 Capture: <|{capture_status}|text|>
+- 🕳️ Dropouts: <|{dropout_status}|text|>
+- 📶 Delivery: <|{delivery_status}|text|>
+- 💾 Saving: <|{save_status}|text|>
+
+**Latency** (capture to chart, ms):
+<|{latency_table}|table|show_all|>
+
+**Instructions:**
+1. Click "Start Recording"
+2. Speak into your microphone - the charts update live
+3. Raise the voice margin if room noise keeps the charts running
+4. Lower the target FPS on slow machines or networks
+""")
+
+page = build_page(pipeline.labels)
+
+def main(source=None, port=5000, fps=TARGET_FPS, workers=0, captures=None, adaptive=False,
+         async_mode=ASYNC_MODE, allow_unsafe_werkzeug=ALLOW_UNSAFE_WERKZEUG):
+    """Serve the dashboard, capturing from the microphone or the given AudioSource(s)
+
+    A list of sources (one per input device) is captured as one CaptureGroup
+    and shares the same pipeline and push scheduler. ``captures`` passes
+    ready-made captures instead, such as ProcessCaptures. ``workers > 0`` runs
+    the high-resolution spectrum in that many worker processes. ``adaptive``
+    grows the capture buffer and lowers the push rate while dropouts occur.
+    ``async_mode`` and ``allow_unsafe_werkzeug`` choose the web server (see
+    ASYNC_MODE).
+    """
+    global capture, pipeline, wave_df, spec_df, spectrogram_data, bands_df, features_data, fps_value
+    global page, channel_labels, channel_selection, latency_table, gate_enabled
+    if captures is None and (source is not None or workers):
+        # Offloaded analyzers read the capture from shared memory
+        sources = source if isinstance(source, (list, tuple)) else [source]
+        captures = [AudioCapture(source=s, shared=workers > 0) for s in sources]
+    if captures:
+        capture = captures[0] if len(captures) == 1 else CaptureGroup(captures)
+        pipeline = SharedPipeline(capture, capture.chunk, capture.rate, fps=fps,
+                                  wave_points=WAVE_POINTS, spectrogram_fps=SPECTROGRAM_FPS, filters=True)
+        if not pipeline.filters:
+            print("⚠️  Filters are not available when capturing in a separate process")
+        wave_df = pipeline.wave_chart.publish()
+        spec_df = pipeline.spec_chart.publish()
+        spectrogram_data = pipeline.spectrogram.publish()
+        features_data = pipeline.features.publish("log-mel", pipeline.spectrogram.history)
+        bands_df = pipeline.band_chart(bands_name).reset()
+        latency_table = pipeline.latency.table()
+        channel_labels = list(pipeline.labels or ())
+        channel_selection = list(channel_labels)
+        page = build_page(pipeline.labels)
+        if pipeline.labels:
+            print(f"🎛️  {pipeline.channels} channels: {', '.join(channel_labels)}")
+    if workers:
+        pipeline.enable_offload(captures[0].buffer, workers)
+        page = build_page(pipeline.labels, hires=True)
+        print(f"🧵 High-resolution spectrum on {workers} worker process(es)")
+    pipeline.fps = fps_value = fps
+    if adaptive:
+        pipeline.enable_adaptive()
+        print("🎚️  Adaptive buffer sizing on")
+    pipeline.vad.on_db = VAD_MARGIN_DB
+    pipeline.gate = gate_enabled = GATE_SILENCE
+    pipeline.stamp_frames = STAMP_FRAMES
+    pipeline.status_hooks.append(recording_status)
+    pipeline.status_hooks.append(capture_health)
+    print("🚀 Starting audio monitor...")
+    print("💡 Charts are pushed to every browser - no refresh button needed!")
+    if STAMP_FRAMES:
+        page += STAMP_SECTION
+    gui.add_pages({"/": page})
+    pipeline.attach(gui)
+    # Frames are pushed from a plain thread: under gevent its websocket writes
+    # wait for the next hub wakeup and arrive in bursts, hence threads by default
+    gui.run(port=port, async_mode=async_mode, allow_unsafe_werkzeug=allow_unsafe_werkzeug)
+
+
+if __name__ == "__main__":
+    main()
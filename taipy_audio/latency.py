@@ -0,0 +1,105 @@
+"""
+Fixed-size latency histograms for the capture -> chart path.
+
+Each stage of a push tick records how long it took into a LatencyHistogram:
+log-spaced bins from 10 µs to 10 s (24 per decade, so percentiles are within
+about 10% of the true value). Recording is one log10 and one counter
+increment, memory never grows, and p50/p95/p99 come from the cumulative
+counts. LatencyTracker keeps one histogram per stage name.
+
+Stages recorded by SharedPipeline:
+
+- capture   age of the newest sample when the tick starts (ADC -> analysis)
+- convert   reading, deinterleaving and scaling the chunk
+- fft       the spectrum FFT
+- payload   decimation, rescaling, spectrogram and chart payloads
+- assign    handing one frame to one session's State
+- total     age of the newest sample once a session's State has been assigned
+
+Taipy sends the assigned values over its websocket when the ``with state:``
+block ends, so ``assign`` and ``total`` stop there; browser rendering time
+is not visible to the server.
+"""
+
+import math
+
+import numpy as np
+
+STAGES = ("capture", "convert", "fft", "payload", "assign", "total")
+
+
+class LatencyHistogram:
+    """Counts of latencies in log-spaced bins between `low` and `high` seconds"""
+
+    def __init__(self, low=1e-5, high=10.0, per_decade=24):
+        self.low = low
+        self.per_decade = per_decade
+        self._log_low = math.log10(low)
+        self.bins = int(round((math.log10(high) - self._log_low) * per_decade))
+        # Upper edge of every bin; under- and overflow land in the first and last bin
+        self.edges = low * 10 ** (np.arange(1, self.bins + 1) / per_decade)
+        self.counts = np.zeros(self.bins, dtype=np.int64)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def record(self, seconds):
+        if seconds > 0:
+            index = int((math.log10(seconds) - self._log_low) * self.per_decade)
+            index = min(max(index, 0), self.bins - 1)
+        else:
+            index = 0
+        self.counts[index] += 1
+        self.count += 1
+        self.sum += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    @property
+    def mean(self):
+        return self.sum / self.count if self.count else 0.0
+
+    def percentile(self, q):
+        """Upper edge of the bin holding the q-th percentile (q in 0..100), 0 when empty"""
+        if not self.count:
+            return 0.0
+        rank = math.ceil(q / 100 * self.count)
+        index = int(np.searchsorted(np.cumsum(self.counts), max(rank, 1)))
+        return min(float(self.edges[index]), self.max)
+
+    def reset(self):
+        self.counts[:] = 0
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+
+class LatencyTracker:
+    """One LatencyHistogram per stage - record each stage from a single thread"""
+
+    def __init__(self, stages=STAGES):
+        self.histograms = {stage: LatencyHistogram() for stage in stages}
+
+    def record(self, stage, seconds):
+        self.histograms[stage].record(seconds)
+
+    def summary(self):
+        """{stage: {"p50", "p95", "p99", "max" (seconds), "count"}}"""
+        return {
+            stage: {"p50": h.percentile(50), "p95": h.percentile(95), "p99": h.percentile(99),
+                    "max": h.max, "count": h.count}
+            for stage, h in self.histograms.items()
+        }
+
+    def table(self):
+        """Summary in milliseconds as columns, ready for a Taipy table"""
+        summary = self.summary()
+        columns = {"stage": list(summary)}
+        for key in ("p50", "p95", "p99", "max"):
+            columns[key + " (ms)"] = [round(s[key] * 1000, 2) for s in summary.values()]
+        columns["count"] = [s["count"] for s in summary.values()]
+        return columns
+
+    def reset(self):
+        for histogram in self.histograms.values():
+            histogram.reset()
@@ -0,0 +1,226 @@
+"""
+Event-driven server push to every connected Taipy client.
+
+Updating ``state`` from a background thread fails with Flask application
+context errors, which is why the dashboards used to need a manual
+"UPDATE CHARTS" button. LivePush goes through ``Gui.broadcast_callback()``
+(or the ``deliver`` it is given) instead: Taipy sets up the application
+context and invokes the callback with each client's State.
+
+One asyncio event loop, on its own thread, schedules the push as stages:
+
+- capture handoff  the capture callback calls ``notify()`` for every chunk;
+                   it only wakes the loop when the loop is waiting for data,
+                   so a stopped or stalled source costs no wakeups at all
+- analysis         at each tick deadline (the target FPS), once new data has
+                   arrived, ``render()`` builds the newest frame; whatever the
+                   capture wrote between two ticks is coalesced into it
+- publish          the frame is delivered to the clients while the next one
+                   is being analysed
+
+Analysis and publishing each run in their own single worker thread, so a
+slow delivery - Taipy's State updates can take longer than a tick - no
+longer delays the next analysis. While a delivery runs, the next render is
+timed (from running averages of both) to finish as the delivery does, so
+the overlap adds throughput without leaving a frame to go stale. Only one
+frame waits between the two: analysis of the frame after next starts once
+publishing has taken the next one, so a frame's chart buffers
+(double-buffered, see chart_data.py) are never rewritten while they are
+being sent. ``stop()`` cancels the stages, waits for a render or
+delivery in progress to finish and closes the loop; it is safe to call from
+any thread, any number of times.
+
+The capture side never waits on any of it - they only share the lock-free
+ring buffer. Captures that cannot call back in this process (a capture in
+a child process) leave ``wake_on_data`` off, and the analysis stage runs on
+the deadline alone; ``render()`` returns None when there is nothing new.
+"""
+
+import asyncio
+import contextlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Weight of the newest duration in the render and delivery time averages
+_SMOOTHING = 0.2
+
+
+def _apply_frame(state, values):
+    """Broadcast callback - assign all frame variables in one batch"""
+    with state:
+        for name, value in values.items():
+            state.assign(name, value)
+
+
+class LivePush:
+    """Event-loop push scheduler delivering ``render()`` results to all clients at a target FPS
+
+    ``render()`` runs on the analysis thread and returns a dict of state
+    variable names to values, or None when there is nothing new to show. By
+    default the frame is broadcast to every client as is; pass ``deliver`` to
+    hand it to the clients some other way (it runs on the publish thread).
+    """
+
+    def __init__(self, gui, render, fps=30, deliver=None, wake_on_data=False):
+        self.gui = gui
+        self.render = render
+        self.deliver = deliver or self.broadcast
+        self.fps = fps
+        self.wake_on_data = wake_on_data
+        self.frames = 0
+        self.skipped_ticks = 0
+        self._loop = None
+        self._thread = None
+        self._pools = ()
+        self._lock = threading.Lock()
+        self._arrivals = 0
+        self._waiting = False
+        self._render_seconds = 0.0
+        self._publish_seconds = 0.0
+        self._publish_started = 0.0
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def set_fps(self, fps):
+        self.fps = max(1, int(fps))
+
+    def broadcast(self, values):
+        self.gui.broadcast_callback(_apply_frame, [values])
+
+    def notify(self):
+        """New data is in the ring buffer - called from the capture callback, for every chunk"""
+        self._arrivals += 1
+        if self._waiting:
+            self._waiting = False
+            try:
+                self._loop.call_soon_threadsafe(self._data.set)
+            except (AttributeError, RuntimeError):
+                pass  # stopped in the meantime
+
+    def start(self):
+        with self._lock:
+            if self.running:
+                return
+            self._shutdown()  # a loop whose thread died
+            self._waiting = False
+            self._data, self._taken, self._ready, self._idle, self._stopping = (asyncio.Event() for _ in range(5))
+            self._taken.set()
+            self._idle.set()
+            self._frame = None
+            self._pools = (ThreadPoolExecutor(1, thread_name_prefix="push-analysis"),
+                           ThreadPoolExecutor(1, thread_name_prefix="push-publish"))
+            self._loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(target=self._loop.run_until_complete, args=(self._run(),),
+                                            name="push", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        with self._lock:
+            self._shutdown()
+
+    def _shutdown(self):
+        if self._thread is None:
+            return
+        if not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._stopping.set)
+        self._thread.join()
+        self._loop.close()
+        # Let a render or delivery in progress finish - unless it is the one calling stop()
+        inside = threading.current_thread().name.startswith("push-")
+        for pool in self._pools:
+            pool.shutdown(wait=not inside)
+        self._loop = self._thread = None
+
+    async def _run(self):
+        stages = [asyncio.ensure_future(self._analysis()), asyncio.ensure_future(self._publish())]
+        stopping = asyncio.ensure_future(self._stopping.wait())
+        await asyncio.wait([stopping, *stages], return_when=asyncio.FIRST_COMPLETED)
+        for task in (stopping, *stages):
+            task.cancel()
+        for task in stages:
+            if not task.cancelled() and task.done() and task.exception() is not None:
+                print(f"❌ Push stopped: {task.exception()}")
+        await asyncio.gather(stopping, *stages, return_exceptions=True)
+
+    async def _new_data(self, seen):
+        """Wait until the capture has delivered a chunk after the `seen`-th one - True if it had to wait"""
+        if self._arrivals != seen:
+            return False
+        self._data.clear()
+        self._waiting = True
+        try:
+            # Recheck: a chunk that arrived before the flag was set did not notify
+            if self._arrivals == seen:
+                await self._data.wait()
+                return True
+            return False
+        finally:
+            self._waiting = False
+
+    async def _analysis(self):
+        loop = asyncio.get_running_loop()
+        pool = self._pools[0]
+        seen = -1
+        next_tick = loop.time()
+        while True:
+            delay = next_tick - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if self.wake_on_data:
+                if await self._new_data(seen):
+                    # Idle until now - the tick cadence restarts with the data
+                    next_tick = max(next_tick, loop.time())
+                seen = self._arrivals
+            # The frame before this one still has to be taken by the publish stage
+            await self._taken.wait()
+            await self._until_publish_ends(loop)
+            started = loop.time()
+            try:
+                frame = await loop.run_in_executor(pool, self.render)
+            except Exception as e:
+                print(f"❌ Push error: {e}")
+                frame = None
+            self._render_seconds += _SMOOTHING * (loop.time() - started - self._render_seconds)
+            if frame:
+                self._frame = frame
+                self._taken.clear()
+                self._ready.set()
+
+            period = 1.0 / self.fps
+            next_tick += period
+            now = loop.time()
+            if now > next_tick:
+                # Running late - drop the missed ticks rather than bursting to catch up
+                missed = int((now - next_tick) / period) + 1
+                self.skipped_ticks += missed
+                next_tick += missed * period
+
+    async def _until_publish_ends(self, loop):
+        """While a delivery runs, wait until a render started now would finish as it does"""
+        if self._idle.is_set():
+            return
+        lead = self._publish_started + self._publish_seconds - self._render_seconds - loop.time()
+        if lead > 0:
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._idle.wait(), lead)
+
+    async def _publish(self):
+        loop = asyncio.get_running_loop()
+        pool = self._pools[1]
+        while True:
+            await self._ready.wait()
+            self._ready.clear()
+            frame, self._frame = self._frame, None
+            self._taken.set()
+            self._idle.clear()
+            self._publish_started = loop.time()
+            try:
+                await loop.run_in_executor(pool, self.deliver, frame)
+                self.frames += 1
+            except Exception as e:
+                print(f"❌ Push error: {e}")
+            finally:
+                self._idle.set()
+            self._publish_seconds += _SMOOTHING * (loop.time() - self._publish_started - self._publish_seconds)
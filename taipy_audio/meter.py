@@ -0,0 +1,36 @@
+"""
+Console level meter - peak and RMS of the input, no GUI.
+"""
+
+import time
+
+import numpy as np
+
+from .audio_capture import AudioCapture
+
+
+def level_db(value):
+    """Full-scale level of a 0..1 value in dBFS"""
+    return 20 * np.log10(max(value, 1e-6))
+
+
+def main(source=None, seconds=None, interval=0.1, capture=None):
+    """Print a level bar every `interval` seconds, for `seconds` (None runs until Ctrl+C)"""
+    capture = capture or AudioCapture(source=source, seconds=max(1.0, 2 * interval))
+    window = int(capture.rate * interval)
+    print("🎤 Level meter - press Ctrl+C to stop")
+    capture.start()
+    deadline = None if seconds is None else time.monotonic() + seconds
+    try:
+        while deadline is None or time.monotonic() < deadline:
+            time.sleep(interval)
+            samples, _ = capture.latest(window)
+            peak = np.abs(samples.astype(np.int32)).max() / 32768.0
+            rms = np.sqrt(np.mean(np.square(samples, dtype=np.float64))) / 32768.0
+            bar = "█" * int(max(0.0, 60 + level_db(rms)) * 50 / 60)
+            print(f"Peak {level_db(peak):6.1f} dBFS  RMS {level_db(rms):6.1f} dBFS {bar:<50}", end="\r")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        capture.stop()
+        print("\n🛑 Stopped")
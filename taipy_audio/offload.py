@@ -0,0 +1,216 @@
+"""
+Heavy analysis in worker processes, reading audio straight from shared memory.
+
+The capture callback, the Taipy/Flask server threads and the NumPy DSP all
+share one interpreter and one GIL, so a long FFT on the push thread delays
+everything else. AnalyzerPool moves selected analyzers into a
+ProcessPoolExecutor instead:
+
+- the capture writes into a SharedRingBuffer; each worker attaches to it once,
+  so a job is just ``(analyzer, start, stop)`` in absolute sample numbers and
+  no audio is ever pickled
+- each analyzer has one ResultSlot, a shared-memory array guarded by a
+  sequence counter (a seqlock): the worker bumps the counter to odd, writes,
+  and bumps it to even; the reader copies and keeps the copy only if the
+  counter was even and unchanged. No locks, no queues, no result pickling.
+- an analyzer that is still running when it is due again is skipped rather
+  than queued, so a slow analyzer lowers its own update rate and never
+  builds a backlog that could hold up capture
+
+Analyzer functions must be importable module-level functions, because worker
+processes are started with "spawn" (forking a process that runs web-server
+threads is not safe).
+"""
+
+import atexit
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+import numpy as np
+
+from .ring_buffer import SharedRingBuffer
+from .spectrum import SpectrumEngine
+
+
+class ResultSlot:
+    """Fixed-size float64 result in shared memory, one writer, any number of readers"""
+
+    def __init__(self, size, name=None):
+        from multiprocessing import shared_memory
+
+        self.size = int(size)
+        self.owner = name is None
+        nbytes = 8 * (self.size + 1)
+        self.shm = shared_memory.SharedMemory(name=name, create=self.owner, size=nbytes if self.owner else 0)
+        self._seq = np.ndarray((1,), dtype=np.int64, buffer=self.shm.buf)
+        self._values = np.ndarray((self.size,), dtype=np.float64, buffer=self.shm.buf, offset=8)
+        if self.owner:
+            self._seq[0] = 0
+            atexit.register(self.unlink)
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    @property
+    def seq(self):
+        """Number of results written so far, times two"""
+        return int(self._seq[0])
+
+    def write(self, values):
+        seq = int(self._seq[0])
+        self._seq[0] = seq + 1
+        self._values[:] = values
+        self._seq[0] = seq + 2
+
+    def read(self, out):
+        """Copy the latest result into out - returns its sequence number, or None if it was being written"""
+        before = int(self._seq[0])
+        if before & 1:
+            return None
+        out[:] = self._values
+        return before if int(self._seq[0]) == before else None
+
+    def unlink(self):
+        try:
+            self.shm.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class Analyzer:
+    """One offloaded analysis stage
+
+    ``func(samples, rate, **kwargs)`` gets the last ``window`` int16 samples
+    and returns ``size`` floats. It is run again every ``hop`` new samples.
+    """
+
+    def __init__(self, name, func, window, hop, size, **kwargs):
+        self.name = name
+        self.func = func
+        self.window = int(window)
+        self.hop = int(hop)
+        self.size = int(size)
+        self.kwargs = kwargs
+
+
+@lru_cache(maxsize=None)
+def _engine(size, rate):
+    return SpectrumEngine(size, rate, workers=1)
+
+
+def welch_spectrum(samples, rate, fft_size=8192):
+    """Power spectrum in dB averaged over 50%-overlapping frames (Welch's method)"""
+    x = samples.astype(np.float64)
+    x *= 1 / 32768.0
+    frames = np.lib.stride_tricks.sliding_window_view(x, fft_size)[::fft_size // 2]
+    magnitude = _engine(fft_size, rate).compute(frames)
+    power = np.mean(np.square(magnitude, out=magnitude), axis=0)
+    return 10 * np.log10(np.maximum(power, 1e-12))
+
+
+def hires_analyzer(rate, fft_size=8192, seconds=2.0, per_second=4):
+    """High-resolution Welch spectrum over the last `seconds`, `per_second` times a second"""
+    return Analyzer("hires", welch_spectrum, window=max(fft_size, int(seconds * rate)),
+                    hop=rate // per_second, size=fft_size // 2 + 1, fft_size=fft_size)
+
+
+# --- worker process side -------------------------------------------------------
+
+_worker = {}
+
+
+def _attach(ring, channel, rate, analyzers, slots):
+    """Pool initializer - attach to the shared ring and result slots once per worker"""
+    name, capacity, dtype, channels = ring
+    buffer = SharedRingBuffer.attach(name, capacity, dtype, channels)
+    _worker["ring"] = buffer
+    _worker["buffer"] = buffer.channel(channel)
+    _worker["rate"] = rate
+    _worker["analyzers"] = analyzers
+    _worker["slots"] = {key: ResultSlot(size, slot_name) for key, (slot_name, size) in slots.items()}
+
+
+def _run(name, start, stop):
+    """Run one analyzer on samples [start, stop) - False when they were overwritten first"""
+    buffer = _worker["buffer"]
+    samples = buffer.read(start, stop)
+    if samples is None:
+        return False
+    func, kwargs = _worker["analyzers"][name]
+    result = func(samples, _worker["rate"], **kwargs)
+    if not buffer.is_intact(stop, stop - start):
+        return False
+    _worker["slots"][name].write(result)
+    return True
+
+
+# --- capture process side ------------------------------------------------------
+
+class AnalyzerPool:
+    """Runs Analyzers on a SharedRingBuffer in worker processes
+
+    Call ``submit()`` once per tick to start the analyzers that are due, and
+    ``result(name, out)`` to pick up a new result if one arrived. ``channel``
+    selects which channel of a multi-channel buffer is analysed.
+    """
+
+    def __init__(self, buffer, rate, analyzers, workers=2, channel=0):
+        if not isinstance(buffer, SharedRingBuffer):
+            raise TypeError("AnalyzerPool needs a SharedRingBuffer (AudioCapture(shared=True))")
+        self.buffer = buffer
+        self.rate = rate
+        self.analyzers = {a.name: a for a in analyzers}
+        for a in analyzers:
+            if a.window > buffer.capacity:
+                raise ValueError(f"Analyzer {a.name!r} needs {a.window} samples, the ring buffer holds {buffer.capacity}")
+        self.slots = {a.name: ResultSlot(a.size) for a in analyzers}
+        self.skipped = dict.fromkeys(self.analyzers, 0)
+        self.lost = dict.fromkeys(self.analyzers, 0)
+        self._pending = {}
+        self._last = dict.fromkeys(self.analyzers, 0)
+        self._seen = dict.fromkeys(self.analyzers, 0)
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_attach,
+            initargs=(
+                (buffer.name, buffer.capacity, buffer.dtype.str, buffer.channels),
+                channel,
+                rate,
+                {a.name: (a.func, a.kwargs) for a in analyzers},
+                {name: (slot.name, slot.size) for name, slot in self.slots.items()},
+            ),
+        )
+
+    def submit(self):
+        """Start every analyzer that is due and not still busy on a worker"""
+        count = self.buffer.count
+        for name, analyzer in self.analyzers.items():
+            if count < analyzer.window or count - self._last[name] < analyzer.hop:
+                continue
+            future = self._pending.get(name)
+            if future is not None:
+                if not future.done():
+                    self.skipped[name] += 1
+                    continue
+                if future.exception() is not None:
+                    print(f"❌ Analyzer {name} failed: {future.exception()}")
+                elif not future.result():
+                    self.lost[name] += 1
+            self._last[name] = count
+            self._pending[name] = self._executor.submit(_run, name, count - analyzer.window, count)
+
+    def result(self, name, out):
+        """Copy a result newer than the last one picked up into out - True if there was one"""
+        seq = self.slots[name].read(out)
+        if seq is None or seq == self._seen[name]:
+            return False
+        self._seen[name] = seq
+        return True
+
+    def close(self):
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        for slot in self.slots.values():
+            slot.unlink()
@@ -0,0 +1,501 @@
+"""
+One capture and DSP pipeline per process, shared by every dashboard session.
+
+Each browser tab is a separate Taipy State. Pointing a module-level
+``gui_state`` at whichever client clicked Start last leaves the other tabs
+without updates, and one tab's Stop used to stop capture for everybody.
+
+SharedPipeline owns the capture, the FFT and the chart buffers. On every push
+tick it reads the ring buffer once and computes each product once: one
+waveform per history/decimation setting, one spectrum per scale and one set
+of octave or third-octave band levels (see bands.py) per band setting that
+some session is looking at, plus the spectrogram (and the mel and MFCC
+features of its frames, see features.py) and, when a session asks for them,
+averaged or peak/max-hold spectra built from every chunk since the previous
+tick. The frame is then delivered to every listening session, which only
+picks the products matching its own view settings - twenty viewers on the
+same settings cost one computation. Delivery goes through a SessionSender
+(see backpressure.py), so a browser that cannot keep up gets the newest frame
+at a lower rate and resolution instead of a growing queue.
+
+Analyzers too heavy for the push thread can run in worker processes
+(``enable_offload()``, see offload.py); the tick only starts them and picks
+up finished results.
+
+With ``filters=True`` the capture runs every chunk through a FilterChain
+(gain, high-pass, A/C weighting - see filters.py) before anything here
+reads it, and ``set_filter()`` switches those filters while running.
+
+With ``gate`` on, the voice-activity detector decides first: during silence
+the tick does no FFT, decimation or chart work at all and only sends a small
+status update every ``idle_interval`` seconds.
+
+Multi-channel captures (one interleaved device, or several devices in a
+CaptureGroup) go through the same tick: all channels are deinterleaved into
+one ``(channels, chunk)`` array and transformed by one batched FFT, and each
+chart carries one column per channel. Sessions choose which of those columns
+they are sent. The VAD and the spectrogram follow the first channel.
+
+Every tick is traced (see latency.py): how old the newest sample is when
+the tick starts, how long conversion, FFT and payload building take, and how
+long after capture each session's State has its new values. Once a second
+the capture's health and every dropout counter are checked as well (see
+dropouts.py); with ``enable_adaptive()`` a BufferController reacts to them.
+
+Start and Stop are per session. Capture runs while at least one session is
+listening (or another consumer, like the recorder, holds it) and stops when
+the last one leaves. A session whose browser closes or disconnects leaves
+on its own: the SessionSender reports it once its websocket has been gone
+for a few seconds, and the once-a-second check (or, with capture stopped,
+the next new session) catches the others, so their listener and view
+settings are dropped.
+"""
+
+import threading
+import time
+
+from taipy.gui import get_state_id
+
+from .averaging import SpectrumAverager
+from .backpressure import SessionSender, thin
+from .bands import FRACTIONS, BandAnalyzer, BandFilterBank
+from .chart_data import ChartData, chart_pair
+from .decimate import WaveformDecimator
+from .dropouts import BufferController, DropoutMonitor
+from .features import FeatureExtractor
+from .latency import LatencyTracker
+from .live_push import LivePush
+from .spectrogram import Spectrogram
+from .spectrum import SpectrumEngine, frequency_axis
+from .vad import VoiceActivityDetector
+
+DEFAULT_VIEW = {"history": 0, "decimation": "minmax", "scale": "magnitude", "average": "off",
+                "bands": "third-octave", "features": "off", "source": "live", "channels": None}
+
+
+class SharedPipeline:
+    """Capture plus DSP computed once per tick and fanned out to all sessions
+
+    Call ``attach(gui)`` once the Gui exists, then ``join(state)`` /
+    ``leave(state)`` from the Start and Stop callbacks and ``set_view(state,
+    ...)`` when a session changes one of its ``DEFAULT_VIEW`` settings.
+    """
+
+    def __init__(self, capture, chunk, rate, fps=30, wave_points=2000,
+                 spectrogram_history=200, spectrogram_fps=5, filters=False):
+        self.capture = capture
+        # Before any reader takes its ring buffer: with filters they all read the filtered one
+        self.filters = bool(filters) and capture.enable_filters()
+        self.chunk = chunk
+        self.rate = rate
+        self.fps = fps
+        self.wave_points = wave_points
+        self.spectrogram_fps = spectrogram_fps
+        self.channels = capture.channels
+        # Mono charts keep their single "y" column, multi-channel ones get a column per channel
+        self.labels = tuple(capture.labels) if self.channels > 1 else None
+
+        self.wave_chart, self.spec_chart = chart_pair(chunk, rate, self.labels)
+        self.spectrum = SpectrumEngine(chunk, rate)
+        self._scaled = {}
+        self._decimators = {}
+        self.primary = capture.channel(0)
+        # Log-mel and MFCC rows of every spectrogram frame, for the chart and for other code to read
+        self.features = FeatureExtractor(chunk, rate)
+        self.spectrogram = Spectrogram(self.primary, rate, chunk, spectrogram_history, features=self.features)
+        self.vad = VoiceActivityDetector(self.primary, rate, chunk)
+        self.averager = SpectrumAverager([capture.channel(c) for c in range(self.channels)], rate, chunk)
+        # Band levels come from the live FFT, or from filter banks with band_filters on
+        self.band_filters = False
+        self._band_analyzers = {}
+        self._band_banks = {}
+        self._band_charts = {}
+        self.gate = True
+        self.idle_interval = 1.0
+        self.stamp_frames = False
+
+        self.views = {}
+        self.listeners = set()
+        self.holders = set()
+        self.status_hooks = []
+        self.latency = LatencyTracker()
+        self.check_interval = 1.0
+        self.dropouts = DropoutMonitor()
+        self.controller = None
+        self.health = {}
+        self.offload = None
+        self.hires_chart = None
+        self.gui = None
+        self.push = None
+        self.sender = None
+        self._lock = threading.Lock()
+
+        self.last_count = 0
+        self.audio_level = 0.0
+        self.updates_count = 0
+        self._last_spectrogram = 0.0
+        self._spectrogram_sent = None
+        self._last_idle = 0.0
+        self._last_check = 0.0
+        self._retired_overruns = 0
+        self._was_active = False
+
+    def attach(self, gui):
+        self.gui = gui
+        self.push = LivePush(gui, self.render, fps=self.fps, deliver=self.deliver)
+        # Wake the analysis stage when a chunk arrives instead of polling the ring buffer
+        self.push.wake_on_data = self.capture.set_data_callback(self.push.notify)
+        self.sender = SessionSender(gui, self._apply, fps=self.fps)
+
+    @property
+    def running(self):
+        return self.capture.running
+
+    # --- sessions -----------------------------------------------------------
+
+    def view(self, state):
+        """View settings of one session (defaults until it changes one)"""
+        state_id = get_state_id(state)
+        if state_id not in self.views and self.sender is not None:
+            # A new session - also when capture is stopped and nothing else checks, forget departed ones
+            self._disconnected(self.sender.disconnected(set(self.views) | set(self.listeners)))
+        return self.views.setdefault(state_id, dict(DEFAULT_VIEW))
+
+    def set_view(self, state, **settings):
+        unknown = set(settings) - set(DEFAULT_VIEW)
+        if unknown:
+            raise ValueError(f"Unknown view settings {sorted(unknown)}")
+        self.view(state).update(settings)
+
+    def join(self, state):
+        """Start sending frames to this session, starting capture if it is the first"""
+        self.view(state)
+        with self._lock:
+            self.listeners.add(get_state_id(state))
+            return self._update_running()
+
+    def leave(self, state):
+        """Stop sending frames to this session, stopping capture after the last one"""
+        return self._leave(get_state_id(state))
+
+    def _leave(self, state_id):
+        with self._lock:
+            self.listeners.discard(state_id)
+            if self.sender is not None:
+                self.sender.forget(state_id)
+            return self._update_running()
+
+    def _disconnected(self, state_ids):
+        """Sessions whose browser has gone away: leave for them and forget their view settings"""
+        for state_id in state_ids:
+            self._leave(state_id)
+            self.views.pop(state_id, None)
+
+    def hold(self, name):
+        """Keep capture running for a non-GUI consumer such as the recorder"""
+        with self._lock:
+            self.holders.add(name)
+            return self._update_running()
+
+    def release(self, name):
+        with self._lock:
+            self.holders.discard(name)
+            return self._update_running()
+
+    def _update_running(self):
+        """Start or stop capture to match demand - True when it changed"""
+        wanted = bool(self.listeners or self.holders)
+        if wanted == self.capture.running:
+            return False
+        if wanted:
+            self.capture.start()
+            self.push.start()
+        else:
+            self.push.stop()
+            self.capture.stop()
+        return True
+
+    def enable_offload(self, buffer, workers=2):
+        """Run the high-resolution spectrum in worker processes reading `buffer` (a SharedRingBuffer)"""
+        from .offload import AnalyzerPool, hires_analyzer
+
+        analyzer = hires_analyzer(self.rate)
+        self.offload = AnalyzerPool(buffer, self.rate, [analyzer], workers)
+        self.hires_chart = ChartData(frequency_axis(analyzer.kwargs["fft_size"], self.rate))
+
+    def enable_adaptive(self, **settings):
+        """Grow the capture buffer and lower the push rate while dropouts keep happening"""
+        self.controller = BufferController(self, **settings)
+
+    def set_fps(self, fps):
+        self.push.set_fps(fps)
+        self.fps = self.push.fps
+        if self.controller is not None:
+            self.controller.apply()
+
+    def set_filter(self, slot, spec):
+        """Enable or (with spec None) disable one filter slot for everybody - False if unsupported"""
+        if not self.filters:
+            return False
+        self.capture.set_filter(slot, spec)
+        return True
+
+    def set_window(self, name):
+        self.spectrum.set_window(name)
+        self.spectrogram.set_window(name)
+        self.averager.set_window(name)
+        for analyzer in self._band_analyzers.values():
+            analyzer.set_window(name)
+
+    def set_band_filters(self, enabled):
+        """Measure bands with multi-rate filter banks (accurate low bands) instead of the live FFT"""
+        self.band_filters = bool(enabled)
+
+    def set_spectrogram_history(self, history):
+        self._retired_overruns += self.spectrogram.overruns
+        self.spectrogram = self.spectrogram.resized(history)
+
+    # --- push stages ---------------------------------------------------------
+
+    def _waveform(self, history, mode):
+        """Decimators (one per channel) for one history setting, created the first time a session asks"""
+        key = (history, mode)
+        if key not in self._decimators:
+            # LTTB picks different x positions per channel, so shared-axis charts use min/max
+            mode = mode if self.channels == 1 else "minmax"
+            self._decimators[key] = [WaveformDecimator(self.capture.channel(c), self.rate, history,
+                                                       self.wave_points, mode)
+                                     for c in range(self.channels)]
+        return self._decimators[key]
+
+    def _decimated(self, decimators):
+        for decimator in decimators:
+            decimator.update()
+        if self.labels is None:
+            return decimators[0].publish()
+        payloads = [decimator.publish() for decimator in decimators]
+        return {"x": payloads[0]["x"], **{name: p["y"] for name, p in zip(self.labels, payloads)}}
+
+    def band_chart(self, name):
+        """Bar chart of one BANDS setting, x being the nominal band frequencies"""
+        if name not in self._band_charts:
+            analyzer = BandAnalyzer(self.chunk, self.rate, FRACTIONS[name], self.spectrum.window)
+            self._band_analyzers[name] = analyzer
+            self._band_charts[name] = ChartData(list(analyzer.labels), y_names=self.labels)
+        return self._band_charts[name]
+
+    def _band_levels(self, name, magnitude):
+        """Band levels in dBFS for one BANDS setting, written into its chart"""
+        out = self.band_chart(name).back()
+        if self.band_filters:
+            if name not in self._band_banks:
+                self._band_banks[name] = BandFilterBank(
+                    [self.capture.channel(c) for c in range(self.channels)], self.rate, FRACTIONS[name])
+            bank = self._band_banks[name]
+            bank.update()
+            bank.result(out=out)
+        else:
+            self._band_analyzers[name].compute(magnitude, out=out)
+        return self.spectrum.rescale(out, "db", out=out)
+
+    def _scaled_chart(self, scale, average):
+        key = (scale, average)
+        if key not in self._scaled:
+            self._scaled[key] = ChartData.spectrum(self.chunk, self.rate, y_names=self.labels)
+        return self._scaled[key]
+
+    def dropout_totals(self):
+        """Every DROPOUTS counter, from the last health check and the ring-buffer readers"""
+        readers = [self.spectrogram, self.averager, self.vad, *list(self._band_banks.values())]
+        readers += [d for decimators in list(self._decimators.values()) for d in decimators]
+        return {
+            "overflows": self.health.get("overflows") or 0,
+            "gaps": self.health.get("gaps") or 0,
+            "lost_samples": self.health.get("lost_samples") or 0,
+            "overruns": self._retired_overruns + sum(reader.overruns for reader in readers),
+            "skipped_ticks": self.push.skipped_ticks if self.push is not None else 0,
+        }
+
+    def _check(self, now):
+        """Once a second: capture health, dropout rates and the latency summary"""
+        try:
+            self.health = self.capture.health()
+        except RuntimeError as e:
+            self.health = {"error": str(e)}
+        self.dropouts.update(self.dropout_totals(), now)
+        if self.controller is not None:
+            self.controller.update(self.dropouts, now)
+        if self.sender is not None:
+            self._disconnected(self.sender.disconnected(set(self.views) | set(self.listeners), now))
+        return {"latency_table": self.latency.table(), "dropout_status": self.dropouts.text(self.rate)}
+
+    def _status(self):
+        status = {
+            "last_audio_level": self.audio_level,
+            "last_count": self.last_count,
+            "updates_count": self.updates_count,
+            "viewers": len(self.listeners),
+            "voice_active": self.vad.active,
+            "noise_floor_db": self.vad.floor_db if self.vad.floor_db is not None else -120.0,
+        }
+        now = time.monotonic()
+        if now - self._last_check >= self.check_interval:
+            self._last_check = now
+            status.update(self._check(now))
+        for hook in self.status_hooks:
+            status.update(hook())
+        return status
+
+    def render(self):
+        """Compute every product some listener needs, once - runs on the push analysis thread"""
+        started = time.monotonic()
+        captured = self.capture.newest_sample_time()
+        # Deinterleave and scale every channel in one pass, straight into the chart buffer
+        latest = self.wave_chart.back()
+        count = self.capture.read_frames(self.chunk, latest)
+        if count == self.last_count:
+            return None
+        self.last_count = count
+        converted = time.monotonic()
+        if captured is not None:
+            self.latency.record("capture", started - captured)
+        self.latency.record("convert", converted - started)
+        self.audio_level = max(float(latest.max()), -float(latest.min()))
+
+        # Silence: no FFT, no decimation, no chart payloads - just an occasional status update
+        active = self.vad.update()
+        if self.gate and not active:
+            self.spectrogram.skip()
+            self.averager.skip()
+            for bank in list(self._band_banks.values()):
+                bank.skip()
+            now = time.monotonic()
+            if not self._was_active and now - self._last_idle < self.idle_interval:
+                return None
+            self._was_active = False
+            self._last_idle = now
+            return {"waves": {}, "spectra": {}, "status": self._status()}
+        self._was_active = True
+
+        # The publish thread may drop a departed session's view at any moment - look each up once
+        views = [view for view in map(self.views.get, list(self.listeners)) if view is not None]
+        # One batched FFT for all channels
+        magnitude = self.spectrum.compute(latest, out=self.spec_chart.back())
+        transformed = time.monotonic()
+        self.latency.record("fft", transformed - converted)
+
+        waves = {}
+        for history, mode in {(v["history"], v["decimation"]) for v in views if v["source"] == "live"}:
+            if not history:
+                waves[(history, mode)] = None
+                continue
+            waves[(history, mode)] = self._decimated(self._waveform(history, mode))
+        chunk_wave = self.wave_chart.publish()
+        for key, payload in waves.items():
+            if payload is None:
+                waves[key] = chunk_wave
+        # Drop decimators nobody looks at any more
+        for key in list(self._decimators):
+            if key not in waves:
+                self._retired_overruns += sum(d.overruns for d in self._decimators.pop(key))
+
+        # Averages take in every chunk since the last tick, in one batched FFT
+        wanted = {(v["scale"], v["average"]) for v in views}
+        if any(average != "off" for _, average in wanted):
+            self.averager.update()
+        else:
+            self.averager.skip()
+        spectra = {}
+        for scale, average in wanted:
+            if (scale, average) == ("magnitude", "off"):
+                continue
+            chart = self._scaled_chart(scale, average)
+            source = magnitude if average == "off" else self.averager.result(average, out=chart.back())
+            self.spectrum.rescale(source, scale, out=chart.back())
+            spectra[(scale, average)] = chart.publish()
+        spectra[("magnitude", "off")] = self.spec_chart.publish()
+
+        # One matrix product per band setting on the FFT above, or the filter banks' levels
+        bands = {}
+        for name in {v["bands"] for v in views} - {"off"}:
+            self._band_levels(name, magnitude)
+            bands[name] = self._band_charts[name].publish()
+        # Drop filter banks nobody looks at any more
+        for name in list(self._band_banks):
+            if name not in bands or not self.band_filters:
+                self._retired_overruns += self._band_banks.pop(name).overruns
+
+        self.updates_count += 1
+        frame = {"waves": waves, "spectra": spectra, "bands": bands, "status": self._status(),
+                 "captured": captured}
+        if self.stamp_frames and captured is not None:
+            frame["status"]["frame_time"] = captured
+
+        # Every new chunk goes into the spectrogram, the heatmap is sent less often
+        self.spectrogram.update()
+        now = time.monotonic()
+        if now - self._last_spectrogram >= 1.0 / self.spectrogram_fps:
+            self._last_spectrogram = now
+            payload = self.spectrogram.publish()
+            # The same payload comes back while no frame was added - sending it again would only cost serialising
+            if payload is not self._spectrogram_sent:
+                self._spectrogram_sent = frame["spectrogram"] = payload
+                history, db_range = self.spectrogram.history, self.spectrogram.db_range
+                frame["features"] = {kind: self.features.publish(kind, history, db_range)
+                                     for kind in {v["features"] for v in views} - {"off"}}
+
+        # Offloaded analyzers: start the due ones, collect whatever finished since the last tick
+        if self.offload is not None:
+            self.offload.submit()
+            if self.offload.result("hires", self.hires_chart.back()):
+                frame["hires"] = self.hires_chart.publish()
+        self.latency.record("payload", time.monotonic() - transformed)
+        return frame
+
+    def deliver(self, frame):
+        """Hand one frame to every listening session, as fast as each one drains"""
+        self._disconnected(self.sender.post(list(self.listeners), frame, self.push.fps))
+
+    def _apply(self, state, frame, session=None):
+        view = self.views.get(get_state_id(state), DEFAULT_VIEW)
+        step = session.step if session is not None else 1
+        # Sessions browsing an archive keep their own waveform until they go back to live
+        wave = frame["waves"].get((view["history"], view["decimation"])) if view["source"] == "live" else None
+        spec = frame["spectra"].get((view["scale"], view["average"]))
+        bands = frame.get("bands", {}).get(view["bands"])
+        if view["channels"] is not None and self.labels is not None:
+            wave = _select(wave, view["channels"])
+            spec = _select(spec, view["channels"])
+            bands = _select(bands, view["channels"])
+        wave, spec = thin(wave, step), thin(spec, step)
+        started = time.monotonic()
+        with state:
+            if wave is not None:
+                state.wave_df = wave
+            if spec is not None:
+                state.spec_df = spec
+            if bands is not None:
+                state.bands_df = bands
+            if "spectrogram" in frame:
+                state.spectrogram_data = frame["spectrogram"]
+            if frame.get("features", {}).get(view["features"]) is not None:
+                state.features_data = frame["features"][view["features"]]
+            if "hires" in frame:
+                state.hires_df = thin(frame["hires"], step)
+            for name, value in frame["status"].items():
+                state.assign(name, value)
+            if session is not None and session.text() != session.reported:
+                session.reported = session.text()
+                state.delivery_status = session.reported
+        # Taipy sends the assigned values when the block ends
+        now = time.monotonic()
+        self.latency.record("assign", now - started)
+        if frame.get("captured") is not None:
+            self.latency.record("total", now - frame["captured"])
+
+
+def _select(payload, names):
+    """Chart payload with only the x-axis and the named channel columns - no data is copied"""
+    if payload is None:
+        return None
+    return {key: values for key, values in payload.items() if key == "x" or key in names}
@@ -0,0 +1,27 @@
+"""
+Record the input to WAV or FLAC files from the command line.
+"""
+
+import time
+
+from .audio_capture import AudioCapture
+from .recorder import StreamRecorder
+
+
+def main(path, source=None, seconds=None, format="wav", max_seconds=None, max_bytes=None, capture=None):
+    """Record to path for `seconds` (None records until Ctrl+C), rotating files as configured"""
+    capture = capture or AudioCapture(source=source, seconds=10.0)
+    recorder = StreamRecorder(capture.buffer, capture.rate, path, format=format,
+                              max_seconds=max_seconds, max_bytes=max_bytes)
+    print("⏺️  Recording - press Ctrl+C to stop")
+    capture.start()
+    recorder.start()
+    deadline = None if seconds is None else time.monotonic() + seconds
+    try:
+        while capture.running and (deadline is None or time.monotonic() < deadline):
+            time.sleep(0.1 if deadline is None else max(0.0, min(0.1, deadline - time.monotonic())))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        capture.stop()
+        recorder.stop()
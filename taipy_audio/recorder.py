@@ -0,0 +1,222 @@
+"""
+Streaming recorder: capture ring buffer -> WAV/FLAC files on a writer thread.
+
+The "pcm" format writes a session archive instead (see archive.py): raw
+samples plus a zoom pyramid that is built when each file is finalized.
+Archives are mono; WAV and FLAC files get every channel of a multi-channel
+buffer, interleaved.
+
+The capture callback is not involved at all. The writer thread follows the
+ring buffer's sample counter, wakes a few times per second and writes
+everything that arrived since in one large buffered write, so disk I/O never
+runs on the capture thread and the interpreter is only busy a few times a
+second.
+
+Memory is bounded by the ring buffer itself: there is no queue that could
+grow. If the disk stalls for longer than the ring holds, the oldest unwritten
+samples are overwritten; the recorder counts that as an overrun, reports it
+and carries on from the oldest intact sample instead of buffering more.
+"""
+
+import threading
+import time
+import wave
+from pathlib import Path
+
+import numpy as np
+
+FORMATS = ("wav", "flac", "pcm")
+
+
+class _WavWriter:
+    def __init__(self, path, rate, buffering, channels=1):
+        self._file = open(path, "wb", buffering=buffering)
+        self._wav = wave.open(self._file, "wb")
+        self._wav.setnchannels(channels)
+        self._wav.setsampwidth(2)
+        self._wav.setframerate(rate)
+
+    def write(self, samples):
+        self._wav.writeframesraw(samples.tobytes())
+
+    def close(self):
+        # wave patches the RIFF and data sizes into the header on close
+        self._wav.close()
+        self._file.close()
+
+
+class _FlacWriter:
+    def __init__(self, path, rate, buffering, channels=1):
+        import soundfile
+        self._file = soundfile.SoundFile(path, "w", samplerate=rate, channels=channels,
+                                         format="FLAC", subtype="PCM_16")
+
+    def write(self, samples):
+        self._file.write(samples)
+
+    def close(self):
+        self._file.close()
+
+
+class StreamRecorder:
+    """Writes a RingBuffer to disk from its own thread, with file rotation
+
+    Files are named ``<stem>-001.wav``, ``<stem>-002.wav``, ... in the
+    directory of ``path``. A new file is started when the current one reaches
+    ``max_seconds`` of audio or ``max_bytes`` on disk (either may be None).
+    ``interval`` is how often the writer wakes up; each wake-up writes all new
+    samples at once. ``stop()`` writes what is left and finalizes the file.
+    """
+
+    def __init__(self, buffer, rate, path, format="wav", max_seconds=None, max_bytes=None,
+                 interval=0.25, buffering=1 << 20):
+        if format not in FORMATS:
+            raise ValueError(f"Unknown format {format!r}, expected one of {FORMATS}")
+        if format == "flac":
+            try:
+                import soundfile  # noqa: F401 - checked here so the writer thread cannot fail on it
+            except ImportError:
+                raise RuntimeError("FLAC recording needs the soundfile package (pip install soundfile)") from None
+        if format == "pcm" and buffer.channels > 1:
+            raise ValueError("Session archives are mono - record one channel with buffer.channel(i)")
+        if interval * rate * 2 >= buffer.capacity:
+            raise ValueError("The ring buffer must hold more than two writer intervals of audio")
+        self.buffer = buffer
+        self.rate = rate
+        self.path = Path(path)
+        self.format = format
+        self.max_seconds = max_seconds
+        self.max_bytes = max_bytes
+        self.interval = interval
+        self.buffering = buffering
+        self.files = []
+        self.samples_written = 0
+        self.overruns = 0
+        self.dropped_samples = 0
+        shape = (buffer.capacity,) if buffer.channels == 1 else (buffer.capacity, buffer.channels)
+        self._block = np.empty(shape, dtype=buffer.dtype)
+        self._writer = None
+        self._file_samples = 0
+        self._position = 0
+        self._thread = None
+        self._stop = threading.Event()
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def backlog(self):
+        """Samples captured but not yet written"""
+        return self.buffer.count - self._position if self.running else 0
+
+    def status(self):
+        return {
+            "file": str(self.files[-1]) if self.files else "",
+            "files": len(self.files),
+            "seconds": self.samples_written / self.rate,
+            "backlog_seconds": self.backlog / self.rate,
+            "overruns": self.overruns,
+            "dropped_seconds": self.dropped_samples / self.rate,
+        }
+
+    def start(self):
+        """Record from the newest sample on"""
+        if self.running:
+            return
+        self._position = self.buffer.count
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="recorder", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Write the remaining samples and finalize the current file"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _open_next(self):
+        if self._writer is not None:
+            self._writer.close()
+        name = f"{self.path.stem}-{len(self.files) + 1:03d}.{self.format}"
+        path = self.path.with_name(name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if self.format == "pcm":
+            # Imported here: the archive's zoom pyramid pulls in the chart modules
+            from .archive import ArchiveWriter
+
+            self._writer = ArchiveWriter(path, self.rate, self.buffering)
+        else:
+            opener = {"wav": _WavWriter, "flac": _FlacWriter}[self.format]
+            self._writer = opener(path, self.rate, self.buffering, self.buffer.channels)
+        self._file_samples = 0
+        self.files.append(path)
+        print(f"💾 Recording to {path}")
+
+    def _room(self):
+        """Samples the current file can still take before it has to rotate"""
+        room = None
+        if self.max_seconds is not None:
+            room = int(self.max_seconds * self.rate) - self._file_samples
+        if self.max_bytes is not None:
+            # 2 bytes per sample (16-bit PCM); FLAC files end up smaller than this
+            by_size = self.max_bytes // (2 * self.buffer.channels) - self._file_samples
+            room = by_size if room is None else min(room, by_size)
+        return room
+
+    def _drain(self):
+        """Write everything up to the current sample count"""
+        end = self.buffer.count
+        if end - self._position > self.buffer.capacity:
+            lost = end - self.buffer.capacity - self._position
+            self._report_overrun(lost)
+            self._position += lost
+        n = end - self._position
+        if n <= 0:
+            return
+        view = self.buffer.read(self._position, end)
+        block = self._block[:n]
+        np.copyto(block, view)
+        if not self.buffer.is_intact(end, n):
+            # The oldest samples were overwritten while we copied - drop them
+            lost = min(n, self.buffer.count - self.buffer.capacity - self._position)
+            self._report_overrun(lost)
+            block = block[lost:]
+            self._position += lost
+        while len(block):
+            room = self._room()
+            if room is not None and room <= 0:
+                self._open_next()
+                continue
+            part = block if room is None else block[:room]
+            self._writer.write(part)
+            self._file_samples += len(part)
+            self.samples_written += len(part)
+            block = block[len(part):]
+        self._position = end
+
+    def _report_overrun(self, lost):
+        self.overruns += 1
+        self.dropped_samples += lost
+        print(f"⚠️  Disk could not keep up - dropped {lost / self.rate:.2f}s of audio "
+              f"({self.overruns} overrun(s) so far)")
+
+    def _run(self):
+        try:
+            self._open_next()
+            while not self._stop.wait(self.interval):
+                waiting = self.backlog
+                started = time.monotonic()
+                self._drain()
+                took = time.monotonic() - started
+                if took > self.interval:
+                    print(f"🐢 Slow disk: writing {waiting / self.rate:.2f}s of audio took {took:.2f}s")
+            self._drain()
+        except Exception as e:
+            print(f"❌ Recorder error: {e}")
+        finally:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+            print(f"✅ Saved {self.samples_written / self.rate:.1f}s in {len(self.files)} file(s)")
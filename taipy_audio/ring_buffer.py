@@ -0,0 +1,229 @@
+"""
+Lock-free sample ring buffer shared between the capture callback and the GUI.
+
+One writer (the PyAudio callback) appends samples, any number of readers look at
+the most recent ones. Nothing is queued, copied or locked on either side.
+
+Multi-channel input is stored interleaved, exactly as the sound card delivers
+it: one row of ``channels`` samples per frame. ``channel(i)`` deinterleaves
+without copying - it returns a ChannelView whose reads are strided NumPy views
+into the same memory, so every mono consumer (decimators, VAD, spectrogram,
+recorder) works on one channel unchanged.
+
+SharedRingBuffer keeps the same layout in shared memory, so worker processes
+read the samples the capture thread writes without any pickling.
+"""
+
+import atexit
+
+import numpy as np
+
+# Capture timestamps kept per buffer - only the newest is read, the rest give the reader slack
+STAMPS = 16
+
+
+class RingBuffer:
+    """Fixed-size int16 ring buffer with a monotonically increasing sample counter.
+
+    With ``channels > 1`` every slot is a frame of interleaved samples, views
+    are ``(frames, channels)`` arrays and all counts are in frames.
+
+    Every sample is stored twice, at ``i`` and ``i + capacity``, so any run of up
+    to ``capacity`` consecutive samples is one contiguous slice of the backing
+    array and readers always get a view instead of a copy.
+
+    ``count`` is the total number of samples ever written. It is only advanced
+    after the samples are in place, so a reader that sees a count can read
+    everything up to it. A view stays valid until the writer has moved another
+    ``capacity - len(view)`` samples past it; call ``is_intact()`` after using a
+    view if that can happen.
+
+    Writes may carry a capture timestamp (``time.monotonic()`` seconds of the
+    chunk's first sample); ``stamp()`` returns the newest one with its sample
+    number, so readers can tell how old any sample is.
+    """
+
+    def __init__(self, capacity, dtype=np.int16, channels=1):
+        self.capacity = int(capacity)
+        self.dtype = np.dtype(dtype)
+        self.channels = int(channels)
+        shape = (2 * self.capacity,) if self.channels == 1 else (2 * self.capacity, self.channels)
+        self._data = np.zeros(shape, dtype=self.dtype)
+        self._stamps = np.zeros((STAMPS, 2))
+        self._count = 0
+        self._writes = 0
+
+    @property
+    def count(self):
+        """Total number of samples written since creation (never wraps)"""
+        return self._count
+
+    def _put(self, pos, samples):
+        """Copy samples into the backing array starting at pos, wrapping at 2 * capacity"""
+        size = len(self._data)
+        first = min(len(samples), size - pos)
+        self._data[pos:pos + first] = samples[:first]
+        if first < len(samples):
+            self._data[:len(samples) - first] = samples[first:]
+
+    def write(self, samples, timestamp=None):
+        """Append samples (writer side only) - interleaved or (frames, channels) for multi-channel"""
+        samples = np.asarray(samples)
+        if self.channels > 1:
+            samples = samples.reshape(-1, self.channels)
+        total = len(samples)
+        if total == 0:
+            return
+        if total > self.capacity:
+            samples = samples[-self.capacity:]
+        # Converted after trimming, so an oversized write costs at most one capacity
+        samples = samples.astype(self.dtype, copy=False)
+        start = (self._count + total - len(samples)) % self.capacity
+        self._put(start, samples)
+        self._put(start + self.capacity, samples)
+        if timestamp is not None:
+            # Stored before the counter moves, like the samples themselves
+            self._stamps[self._writes % STAMPS] = (self._count, timestamp)
+            self._writes += 1
+        self._count += total
+
+    def stamp(self):
+        """(sample number, capture time) of the newest timestamped write, or None"""
+        writes = self._writes
+        if not writes:
+            return None
+        first, captured = self._stamps[(writes - 1) % STAMPS]
+        return int(first), float(captured)
+
+    def latest(self, n):
+        """View of the last n samples (zero-padded at start-up) and the count it ends at"""
+        if n > self.capacity:
+            raise ValueError(f"Cannot read {n} samples from a {self.capacity}-sample ring buffer")
+        end = self._count
+        stop = end % self.capacity + self.capacity
+        return self._data[stop - n:stop], end
+
+    def read(self, start, stop):
+        """View of samples [start, stop) in absolute sample numbers
+
+        Returns None when that range has already been overwritten or not yet written.
+        """
+        if stop < start or stop > self._count or self._count - start > self.capacity:
+            return None
+        offset = start % self.capacity
+        return self._data[offset:offset + (stop - start)]
+
+    def is_intact(self, end, n):
+        """Check that a view of n samples ending at count end has not been overwritten"""
+        return self._count - end <= self.capacity - n
+
+    def channel(self, index):
+        """Mono view of one channel - the buffer itself when there is only one"""
+        if self.channels == 1 and index == 0:
+            return self
+        if not 0 <= index < self.channels:
+            raise IndexError(f"Channel {index} out of range for a {self.channels}-channel buffer")
+        return ChannelView(self, index)
+
+    def clear(self):
+        """Zero the stored samples without resetting the sample counter"""
+        self._data[:] = 0
+
+
+class SharedRingBuffer(RingBuffer):
+    """RingBuffer in a ``multiprocessing.shared_memory`` block, readable from other processes
+
+    The block holds the int64 sample counter and capture timestamps followed
+    by the mirrored sample array, so another process that attaches by ``name`` sees the same samples
+    and the same counter without anything being pickled or sent. Exactly one
+    process writes; the counter is only advanced after the samples are in
+    place, as in RingBuffer.
+
+    The creating process unlinks the block when it exits. The mapping itself
+    is never closed while the process runs, so a capture thread still writing
+    at shutdown cannot touch unmapped memory.
+    """
+
+    def __init__(self, capacity, dtype=np.int16, channels=1, name=None):
+        from multiprocessing import shared_memory
+
+        self.capacity = int(capacity)
+        self.dtype = np.dtype(dtype)
+        self.channels = int(channels)
+        shape = (2 * self.capacity,) if self.channels == 1 else (2 * self.capacity, self.channels)
+        self.owner = name is None
+        # Layout: sample counter, write counter, timestamps, mirrored samples
+        offset = 16 + STAMPS * 16
+        size = offset + int(np.prod(shape)) * self.dtype.itemsize
+        self.shm = shared_memory.SharedMemory(name=name, create=self.owner, size=size if self.owner else 0)
+        self._header = np.ndarray((2,), dtype=np.int64, buffer=self.shm.buf)
+        self._stamps = np.ndarray((STAMPS, 2), dtype=np.float64, buffer=self.shm.buf, offset=16)
+        self._data = np.ndarray(shape, dtype=self.dtype, buffer=self.shm.buf, offset=offset)
+        if self.owner:
+            self._header[:] = 0
+            self._data[:] = 0
+            atexit.register(self.unlink)
+
+    @classmethod
+    def attach(cls, name, capacity, dtype=np.int16, channels=1):
+        """Open a buffer created by another process (read side)"""
+        return cls(capacity, dtype, channels, name=name)
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    @property
+    def _count(self):
+        return int(self._header[0])
+
+    @_count.setter
+    def _count(self, value):
+        self._header[0] = value
+
+    @property
+    def _writes(self):
+        return int(self._header[1])
+
+    @_writes.setter
+    def _writes(self, value):
+        self._header[1] = value
+
+    def unlink(self):
+        """Remove the block's name - processes that already attached keep their mapping"""
+        try:
+            self.shm.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class ChannelView:
+    """One channel of a multi-channel RingBuffer, read like a mono RingBuffer
+
+    ``latest()`` and ``read()`` return strided views (a column of the
+    interleaved frames), so deinterleaving never copies. Read-only: the
+    writer appends whole frames to the parent buffer.
+    """
+
+    channels = 1
+
+    def __init__(self, ring, index):
+        self.ring = ring
+        self.index = index
+        self.capacity = ring.capacity
+        self.dtype = ring.dtype
+
+    @property
+    def count(self):
+        return self.ring.count
+
+    def latest(self, n):
+        block, end = self.ring.latest(n)
+        return block[:, self.index], end
+
+    def read(self, start, stop):
+        block = self.ring.read(start, stop)
+        return None if block is None else block[:, self.index]
+
+    def is_intact(self, end, n):
+        return self.ring.is_intact(end, n)
@@ -0,0 +1,167 @@
+"""
+Scrolling spectrogram (waterfall) backed by a fixed 2D circular buffer.
+
+Every completed chunk in the capture ring buffer becomes one STFT frame: the
+dB spectrum from SpectrumEngine is written into one row of a preallocated
+``(history, bins)`` array, overwriting the oldest frame. Frames are aligned to
+absolute sample numbers, so each update only transforms the chunks that
+arrived since the previous one - stacked into one 2D array and transformed
+in a single batched FFT - and memory stays fixed however long the app runs.
+
+The magnitude spectra are handed to a FeatureExtractor (see features.py)
+before they are converted to dB, so mel and MFCC features need no FFT of
+their own.
+
+``publish()`` builds the full heatmap payload. Sending only the new columns
+is not possible: Taipy re-sends a bound variable as a whole, and its heatmap
+has no way to append to the one already drawn. The payload is built at
+most once per change instead - publishing again with no new frames (and
+the same ``db_range``) returns the previous payload without rebuilding it.
+"""
+
+import numpy as np
+
+from .spectrum import SpectrumEngine
+
+
+class Spectrogram:
+    """Last `history` STFT frames of a RingBuffer, in dB
+
+    ``size`` is both the FFT size and the hop, so frames do not overlap and
+    ``history * size / rate`` seconds are shown. Values are clipped to
+    ``db_range`` when published.
+    """
+
+    def __init__(self, buffer, rate, size, history=200, db_range=(-100.0, 0.0), window="hann", features=None):
+        self.buffer = buffer
+        self.features = features
+        self.rate = rate
+        self.size = size
+        self.history = int(history)
+        self.db_range = tuple(db_range)
+        self.engine = SpectrumEngine(size, rate, window=window)
+        self.freqs = self.engine.freqs
+        self.times = (np.arange(self.history) - (self.history - 1)) * (size / rate)
+        self._frames = np.full((self.history, self.engine.bins), self.db_range[0], dtype=np.float32)
+        self._scratch = np.empty(self._frames.shape)
+        self._samples = np.empty((self.history, size))
+        self._next = None
+        self.columns = 0
+        self.overruns = 0
+        # ((columns, db_range), payload) of the last publish()
+        self._published = (None, None)
+
+    @property
+    def seconds(self):
+        return self.history * self.size / self.rate
+
+    def set_window(self, name):
+        self.engine.set_window(name)
+
+    def set_range(self, low, high):
+        self.db_range = (float(min(low, high)), float(max(low, high)))
+
+    def resized(self, history):
+        """A Spectrogram of `history` frames that carries on where this one stopped
+
+        It keeps the newest frames that fit and reads on from the same chunk,
+        so a FeatureExtractor shared with this one gets no row twice.
+        """
+        other = Spectrogram(self.buffer, self.rate, self.size, history, self.db_range, self.engine.window,
+                            features=self.features)
+        kept = min(self.columns, self.history, other.history)
+        other.columns = self.columns - kept
+        if kept:
+            other.push_many(self._latest(kept))
+        other._next = self._next
+        return other
+
+    def push(self, spectrum_db):
+        """Append one dB spectrum, overwriting the oldest frame"""
+        self._frames[self.columns % self.history] = spectrum_db
+        self.columns += 1
+
+    def push_many(self, spectra_db):
+        """Append a (frames, bins) block of dB spectra, oldest first"""
+        rows = (self.columns + np.arange(len(spectra_db))) % self.history
+        self._frames[rows] = spectra_db
+        self.columns += len(spectra_db)
+
+    def update(self):
+        """Transform the chunks completed since the last call"""
+        complete = self.buffer.count // self.size
+        # Never catch up on more frames than the ring buffer still holds
+        span = min(self.history, self.buffer.capacity // self.size)
+        if self._next is None:
+            self._next = max(0, complete - span)
+        elif complete - self._next > span:
+            self._fill(complete - span - self._next)
+            self._next = complete - span
+        if complete <= self._next:
+            return
+        block = self.buffer.read(self._next * self.size, complete * self.size)
+        if block is None:
+            # The writer lapped us - jump to the newest frames, the ones in between become silence
+            self.overruns += 1
+            newest = max(self._next + 1, self.buffer.count // self.size - span + 1)
+            self._fill(newest - self._next)
+            self._next = newest
+            return self.update()
+        samples = self._samples[:complete - self._next]
+        np.multiply(block.reshape(-1, self.size), 1 / 32768.0, out=samples)
+        magnitude = self.engine.compute(samples)
+        if self.features is not None:
+            self.features.push(magnitude)
+        self.push_many(self.engine.rescale(magnitude, "db", out=magnitude))
+        self._next = complete
+
+    def skip(self):
+        """Move past the chunks completed since the last call without transforming them
+
+        They are stored as silence (the bottom of ``db_range``), so gated
+        stretches show up as gaps and ``update()`` has nothing to catch up on.
+        """
+        complete = self.buffer.count // self.size
+        if self._next is None:
+            self._next = complete
+            return
+        skipped = complete - self._next
+        if skipped <= 0:
+            return
+        self._fill(skipped)
+        self._next = complete
+
+    def _fill(self, frames):
+        """Store `frames` frames of silence, so columns and feature rows stay one per chunk"""
+        self.columns += frames - min(frames, self.history)
+        for _ in range(min(frames, self.history)):
+            self.push(self.db_range[0])
+        if self.features is not None:
+            self.features.skip(frames)
+
+    def _latest(self, frames):
+        """Copy of the newest `frames` stored frames (at most `history`), oldest first"""
+        start = (self.columns - frames) % self.history
+        stop = start + frames
+        if stop <= self.history:
+            return self._frames[start:stop].copy()
+        return np.concatenate((self._frames[start:], self._frames[:stop - self.history]))
+
+    def publish(self):
+        """Heatmap payload - z is frequency rows by time columns, newest frame on the right
+
+        Bind it to a chart with ``type=heatmap|x=1/x|y=0/y|z=0/z``. z is rounded
+        to 0.1 dB, which keeps the JSON Taipy sends noticeably smaller.
+        """
+        key = (self.columns, self.db_range)
+        if self._published[0] == key:
+            return self._published[1]
+        k = self.columns % self.history
+        n = self.history - k
+        low, high = self.db_range
+        np.clip(self._frames[k:], low, high, out=self._scratch[:n])
+        np.clip(self._frames[:k], low, high, out=self._scratch[n:])
+        np.round(self._scratch, 1, out=self._scratch)
+        payload = [{"z": self._scratch.T.tolist(), "y": self.freqs}, {"x": self.times}]
+        self._published = (key, payload)
+        return payload
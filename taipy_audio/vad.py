@@ -0,0 +1,113 @@
+"""
+Adaptive voice-activity detection for gating the expensive parts of the pipeline.
+
+A fixed peak threshold fires on every click and never adapts to the room.
+VoiceActivityDetector instead tracks the noise floor and compares each frame's
+energy against it:
+
+- features are computed for all new frames at once: RMS energy in dBFS and
+  zero-crossing rate (broadband hiss and clicks cross zero far more often
+  than voiced speech)
+- the noise floor follows quiet frames down immediately and creeps up slowly
+  (six times slower while voice is active), so it settles on the room's
+  background level and re-adapts when it changes
+- a frame is a voice candidate when it is ``on_db`` above the floor and its
+  zero-crossing rate is at most ``zcr_max``;
+  ``attack`` consecutive candidates switch the detector on, so a single click
+  does not, and it only switches off after ``hangover`` seconds below
+  ``off_db`` above the floor, so it does not chatter between words
+
+Like the other ring-buffer consumers it follows the buffer's sample counter
+and only looks at frames completed since the previous call.
+"""
+
+import numpy as np
+
+FULL_SCALE_DB = 20 * np.log10(32768.0)
+
+
+class VoiceActivityDetector:
+    """Energy + zero-crossing VAD with a tracked noise floor and hysteresis
+
+    Call ``update()`` once per tick; it returns whether voice is active.
+    ``level_db``, ``floor_db`` and ``zcr`` describe the newest frame.
+    """
+
+    def __init__(self, buffer, rate, frame=512, on_db=9.0, off_db=4.0, hangover=0.3, attack=2,
+                 floor_rise_db=3.0, min_db=-65.0, zcr_max=0.35):
+        self.buffer = buffer
+        self.rate = rate
+        self.frame = frame
+        self.on_db = on_db
+        self.off_db = off_db
+        self.attack = attack
+        self.hangover_frames = max(1, int(hangover * rate / frame))
+        self.floor_step = floor_rise_db * frame / rate
+        self.min_db = min_db
+        self.zcr_max = zcr_max
+        self.active = False
+        self.floor_db = None
+        self.level_db = -120.0
+        self.zcr = 0.0
+        self._candidates = 0
+        self._hang = 0
+        self._next = None
+        self.overruns = 0
+
+    def features(self, frames):
+        """Energy in dBFS and zero-crossing rate of each row of int16 frames"""
+        x = frames.astype(np.float32)
+        energy = np.einsum("ij,ij->i", x, x) / frames.shape[1]
+        level_db = 10 * np.log10(energy + 1e-3) - FULL_SCALE_DB
+        signs = np.signbit(frames)
+        zcr = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1) / (frames.shape[1] - 1)
+        return level_db, zcr
+
+    def update(self):
+        """Classify the frames completed since the last call - True while voice is active"""
+        complete = self.buffer.count // self.frame
+        if self._next is None or (complete - self._next) * self.frame > self.buffer.capacity:
+            self._next = max(0, complete - 1)
+        if complete <= self._next:
+            return self.active
+        block = self.buffer.read(self._next * self.frame, complete * self.frame)
+        self._next = complete
+        if block is None:
+            self.overruns += 1
+            return self.active
+        levels, zcrs = self.features(block.reshape(-1, self.frame))
+        for level, zcr in zip(levels.tolist(), zcrs.tolist()):
+            self._step(level, zcr)
+        self.level_db = levels[-1]
+        self.zcr = zcrs[-1]
+        return self.active
+
+    def _step(self, level, zcr):
+        if self.floor_db is None or level < self.floor_db:
+            self.floor_db = level
+        else:
+            self.floor_db += self.floor_step / 6 if self.active else self.floor_step
+        above = level - self.floor_db
+        # Hiss-like frames never count; unvoiced sounds inside words are covered by the hangover
+        voiced = zcr <= self.zcr_max
+        candidate = level > self.min_db and above > self.on_db and voiced
+        self._candidates = self._candidates + 1 if candidate else 0
+
+        if not self.active:
+            if self._candidates >= self.attack:
+                self.active = True
+                self._hang = self.hangover_frames
+        elif above > self.off_db and level > self.min_db and voiced:
+            self._hang = self.hangover_frames
+        else:
+            self._hang -= 1
+            if self._hang <= 0:
+                self.active = False
+
+    def reset(self):
+        """Forget the noise floor and the current decision"""
+        self.active = False
+        self.floor_db = None
+        self._candidates = 0
+        self._hang = 0
+        self._next = None
@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from taipy_audio.archive import ArchiveWriter, SessionArchive
+
+RATE = 8000
+BASE = 256
+
+
+@pytest.fixture
+def samples():
+    rng = np.random.default_rng(0)
+    # 100.5 base blocks, so the last row summarises a partial block
+    return rng.integers(-20000, 20000, int(100.5 * BASE)).astype(np.int16)
+
+
+@pytest.fixture
+def session(tmp_path, samples):
+    writer = ArchiveWriter(tmp_path / "session.pcm", RATE)
+    for chunk in np.array_split(samples, 7):
+        writer.write(chunk)
+    writer.close()
+    return SessionArchive(tmp_path / "session.pcm")
+
+
+def test_level_zero_summarises_each_block(session, samples):
+    assert session.length == len(samples)
+    rows = session.level(0)
+    assert len(rows) == 101
+    for index in (0, 57, 100):
+        block = samples[index * BASE:(index + 1) * BASE].astype(np.float64)
+        np.testing.assert_allclose(rows[index], [block.min(), block.max(), np.sqrt(np.mean(block ** 2))],
+                                   rtol=1e-5)
+
+
+def test_each_level_merges_pairs_of_rows(session, samples):
+    assert session.sizes == [101, 51, 26, 13, 7, 4, 2, 1]
+    for k in range(1, len(session.sizes)):
+        below, rows = session.level(k - 1), session.level(k)
+        np.testing.assert_array_equal(rows[:-1, 0], np.minimum(below[0:-1:2, 0], below[1::2, 0])[:len(rows) - 1])
+        np.testing.assert_array_equal(rows[:-1, 1], np.maximum(below[0:-1:2, 1], below[1::2, 1])[:len(rows) - 1])
+    top = session.level(len(session.sizes) - 1)[0]
+    assert (top[0], top[1]) == (samples.min(), samples.max())
+
+
+def test_zoom_reads_a_level_that_fits_the_point_budget(session, samples):
+    full = session.zoom(points=40)
+    assert len(full["y"]) <= 40 + 2
+    assert full["y"].min() == samples.min() / 32768.0
+    assert full["y"].max() == samples.max() / 32768.0
+    assert session.pick_level(0, len(samples), 40) == 3
+
+
+def test_short_zoom_returns_the_raw_samples(session, samples):
+    start, stop = 1000, 1100
+    payload = session.zoom(start / RATE, stop / RATE, points=2000)
+    np.testing.assert_array_equal(payload["y"], samples[start:stop] / 32768.0)
+    np.testing.assert_allclose(payload["x"], np.arange(start, stop) / RATE)
@@ -0,0 +1,29 @@
+from types import SimpleNamespace
+
+import numpy as np
+
+from taipy_audio.backpressure import SessionSender
+from taipy_audio.chart_data import ChartData
+
+
+def test_held_frame_keeps_its_chart_values():
+    sent = []
+    # No websocket internals: connections and backlog read as unknown
+    gui = SimpleNamespace(invoke_callback=lambda state_id, apply, args: sent.append(args[0]))
+    sender = SessionSender(gui, apply=None, fps=30)
+    chart = ChartData(np.arange(4.0))
+
+    def frame(value):
+        chart.back()[:] = value
+        return {"spectra": {"magnitude": chart.publish()}}
+
+    sender.post(["tab"], frame(1.0))
+    sender.sessions["tab"].next_due = float("inf")
+    sender.post(["tab"], frame(2.0))
+    # Both chart buffers are written again while the frame waits in the mailbox
+    frame(3.0)
+    frame(4.0)
+    sender.sessions["tab"].next_due = 0.0
+    sender.post(["tab"], {"status": {}})
+    assert len(sent) == 2
+    assert (sent[1]["spectra"]["magnitude"]["y"] == 2.0).all()
@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+from taipy_audio.bands import BandAnalyzer, BandFilterBank, band_layout
+from taipy_audio.ring_buffer import RingBuffer
+from taipy_audio.spectrum import SpectrumEngine
+
+RATE = 16000
+
+
+def _band(labels, label):
+    return labels.index(label)
+
+
+def test_third_octave_layout_uses_nominal_frequencies():
+    centres, edges, labels = band_layout(RATE, 3)
+    assert labels[:6] == ("20", "25", "31.5", "40", "50", "63")
+    assert labels[-1] == "8k"
+    # Adjacent bands share their edges
+    np.testing.assert_allclose(edges[1:, 0], edges[:-1, 1])
+    assert centres[_band(labels, "1k")] == pytest.approx(1000.0)
+
+
+@pytest.mark.parametrize("frequency, label", [(250.0, "250"), (1000.0, "1k"), (4000.0, "4k")])
+def test_analyzer_reads_a_full_scale_sine_as_one_in_its_band(frequency, label):
+    engine = SpectrumEngine(2048, RATE)
+    analyzer = BandAnalyzer(2048, RATE)
+    levels = analyzer.compute(engine.compute(np.sin(2 * np.pi * frequency * np.arange(2048) / RATE)))
+    assert levels[_band(analyzer.labels, label)] == pytest.approx(1.0, abs=0.01)
+    assert np.delete(levels, _band(analyzer.labels, label)).max() < 0.5
+
+
+def test_analyzer_batches_channels():
+    engine = SpectrumEngine(1024, RATE)
+    analyzer = BandAnalyzer(1024, RATE)
+    x = np.random.default_rng(0).standard_normal((2, 1024))
+    levels = analyzer.compute(engine.compute(x))
+    assert levels.shape == (2, analyzer.bands)
+    np.testing.assert_allclose(levels[1], analyzer.compute(engine.compute(x[1])))
+
+
+@pytest.mark.parametrize("frequency, label", [(63.0, "63"), (250.0, "250"), (1000.0, "1k")])
+def test_filter_bank_measures_low_bands_too(frequency, label):
+    buffer = RingBuffer(2 * RATE)
+    bank = BandFilterBank([buffer], RATE)
+    x = (0.5 * 32767 * np.sin(2 * np.pi * frequency * np.arange(2 * RATE) / RATE)).astype(np.int16)
+    for chunk in np.split(x, 20):
+        buffer.write(chunk)
+        bank.update()
+    levels = bank.result()
+    index = _band(bank.labels, label)
+    assert levels[index] == pytest.approx(0.5, rel=0.01)
+    # The neighbouring bands are at least 15 dB down
+    assert max(levels[index - 1], levels[index + 1]) < 0.5 * 10 ** (-15 / 20)
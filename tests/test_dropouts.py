@@ -0,0 +1,68 @@
+from types import SimpleNamespace
+
+import pytest
+
+from taipy_audio.dropouts import DROPOUTS, BufferController, DropoutMonitor
+
+
+def _totals(**counts):
+    return {key: counts.get(key, 0) for key in DROPOUTS}
+
+
+class FakeCapture:
+    def __init__(self, chunk):
+        self.chunk = chunk
+
+    def set_chunk(self, chunk):
+        self.chunk = chunk
+
+
+@pytest.fixture
+def pipeline():
+    fps = []
+    return SimpleNamespace(capture=FakeCapture(512), fps=30, push=SimpleNamespace(set_fps=fps.append), pushed=fps)
+
+
+def _monitor_at(events_per_second):
+    monitor = DropoutMonitor()
+    monitor.rates["overflows"] = events_per_second
+    return monitor
+
+
+def test_monitor_reports_rates_and_survives_a_restarted_source():
+    monitor = DropoutMonitor()
+    monitor.update(_totals(overflows=2, lost_samples=100), now=10.0)
+    monitor.update(_totals(overflows=6, gaps=1, lost_samples=4100), now=12.0)
+    assert monitor.rates["overflows"] == 2.0
+    assert monitor.rates["lost_samples"] == 2000.0
+    # lost_samples is the length of the gaps, not an event of its own
+    assert monitor.events_per_second == 2.5
+    monitor.update(_totals(), now=13.0)
+    assert min(monitor.rates.values()) == 0.0
+    assert monitor.text(44100) == "none"
+
+
+def test_controller_steps_up_after_patience_and_caps_the_level(pipeline):
+    controller = BufferController(pipeline, max_level=2, patience=2)
+    busy = _monitor_at(5.0)
+    assert not controller.update(busy, now=0.0)
+    assert controller.update(busy, now=1.0)
+    assert (controller.level, pipeline.capture.chunk, pipeline.pushed[-1]) == (1, 1024, 15)
+    for now in range(2, 10):
+        controller.update(busy, now=float(now))
+    assert (controller.level, pipeline.capture.chunk, pipeline.pushed[-1]) == (2, 2048, 7)
+
+
+def test_controller_steps_down_after_a_calm_stretch(pipeline):
+    controller = BufferController(pipeline, calm_seconds=30.0, min_fps=10)
+    controller.set_level(2)
+    assert pipeline.pushed[-1] == 10
+    calm = _monitor_at(0.0)
+    assert not controller.update(calm, now=0.0)
+    assert not controller.update(calm, now=29.0)
+    # A single dropout restarts the calm stretch
+    assert not controller.update(_monitor_at(0.1), now=29.5)
+    assert not controller.update(calm, now=30.0)
+    assert not controller.update(calm, now=59.0)
+    assert controller.update(calm, now=60.0)
+    assert (controller.level, pipeline.capture.chunk, pipeline.pushed[-1]) == (1, 1024, 15)
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+from scipy.signal import sosfreqz
+
+from taipy_audio.filters import FilterChain, design, gain, highpass, weighting
+
+RATE = 48000
+
+
+@pytest.mark.parametrize("curve, frequency, expected_db", [
+    ("A", 31.5, -39.4), ("A", 100, -19.1), ("A", 1000, 0.0), ("A", 4000, 1.0),
+    ("C", 31.5, -3.0), ("C", 100, -0.3), ("C", 1000, 0.0), ("C", 4000, -0.8),
+])
+def test_weighting_matches_the_standard_curve(curve, frequency, expected_db):
+    # IEC 61672-1 table values are rounded to 0.1 dB
+    _, response = sosfreqz(design(RATE, weighting(curve)), worN=[frequency], fs=RATE)
+    assert 20 * np.log10(abs(response[0])) == pytest.approx(expected_db, abs=0.2)
+
+
+def test_chunks_filter_like_one_block():
+    x = np.random.default_rng(0).standard_normal((4096, 2))
+    whole = FilterChain(RATE, channels=2)
+    chunked = FilterChain(RATE, channels=2)
+    for chain in (whole, chunked):
+        chain.set("highpass", highpass())
+        chain.set("weighting", weighting("A"))
+    expected = whole.process(x)
+    result = np.concatenate([chunked.process(block) for block in np.split(x, 16)])
+    np.testing.assert_allclose(result, expected, atol=1e-9)
+
+
+def test_enabling_a_filter_keeps_the_others_state():
+    x = np.random.default_rng(1).standard_normal(4096)
+    reference = FilterChain(RATE)
+    reference.set("highpass", highpass())
+    toggled = FilterChain(RATE)
+    toggled.set("highpass", highpass())
+    first = toggled.process(x[:2048])
+    # A unity gain starts from rest without changing the signal, so the high-pass must carry on
+    toggled.set("gain", gain(0.0))
+    second = toggled.process(x[2048:])
+    expected = reference.process(x)
+    np.testing.assert_allclose(first, expected[:2048], atol=1e-9)
+    np.testing.assert_allclose(second, expected[2048:], atol=1e-9)
+
+
+def test_reset_starts_from_rest():
+    x = np.random.default_rng(2).standard_normal(1024)
+    chain = FilterChain(RATE)
+    chain.set("highpass", highpass())
+    first = chain.process(x)
+    chain.reset()
+    np.testing.assert_allclose(chain.process(x), first)
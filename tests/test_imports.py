@@ -0,0 +1,10 @@
+import subprocess
+import sys
+
+import pytest
+
+
+@pytest.mark.parametrize("module", ["taipy_audio.record", "taipy_audio.meter", "taipy_audio.archive"])
+def test_console_modes_do_not_load_scipy(module):
+    code = f"import sys, {module}; sys.exit('scipy' in sys.modules)"
+    assert subprocess.run([sys.executable, "-c", code]).returncode == 0
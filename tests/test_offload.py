@@ -0,0 +1,72 @@
+import multiprocessing
+
+import numpy as np
+import pytest
+
+from taipy_audio.offload import ResultSlot
+
+
+@pytest.fixture
+def slot():
+    slot = ResultSlot(64)
+    yield slot
+    slot.shm.close()
+    slot.unlink()
+
+
+def test_reader_attached_by_name_sees_each_result(slot):
+    reader = ResultSlot(64, name=slot.name)
+    out = np.empty(64)
+    assert reader.read(out) == 0
+    slot.write(np.arange(64.0))
+    assert reader.read(out) == 2
+    np.testing.assert_array_equal(out, np.arange(64.0))
+    reader.shm.close()
+
+
+def test_read_during_a_write_is_rejected(slot):
+    out = np.empty(64)
+    # The writer has bumped the counter to odd and not finished yet
+    slot._seq[0] = 1
+    assert slot.read(out) is None
+
+
+class _Interrupted:
+    """An output buffer whose copy is overtaken by a new result"""
+
+    def __init__(self, slot):
+        self.slot = slot
+
+    def __setitem__(self, key, values):
+        self.slot.write(np.ones(self.slot.size))
+
+
+def test_result_overwritten_while_copying_is_rejected(slot):
+    slot.write(np.zeros(64))
+    assert slot.read(_Interrupted(slot)) is None
+    out = np.empty(64)
+    assert slot.read(out) == 4
+    assert (out == 1.0).all()
+
+
+def _write_constant_rows(name, rounds):
+    slot = ResultSlot(4096, name=name)
+    for k in range(rounds):
+        slot.write(np.full(4096, float(k)))
+    slot.shm.close()
+
+
+@pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="needs fork")
+def test_accepted_reads_are_never_torn_across_processes():
+    slot = ResultSlot(4096)
+    writer = multiprocessing.get_context("fork").Process(target=_write_constant_rows, args=(slot.name, 20000))
+    writer.start()
+    out = np.empty(4096)
+    while writer.is_alive():
+        if slot.read(out) is not None:
+            assert (out == out[0]).all()
+    writer.join()
+    assert writer.exitcode == 0
+    assert slot.read(out) == 2 * 20000 and (out == 19999.0).all()
+    slot.shm.close()
+    slot.unlink()
@@ -0,0 +1,99 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+
+import taipy_audio.pipeline as pipeline_module
+from taipy_audio.audio_capture import AudioCapture
+from taipy_audio.audio_sources import SyntheticSource
+from taipy_audio.pipeline import SharedPipeline
+
+
+class FakeGui:
+    """The parts of Gui the push path uses, with websockets that can be closed"""
+
+    def __init__(self):
+        self._Gui__client_id_2_sid = {}
+        self.sockets = {}
+        manager = SimpleNamespace(eio_sid_from_sid=lambda sid, namespace: f"eio-{sid}")
+        server = SimpleNamespace(eio=SimpleNamespace(sockets=self.sockets), manager=manager)
+        self._server = SimpleNamespace(_ws=SimpleNamespace(server=server))
+        self.sent = []
+
+    def connect(self, state_id, sid):
+        self._Gui__client_id_2_sid.setdefault(state_id, set()).add(sid)
+        self.sockets[f"eio-{sid}"] = SimpleNamespace(queue=SimpleNamespace(qsize=lambda: 0))
+
+    def disconnect(self, sid):
+        # Taipy keeps the sid in its map - only the engineio socket goes away
+        del self.sockets[f"eio-{sid}"]
+
+    def invoke_callback(self, state_id, callback, args):
+        self.sent.append(state_id)
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+@pytest.fixture
+def pipeline(monkeypatch):
+    monkeypatch.setattr(pipeline_module, "get_state_id", lambda state: state.id)
+    capture = AudioCapture(source=SyntheticSource(), seconds=2.0)
+    pipeline = SharedPipeline(capture, capture.chunk, capture.rate, fps=30)
+    pipeline.gate = False
+    pipeline.check_interval = 0.1
+    yield pipeline
+    if pipeline.push is not None:
+        pipeline.push.stop()
+    capture.stop()
+
+
+def test_disconnected_viewer_leaves_and_capture_stops(pipeline):
+    gui = FakeGui()
+    pipeline.attach(gui)
+    pipeline.sender.grace = 0.2
+    gui.connect("a", "sid-a")
+    gui.connect("b", "sid-b")
+    pipeline.join(SimpleNamespace(id="a"))
+    # A session that only changed a setting and never clicked Start
+    pipeline.set_view(SimpleNamespace(id="b"), scale="db")
+    assert _wait_for(lambda: "a" in gui.sent)
+
+    gui.disconnect("sid-a")
+    gui.disconnect("sid-b")
+    assert _wait_for(lambda: not pipeline.running)
+    assert pipeline.listeners == set()
+    assert "a" not in pipeline.views
+    assert pipeline.sender.sessions == {}
+    sent = len(gui.sent)
+    time.sleep(0.3)
+    assert len(gui.sent) == sent
+
+    # With capture stopped, the next session to show up clears what is left
+    gui.connect("c", "sid-c")
+    pipeline.view(SimpleNamespace(id="c"))
+    assert set(pipeline.views) == {"c"}
+
+
+def test_viewer_that_reconnects_in_time_stays(pipeline):
+    gui = FakeGui()
+    pipeline.attach(gui)
+    pipeline.sender.grace = 1.0
+    gui.connect("a", "sid-a")
+    pipeline.join(SimpleNamespace(id="a"))
+    assert _wait_for(lambda: "a" in gui.sent)
+
+    gui.disconnect("sid-a")
+    time.sleep(0.3)
+    gui.connect("a", "sid-a2")
+    sent = len(gui.sent)
+    assert _wait_for(lambda: len(gui.sent) > sent)
+    time.sleep(1.0)
+    assert pipeline.listeners == {"a"}
+    assert pipeline.running
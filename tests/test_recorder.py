@@ -0,0 +1,41 @@
+import time
+import wave
+
+import numpy as np
+
+from taipy_audio.recorder import StreamRecorder
+from taipy_audio.ring_buffer import RingBuffer
+
+RATE = 8000
+
+
+def _record(tmp_path, samples, **rotation):
+    buffer = RingBuffer(RATE)
+    recorder = StreamRecorder(buffer, RATE, tmp_path / "take.wav", interval=0.02, **rotation)
+    recorder.start()
+    for chunk in np.array_split(samples, 24):
+        buffer.write(chunk)
+        time.sleep(0.005)
+    recorder.stop()
+    return recorder
+
+
+def _frames(path):
+    with wave.open(str(path), "rb") as wav:
+        return np.frombuffer(wav.readframes(wav.getnframes()), dtype=np.int16)
+
+
+def test_rotates_by_duration_without_losing_a_sample(tmp_path):
+    samples = (np.arange(int(1.2 * RATE)) % 20000).astype(np.int16)
+    recorder = _record(tmp_path, samples, max_seconds=0.5)
+    assert [path.name for path in recorder.files] == ["take-001.wav", "take-002.wav", "take-003.wav"]
+    assert [len(_frames(path)) for path in recorder.files] == [4000, 4000, 1600]
+    np.testing.assert_array_equal(np.concatenate([_frames(path) for path in recorder.files]), samples)
+    assert recorder.overruns == 0 and recorder.samples_written == len(samples)
+
+
+def test_rotates_by_size(tmp_path):
+    samples = np.zeros(RATE, dtype=np.int16)
+    recorder = _record(tmp_path, samples, max_bytes=6000)
+    # 16-bit samples: 3000 per file
+    assert [len(_frames(path)) for path in recorder.files] == [3000, 3000, 2000]
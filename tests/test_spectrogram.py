@@ -0,0 +1,79 @@
+import numpy as np
+
+from taipy_audio.features import FeatureExtractor
+from taipy_audio.ring_buffer import RingBuffer
+from taipy_audio.spectrogram import Spectrogram
+
+SIZE = 256
+
+
+def _chunks(n):
+    return (np.random.default_rng(0).standard_normal(n * SIZE) * 1000).astype(np.int16)
+
+
+def test_features_stay_one_row_per_chunk_after_a_stall():
+    buffer = RingBuffer(8 * SIZE)
+    features = FeatureExtractor(SIZE, 8000, n_mels=20, history=64)
+    spectrogram = Spectrogram(buffer, 8000, SIZE, history=32, features=features)
+    buffer.write(_chunks(3))
+    spectrogram.update()
+    # Far more than the ring buffer holds arrives before the next update
+    buffer.write(_chunks(50))
+    spectrogram.update()
+    assert spectrogram.columns == features.frames == buffer.count // SIZE
+
+
+def test_gated_chunks_become_silence_rows():
+    buffer = RingBuffer(8 * SIZE)
+    features = FeatureExtractor(SIZE, 8000, n_mels=20, history=64)
+    spectrogram = Spectrogram(buffer, 8000, SIZE, history=32, features=features)
+    buffer.write(_chunks(2))
+    spectrogram.update()
+    buffer.write(_chunks(500))
+    spectrogram.skip()
+    assert spectrogram.columns == features.frames == buffer.count // SIZE
+    rows, _ = features.mels.latest(3)
+    assert (rows == features.floor_db).all()
+
+
+def test_resizing_keeps_frames_and_does_not_repeat_feature_rows():
+    buffer = RingBuffer(64 * SIZE)
+    features = FeatureExtractor(SIZE, 8000, n_mels=20, history=64)
+    spectrogram = Spectrogram(buffer, 8000, SIZE, history=8, features=features)
+    buffer.write(_chunks(5))
+    spectrogram.update()
+    before = spectrogram.publish()[0]["z"]
+    spectrogram = spectrogram.resized(4)
+    assert [row[-4:] for row in spectrogram.publish()[0]["z"]] == [row[-4:] for row in before]
+    buffer.write(_chunks(3))
+    spectrogram.update()
+    assert spectrogram.columns == features.frames == buffer.count // SIZE
+
+
+def test_publish_reuses_the_payload_until_a_frame_is_added():
+    buffer = RingBuffer(8 * SIZE)
+    spectrogram = Spectrogram(buffer, 8000, SIZE, history=16)
+    buffer.write(_chunks(2))
+    spectrogram.update()
+    payload = spectrogram.publish()
+    spectrogram.update()
+    assert spectrogram.publish() is payload
+    spectrogram.set_range(-80.0, 0.0)
+    assert spectrogram.publish() is not payload
+    payload = spectrogram.publish()
+    buffer.write(_chunks(1))
+    spectrogram.update()
+    assert spectrogram.publish() is not payload
+
+
+def test_each_chunk_becomes_one_column_newest_on_the_right():
+    buffer = RingBuffer(64 * SIZE)
+    spectrogram = Spectrogram(buffer, 8000, SIZE, history=4)
+    t = np.arange(SIZE) / 8000
+    # Six chunks of tones at bins 8, 16, ..., 48 - more than the history holds
+    for k in range(1, 7):
+        buffer.write((np.sin(2 * np.pi * 8 * k * 8000 / SIZE * t) * 16000).astype(np.int16))
+        spectrogram.update()
+    z = np.array(spectrogram.publish()[0]["z"])
+    assert z.shape == (spectrogram.engine.bins, 4)
+    assert list(z.argmax(axis=0)) == [24, 32, 40, 48]
@@ -0,0 +1,58 @@
+import numpy as np
+
+from taipy_audio.ring_buffer import RingBuffer
+from taipy_audio.vad import VoiceActivityDetector
+
+RATE = 16000
+FRAME = 512
+
+
+def _feed(signal):
+    """Run a detector over `signal` one frame at a time - its decision after each frame"""
+    buffer = RingBuffer(8 * FRAME)
+    vad = VoiceActivityDetector(buffer, RATE, FRAME)
+    decisions = []
+    for frame in signal.reshape(-1, FRAME):
+        buffer.write(frame)
+        decisions.append(vad.update())
+    return np.array(decisions)
+
+
+def _room(seconds, seed=0):
+    # Quiet background around -60 dBFS
+    return np.random.default_rng(seed).normal(0, 30, int(seconds * RATE) // FRAME * FRAME)
+
+
+def _tone(seconds, amplitude=8000.0, frequency=200.0):
+    t = np.arange(int(seconds * RATE) // FRAME * FRAME) / RATE
+    return amplitude * np.sin(2 * np.pi * frequency * t)
+
+
+def test_room_noise_is_not_voice():
+    assert not _feed(_room(2).astype(np.int16)).any()
+
+
+def test_a_click_is_not_voice():
+    signal = _room(2)
+    signal[RATE] = 30000
+    signal[RATE + 1] = -30000
+    assert not _feed(signal.astype(np.int16)).any()
+
+
+def test_a_voiced_burst_switches_on_and_off_again():
+    signal = _room(3)
+    burst = slice(RATE, 2 * RATE // FRAME * FRAME)
+    signal[burst] += _tone(1)[:burst.stop - burst.start]
+    decisions = _feed(signal.astype(np.int16))
+    frames = np.arange(len(decisions)) * FRAME
+    assert decisions[(frames > RATE + 0.1 * RATE) & (frames < 1.9 * RATE)].all()
+    assert not decisions[frames > 2.5 * RATE].any()
+
+
+def test_a_steady_tone_stops_counting_as_voice():
+    # About 15 dB above the room: voice at first, background once the floor has caught up
+    signal = np.concatenate([_room(1), _tone(40, amplitude=250.0) + _room(40, seed=1)])
+    decisions = _feed(signal.astype(np.int16))
+    # The noise floor rises to the tone and the detector lets go
+    assert decisions[:len(decisions) // 4].any()
+    assert not decisions[-RATE // FRAME:].any()